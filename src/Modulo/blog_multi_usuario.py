@@ -4,9 +4,11 @@ Módulo de Lógica de Negocio (Modelo) — Sistema de Blog Multi-usuario.
 """
 from __future__ import annotations  # Anotaciones diferidas para tipos
 
+import os  # Metadatos de archivos (firma para invalidar la caché)
 import re  # Expresiones regulares para validar emails
+import time  # Segundo actual para memorizar la marca de tiempo
 from datetime import datetime  # Fechas y horas para marcas de tiempo
-from typing import Any, Dict, List, Optional, Sequence  # Tipado para ayudas y claridad
+from typing import Any, Dict, List, Optional, Sequence, Tuple  # Tipado para claridad
 
 import gestor_datos  # Persistencia (CSV/JSON) desacoplada del modelo
 
@@ -22,20 +24,407 @@ PostNoEncontrado = ErrorDeDominio
 AccesoNoAutorizado = ErrorDeDominio
 
 
+# =========================
+# Caché de datos
+# =========================
+
+# Ruta -> (firma del archivo, datos cargados). Los datos cacheados son propiedad
+# del modelo: las funciones los mutan y luego los persisten con _guardar().
+# Hacia afuera solo salen copias (_copia), nunca la lista ni los registros.
+_CACHE: Dict[str, Tuple[Tuple[int, int, int], List[Dict[str, Any]]]] = {}
+
+# Índices derivados de los datos cacheados (ruta -> clave -> posición en la
+# lista). Se construyen bajo demanda y se descartan al recargar el archivo.
+_INDICE_IDS: Dict[str, Dict[str, int]] = {}
+_INDICE_EMAILS: Dict[str, Dict[str, int]] = {}
+# Índice invertido de posts: ruta -> tag en minúsculas -> posiciones.
+_INDICE_TAGS: Dict[str, Dict[str, List[int]]] = {}
+# Índice no único de posts: ruta -> id_autor -> posiciones.
+_INDICE_AUTORES_POSTS: Dict[str, Dict[Any, List[int]]] = {}
+# Último ID asignado: ruta -> clave de ID, y ruta -> id_post para comentarios.
+_MAX_ID: Dict[str, Dict[str, int]] = {}
+_MAX_ID_COMENTARIOS: Dict[str, Dict[str, int]] = {}
+# Comentarios por post: ruta -> id_post -> id_comentario -> posición.
+_INDICE_COMENTARIOS: Dict[str, Dict[str, Dict[str, int]]] = {}
+# Esquema garantizado tras cargar: campos de texto ("" por defecto) y de lista.
+_CAMPOS_POST = ("id_post", "id_autor", "titulo", "contenido", "fecha_publicacion")
+_LISTAS_POST = ("tags", "comentarios")
+
+
+def _firma(filepath: str) -> Optional[Tuple[int, int, int]]:
+    """Obtiene una firma del archivo para detectar cambios en disco.
+
+    Combina mtime (ns), tamaño e inodo: la escritura atómica reemplaza el
+    archivo, por lo que el inodo cambia aunque el mtime coincida.
+
+    Args:
+        filepath: Ruta del archivo.
+
+    Returns:
+        Optional[Tuple[int, int, int]]: Firma o None si el archivo no existe.
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _cargar(filepath: str) -> List[Dict[str, Any]]:
+    """Carga datos desde la caché o desde disco si el archivo cambió.
+
+    Args:
+        filepath: Ruta al CSV/JSON.
+
+    Returns:
+        List[Dict[str, Any]]: Datos cargados (lista cacheada, no copiar).
+    """
+    firma = _firma(filepath)
+    hit = _CACHE.get(filepath)
+    if hit is not None and firma is not None and hit[0] == firma:
+        return hit[1]
+    datos = gestor_datos.cargar_datos(filepath)
+    _normalizar_esquema(filepath, datos)
+    _invalidar_indices(filepath)
+    if firma is not None:
+        _CACHE[filepath] = (firma, datos)
+    else:
+        _CACHE.pop(filepath, None)
+    return datos
+
+
+def _copia(registro: Dict[str, Any]) -> Dict[str, Any]:
+    """Copia un registro para entregarlo fuera del modelo.
+
+    Además del dict se copian sus listas (tags, comentarios) y los dicts que
+    contienen: mutar la copia no toca la caché ni desajusta los índices.
+
+    Args:
+        registro: Registro cacheado (autor, post o comentario).
+
+    Returns:
+        Dict[str, Any]: Copia independiente del registro.
+    """
+    copia = dict(registro)
+    for campo, valor in copia.items():
+        if type(valor) is list:
+            copia[campo] = [dict(v) if type(v) is dict else v for v in valor]
+    return copia
+
+
+def _normalizar_esquema(filepath: str, datos: List[Dict[str, Any]]) -> None:
+    """Completa en sitio los campos faltantes de cada registro recién cargado.
+
+    Así los recorridos posteriores pueden acceder con corchetes sin
+    defaults: autores (CSV) con sus cabeceras y posts (JSON) con texto
+    vacío o listas vacías.
+
+    Args:
+        filepath: Ruta al CSV/JSON de origen.
+        datos: Registros cargados.
+
+    Returns:
+        None
+    """
+    if filepath.lower().endswith(".csv"):
+        campos, listas = tuple(gestor_datos.CAMPOS_AUTORES), ()
+    else:
+        campos, listas = _CAMPOS_POST, _LISTAS_POST
+    for registro in datos:
+        if not isinstance(registro, dict):
+            continue
+        for campo in campos:
+            if registro.get(campo) is None:
+                registro[campo] = ""
+        for campo in listas:
+            if registro.get(campo) is None:
+                registro[campo] = []
+
+
+def _guardar(filepath: str, datos: List[Dict[str, Any]]) -> None:
+    """Persiste los datos y mantiene la caché caliente sin volver a leer.
+
+    Args:
+        filepath: Ruta al CSV/JSON.
+        datos: Lista completa a persistir.
+
+    Returns:
+        None
+    """
+    hit = _CACHE.get(filepath)
+    if hit is None or hit[1] is not datos:
+        # Se persiste una lista nueva: los índices ya no apuntan a ella.
+        _invalidar_indices(filepath)
+    try:
+        gestor_datos.guardar_datos(filepath, datos)
+    except Exception:
+        _CACHE.pop(filepath, None)
+        _invalidar_indices(filepath)
+        raise
+    firma = _firma(filepath)
+    if firma is not None:
+        _CACHE[filepath] = (firma, datos)
+    else:
+        _CACHE.pop(filepath, None)
+
+
+def _anexar(filepath: str, datos: List[Dict[str, Any]], registro: Dict[str, Any]) \
+        -> None:
+    """Persiste un alta agregando solo el registro nuevo al archivo.
+
+    'registro' ya debe estar agregado al final de 'datos' (la lista cacheada).
+    Si la caché no corresponde al archivo actual, o hay un lote de escritura
+    abierto (gestor_datos.lote), se entrega la lista completa.
+
+    Args:
+        filepath: Ruta al CSV/JSON.
+        datos: Lista cacheada que ya contiene el registro.
+        registro: Registro recién agregado.
+
+    Returns:
+        None
+    """
+    hit = _CACHE.get(filepath)
+    if (hit is None or hit[1] is not datos or hit[0] != _firma(filepath)
+            or gestor_datos.en_lote(filepath)):
+        _guardar(filepath, datos)
+        return
+    try:
+        gestor_datos.anexar_registro(filepath, registro)
+    except Exception:
+        _CACHE.pop(filepath, None)
+        _invalidar_indices(filepath)
+        raise
+    firma = _firma(filepath)
+    if firma is not None:
+        _CACHE[filepath] = (firma, datos)
+    else:
+        _CACHE.pop(filepath, None)
+
+
+def _invalidar_indices(filepath: str) -> None:
+    """Descarta los índices derivados de un archivo.
+
+    Args:
+        filepath: Ruta al CSV/JSON.
+
+    Returns:
+        None
+    """
+    _INDICE_IDS.pop(filepath, None)
+    _INDICE_EMAILS.pop(filepath, None)
+    _INDICE_TAGS.pop(filepath, None)
+    _INDICE_AUTORES_POSTS.pop(filepath, None)
+    _MAX_ID.pop(filepath, None)
+    _MAX_ID_COMENTARIOS.pop(filepath, None)
+    _INDICE_COMENTARIOS.pop(filepath, None)
+
+
+def _indice_ids(filepath: str, datos: List[Dict[str, Any]], clave_id: str) \
+        -> Dict[str, int]:
+    """Obtiene (o construye) el índice id -> posición de un archivo.
+
+    Ante IDs repetidos conserva la primera aparición, igual que un recorrido
+    lineal.
+
+    Args:
+        filepath: Ruta al CSV/JSON.
+        datos: Lista cacheada del archivo.
+        clave_id: Clave que contiene el ID ('id_autor' o 'id_post').
+
+    Returns:
+        Dict[str, int]: Mapa id -> posición en 'datos'.
+    """
+    indice = _INDICE_IDS.get(filepath)
+    if indice is None:
+        indice = {}
+        for i, item in enumerate(datos):
+            indice.setdefault(item.get(clave_id), i)
+        _INDICE_IDS[filepath] = indice
+    return indice
+
+
+def _indice_emails(filepath: str, autores: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Obtiene (o construye) el índice email normalizado -> posición.
+
+    Args:
+        filepath: Ruta al CSV de autores.
+        autores: Lista cacheada de autores.
+
+    Returns:
+        Dict[str, int]: Mapa email en minúsculas -> posición en 'autores'.
+    """
+    indice = _INDICE_EMAILS.get(filepath)
+    if indice is None:
+        indice = {}
+        for i, a in enumerate(autores):
+            indice.setdefault(a["email"].strip().lower(), i)
+        _INDICE_EMAILS[filepath] = indice
+    return indice
+
+
+def _tags_indexables(post: Dict[str, Any]) -> List[str]:
+    """Obtiene los tags de un post en minúsculas y sin repetir.
+
+    Los tags escritos por el modelo ya están normalizados; esto solo cubre
+    datos editados a mano.
+
+    Args:
+        post: Diccionario del post.
+
+    Returns:
+        List[str]: Tags en minúsculas sin duplicados.
+    """
+    return list(dict.fromkeys(t.lower() for t in post["tags"] if isinstance(t, str)))
+
+
+def _indice_tags(filepath: str, posts: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+    """Obtiene (o construye) el índice invertido tag -> posiciones de posts.
+
+    Args:
+        filepath: Ruta al JSON de publicaciones.
+        posts: Lista cacheada de posts.
+
+    Returns:
+        Dict[str, List[int]]: Mapa tag -> posiciones en 'posts' (en orden).
+    """
+    indice = _INDICE_TAGS.get(filepath)
+    if indice is None:
+        indice = {}
+        for i, p in enumerate(posts):
+            for t in _tags_indexables(p):
+                indice.setdefault(t, []).append(i)
+        _INDICE_TAGS[filepath] = indice
+    return indice
+
+
+def _indice_posts_por_autor(filepath: str, posts: List[Dict[str, Any]]) \
+        -> Dict[Any, List[int]]:
+    """Obtiene (o construye) el índice id_autor -> posiciones de sus posts.
+
+    Args:
+        filepath: Ruta al JSON de publicaciones.
+        posts: Lista cacheada de posts.
+
+    Returns:
+        Dict[Any, List[int]]: Mapa id_autor -> posiciones en 'posts' (en orden).
+    """
+    indice = _INDICE_AUTORES_POSTS.get(filepath)
+    if indice is None:
+        indice = {}
+        for i, p in enumerate(posts):
+            indice.setdefault(p["id_autor"], []).append(i)
+        _INDICE_AUTORES_POSTS[filepath] = indice
+    return indice
+
+
+def _indice_comentarios(filepath: str, post: Dict[str, Any]) -> Dict[str, int]:
+    """Obtiene (o construye) el índice id_comentario -> posición de un post.
+
+    Args:
+        filepath: Ruta al JSON de publicaciones.
+        post: Diccionario del post (con su lista 'comentarios').
+
+    Returns:
+        Dict[str, int]: Mapa id_comentario -> posición en post['comentarios'].
+    """
+    por_post = _INDICE_COMENTARIOS.setdefault(filepath, {})
+    id_post_str = _clave(post.get("id_post"))
+    indice = por_post.get(id_post_str)
+    if indice is None:
+        indice = {}
+        for i, c in enumerate(post.get("comentarios") or []):
+            indice.setdefault(c.get("id_comentario"), i)
+        por_post[id_post_str] = indice
+    return indice
+
+
+def _eliminar_posicion(filepath: str, datos: List[Dict[str, Any]], idx: int,
+                       clave_id: str) -> None:
+    """Elimina un registro de la lista cacheada y ajusta los índices.
+
+    Conserva el orden: las posiciones posteriores a 'idx' bajan en uno.
+
+    Args:
+        filepath: Ruta al CSV/JSON de origen.
+        datos: Lista cacheada de registros.
+        idx: Posición del registro a eliminar.
+        clave_id: Nombre de la clave que contiene el ID.
+
+    Returns:
+        None
+    """
+    id_eliminado = datos[idx].get(clave_id)
+    del datos[idx]
+
+    for indices in (_INDICE_IDS, _INDICE_EMAILS):
+        indice = indices.get(filepath)
+        if indice is None:
+            continue
+        for clave, pos in list(indice.items()):
+            if pos == idx:
+                del indice[clave]
+            elif pos > idx:
+                indice[clave] = pos - 1
+
+    for indices in (_INDICE_TAGS, _INDICE_AUTORES_POSTS):
+        indice = indices.get(filepath)
+        if indice is None:
+            continue
+        for clave, posiciones in list(indice.items()):
+            nuevas = [pos if pos < idx else pos - 1 for pos in posiciones if pos != idx]
+            if nuevas:
+                indice[clave] = nuevas
+            else:
+                del indice[clave]
+
+    # El máximo puede bajar: se recalcula en la próxima alta, como antes.
+    _MAX_ID.get(filepath, {}).pop(clave_id, None)
+    _MAX_ID_COMENTARIOS.get(filepath, {}).pop(_clave(id_eliminado), None)
+    _INDICE_COMENTARIOS.get(filepath, {}).pop(_clave(id_eliminado), None)
+
+
 # =========================
 # Helpers y validaciones
 # =========================
 
-_EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
+# ASCII evita que IGNORECASE acepte equivalentes Unicode (p. ej. 'K' Kelvin).
+_EMAIL_RE = re.compile(r"^[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}$",
+                       re.IGNORECASE | re.ASCII)
+# Separa por comas descartando los espacios alrededor en el mismo paso.
+_TAG_SPLIT = re.compile(r"\s*,\s*")
+# Última marca de tiempo formateada: [segundo epoch, texto].
+_ULTIMA_MARCA: List[Any] = [None, ""]
+
+
+def _clave(valor: Any) -> str:
+    """Convierte un identificador a la clave str usada en el almacenamiento.
+
+    Evita la llamada a str() en el caso habitual de que ya sea una cadena.
+
+    Args:
+        valor: Identificador (str, int u otro).
+
+    Returns:
+        str: Identificador como cadena.
+    """
+    return valor if type(valor) is str else str(valor)
 
 
 def _ahora_str() -> str:
     """Obtiene la fecha y hora actual formateada.
 
+    La resolución es de un segundo, así que el formateo se hace una vez por
+    segundo y se reutiliza en altas consecutivas.
+
     Returns:
         str: Marca de tiempo en formato 'YYYY-MM-DD HH:MM:SS'.
     """
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    segundo = int(time.time())
+    if segundo != _ULTIMA_MARCA[0]:
+        _ULTIMA_MARCA[1] = datetime.fromtimestamp(segundo).strftime("%Y-%m-%d %H:%M:%S")
+        _ULTIMA_MARCA[0] = segundo
+    return _ULTIMA_MARCA[1]
 
 
 def _es_str_no_vacio(valor: Any) -> bool:
@@ -77,16 +466,13 @@ def _normalizar_tags(tags: Sequence[str]) -> List[str]:
     Raises:
         ValidacionError: Si algún elemento no es cadena.
     """
-    vistos = set()
-    normalizados: List[str] = []
-    for t in tags:
-        if not isinstance(t, str):
-            raise ValidacionError("Todos los tags deben ser cadenas de texto.")
-        tt = t.strip().lower()
-        if tt and tt not in vistos:
-            vistos.add(tt)
-            normalizados.append(tt)
-    return normalizados
+    # dict.fromkeys deduplica conservando el orden de aparición. str.strip
+    # rechaza (TypeError) cualquier elemento que no sea cadena, bytes incluidos.
+    try:
+        return list(dict.fromkeys(tt for tt in (str.strip(t).lower() for t in tags)
+                                  if tt))
+    except TypeError:
+        raise ValidacionError("Todos los tags deben ser cadenas de texto.") from None
 
 
 def _parsear_tags(tags: Any) -> List[str]:
@@ -106,10 +492,10 @@ def _parsear_tags(tags: Any) -> List[str]:
     if tags is None:
         return []
     if isinstance(tags, (list, tuple)):
-        return _normalizar_tags(list(tags))
+        return _normalizar_tags(tags)
     if isinstance(tags, str):
-        separados = [p.strip() for p in tags.split(",")]
-        return _normalizar_tags(separados)
+        return list(dict.fromkeys(p.lower() for p in _TAG_SPLIT.split(tags.strip())
+                                  if p))
     raise ValidacionError("Formato de 'tags' no soportado. Use lista o cadena separada "
                           "por comas.")
 
@@ -129,7 +515,7 @@ def _generar_id(items: List[Dict[str, Any]], clave_id: str) -> int:
     if not items:
         return 1
     try:
-        max_id = max(int(it.get(clave_id, 0)) for it in items)
+        max_id = max(int(it.get(clave_id) or 0) for it in items)
     except ValueError:
         max_id = 0
     return max_id + 1
@@ -153,6 +539,45 @@ def _generar_id_comentario(post: Dict[str, Any]) -> int:
         max_id = 0
     return max_id + 1
 
+
+def _siguiente_id(filepath: str, items: List[Dict[str, Any]], clave_id: str) -> int:
+    """Reserva el siguiente ID usando el máximo cacheado del archivo.
+
+    Solo la primera llamada tras cargar recorre la lista con _generar_id().
+
+    Args:
+        filepath: Ruta al CSV/JSON de origen.
+        items: Lista cacheada de registros.
+        clave_id: Nombre de la clave que contiene el ID.
+
+    Returns:
+        int: ID siguiente.
+    """
+    maximos = _MAX_ID.setdefault(filepath, {})
+    ultimo = maximos.get(clave_id)
+    nuevo_id = _generar_id(items, clave_id) if ultimo is None else ultimo + 1
+    maximos[clave_id] = nuevo_id
+    return nuevo_id
+
+
+def _siguiente_id_comentario(filepath: str, post: Dict[str, Any]) -> int:
+    """Reserva el siguiente ID de comentario usando el máximo cacheado del post.
+
+    Args:
+        filepath: Ruta al JSON de publicaciones.
+        post: Diccionario del post (con su lista 'comentarios').
+
+    Returns:
+        int: Siguiente ID de comentario.
+    """
+    maximos = _MAX_ID_COMENTARIOS.setdefault(filepath, {})
+    id_post_str = _clave(post.get("id_post"))
+    ultimo = maximos.get(id_post_str)
+    nuevo_id = _generar_id_comentario(post) if ultimo is None else ultimo + 1
+    maximos[id_post_str] = nuevo_id
+    return nuevo_id
+
+
 def crear_autor(autores_filepath: str, nombre_autor: str, email: str, password_hash: str
 = "") -> Dict[str, Any]:
     """Crea un nuevo autor.
@@ -176,22 +601,26 @@ def crear_autor(autores_filepath: str, nombre_autor: str, email: str, password_h
         raise ValidacionError("El nombre del autor es obligatorio.")
     _validar_email(email)
 
-    autores = gestor_datos.cargar_datos(autores_filepath)
+    autores = _cargar(autores_filepath)
+    email_norm = email.strip().lower()
 
-    if any(a.get("email", "").strip().lower() == email.strip().lower()
-           for a in autores):
+    emails = _indice_emails(autores_filepath, autores)
+    if email_norm in emails:
         raise EmailDuplicado(f"El email '{email}' ya se encuentra registrado.")
 
-    nuevo_id = _generar_id(autores, "id_autor")
+    nuevo_id = _siguiente_id(autores_filepath, autores, "id_autor")
     autor = {
         "id_autor": str(nuevo_id),
         "nombre_autor": nombre_autor.strip(),
-        "email": email.strip().lower(),
+        "email": email_norm,
         "password_hash": str(password_hash or "").strip(),
     }
+    ids = _indice_ids(autores_filepath, autores, "id_autor")
     autores.append(autor)
-    gestor_datos.guardar_datos(autores_filepath, autores)
-    return autor
+    ids.setdefault(autor["id_autor"], len(autores) - 1)
+    emails.setdefault(autor["email"], len(autores) - 1)
+    _anexar(autores_filepath, autores, autor)
+    return _copia(autor)
 
 
 def leer_todos_los_autores(autores_filepath: str) -> \
@@ -202,9 +631,9 @@ def leer_todos_los_autores(autores_filepath: str) -> \
         autores_filepath: Ruta al CSV de autores.
 
     Returns:
-        List[Dict[str, Any]]: Lista de autores.
+        List[Dict[str, Any]]: Copia de la lista de autores.
     """
-    return gestor_datos.cargar_datos(autores_filepath)
+    return [_copia(autor) for autor in _cargar(autores_filepath)]
 
 
 def buscar_autor_por_id(autores_filepath: str, id_autor: str | int) \
@@ -218,12 +647,26 @@ def buscar_autor_por_id(autores_filepath: str, id_autor: str | int) \
     Returns:
         Optional[Dict[str, Any]]: Autor encontrado o None.
     """
-    autores = gestor_datos.cargar_datos(autores_filepath)
-    id_str = str(id_autor)
-    for a in autores:
-        if a.get("id_autor") == id_str:
-            return a
-    return None
+    autores = _cargar(autores_filepath)
+    idx = _indice_ids(autores_filepath, autores, "id_autor").get(_clave(id_autor))
+    return None if idx is None else _copia(autores[idx])
+
+
+def autor_existe(autores_filepath: str, id_autor: str | int) -> bool:
+    """Indica si existe un autor con el ID dado.
+
+    Consulta solo el índice por ID; útil para validar una vez antes de crear
+    muchas publicaciones sin 'validar_autor_en' en cada llamada.
+
+    Args:
+        autores_filepath: Ruta al CSV de autores.
+        id_autor: ID del autor.
+
+    Returns:
+        bool: True si el autor existe.
+    """
+    autores = _cargar(autores_filepath)
+    return _clave(id_autor) in _indice_ids(autores_filepath, autores, "id_autor")
 
 
 def buscar_autor_por_email(autores_filepath: str, email: str) \
@@ -241,12 +684,9 @@ def buscar_autor_por_email(autores_filepath: str, email: str) \
         ValidacionError: Si el email no es válido.
     """
     _validar_email(email)
-    autores = gestor_datos.cargar_datos(autores_filepath)
-    email_l = email.strip().lower()
-    for a in autores:
-        if a.get("email", "").strip().lower() == email_l:
-            return a
-    return None
+    autores = _cargar(autores_filepath)
+    idx = _indice_emails(autores_filepath, autores).get(email.strip().lower())
+    return None if idx is None else _copia(autores[idx])
 
 
 def actualizar_autor(
@@ -273,41 +713,46 @@ def actualizar_autor(
         EmailDuplicado: Si el nuevo email ya está en uso.
         ValidacionError: Si algún campo es inválido.
     """
-    autores = gestor_datos.cargar_datos(autores_filepath)
-    id_str = str(id_autor)
+    autores = _cargar(autores_filepath)
+    id_str = _clave(id_autor)
 
-    idx = -1
-    for i, a in enumerate(autores):
-        if a.get("id_autor") == id_str:
-            idx = i
-            break
+    idx = _indice_ids(autores_filepath, autores, "id_autor").get(id_str, -1)
     if idx == -1:
         raise AutorNoEncontrado(f"No existe autor con id_autor='{id_str}'.")
 
-    autor = dict(autores[idx])  # copia
+    # Se valida todo antes de tocar el registro cacheado (se muta en sitio).
+    cambios: Dict[str, Any] = {}
 
     if "nombre_autor" in datos_nuevos:
         if not _es_str_no_vacio(datos_nuevos["nombre_autor"]):
             raise ValidacionError("El nombre del autor no puede estar vacío.")
-        autor["nombre_autor"] = str(datos_nuevos["nombre_autor"]).strip()
+        cambios["nombre_autor"] = str(datos_nuevos["nombre_autor"]).strip()
 
     if "email" in datos_nuevos:
         nuevo_email = str(datos_nuevos["email"]).strip().lower()
         _validar_email(nuevo_email)
         # verificar unicidad
-        for a in autores:
-            if (a.get("id_autor") != id_str and a.get("email", "").strip().lower()
-                    == nuevo_email):
-                raise EmailDuplicado(f"El email '{nuevo_email}"
-                                     f"' ya está en uso por otro autor.")
-        autor["email"] = nuevo_email
+        pos = _indice_emails(autores_filepath, autores).get(nuevo_email, idx)
+        if pos != idx:
+            raise EmailDuplicado(f"El email '{nuevo_email}"
+                                 f"' ya está en uso por otro autor.")
+        cambios["email"] = nuevo_email
 
     if "password_hash" in datos_nuevos:
-        autor["password_hash"] = str(datos_nuevos["password_hash"] or "").strip()
+        cambios["password_hash"] = str(datos_nuevos["password_hash"] or "").strip()
 
-    autores[idx] = autor
-    gestor_datos.guardar_datos(autores_filepath, autores)
-    return autor
+    autor = autores[idx]
+    emails = _indice_emails(autores_filepath, autores)
+    email_anterior = autor["email"].strip().lower()
+    autor.update(cambios)
+    email_actual = autor["email"].strip().lower()
+    if email_actual != email_anterior:
+        if emails.get(email_anterior) == idx:
+            del emails[email_anterior]
+        emails.setdefault(email_actual, idx)
+
+    _guardar(autores_filepath, autores)
+    return _copia(autor)
 
 
 def eliminar_autor(autores_filepath: str, id_autor: str | int) -> bool:
@@ -320,14 +765,14 @@ def eliminar_autor(autores_filepath: str, id_autor: str | int) -> bool:
     Returns:
         bool: True si se eliminó; False si no existía.
     """
-    autores = gestor_datos.cargar_datos(autores_filepath)
-    id_str = str(id_autor)
-    original = len(autores)
-    autores = [a for a in autores if a.get("id_autor") != id_str]
-    if len(autores) < original:
-        gestor_datos.guardar_datos(autores_filepath, autores)
-        return True
-    return False
+    autores = _cargar(autores_filepath)
+    id_str = _clave(id_autor)
+    idx = _indice_ids(autores_filepath, autores, "id_autor").get(id_str)
+    if idx is None:
+        return False
+    _eliminar_posicion(autores_filepath, autores, idx, "id_autor")
+    _guardar(autores_filepath, autores)
+    return True
 
 
 def crear_post(
@@ -367,15 +812,20 @@ def crear_post(
     if not _es_str_no_vacio(contenido):
         raise ValidacionError("El contenido es obligatorio.")
 
-    id_autor_str = str(id_autor_en_sesion)
+    id_autor_str = _clave(id_autor_en_sesion)
 
     if validar_autor_en:
-        autor = buscar_autor_por_id(validar_autor_en, id_autor_str)
-        if not autor:
+        if not autor_existe(validar_autor_en, id_autor_str):
             raise AutorNoEncontrado(f"No existe autor con id_autor='{id_autor_str}'.")
 
-    posts = gestor_datos.cargar_datos(posts_filepath)
-    nuevo_id = _generar_id(posts, "id_post")
+    # Antes de reservar el ID: un alta rechazada no debe consumir uno.
+    tags_norm = _parsear_tags(tags)
+
+    posts = _cargar(posts_filepath)
+    ids = _indice_ids(posts_filepath, posts, "id_post")
+    tags_idx = _indice_tags(posts_filepath, posts)
+    por_autor = _indice_posts_por_autor(posts_filepath, posts)
+    nuevo_id = _siguiente_id(posts_filepath, posts, "id_post")
 
     post = {
         "id_post": str(nuevo_id),
@@ -384,12 +834,16 @@ def crear_post(
         "contenido": contenido.strip(),
         "fecha_publicacion": fecha_publicacion.strip() if _es_str_no_vacio
         (fecha_publicacion or "") else _ahora_str(),
-        "tags": _parsear_tags(tags),
+        "tags": tags_norm,
         "comentarios": [],
     }
     posts.append(post)
-    gestor_datos.guardar_datos(posts_filepath, posts)
-    return post
+    ids.setdefault(post["id_post"], len(posts) - 1)
+    for t in post["tags"]:
+        tags_idx.setdefault(t, []).append(len(posts) - 1)
+    por_autor.setdefault(post["id_autor"], []).append(len(posts) - 1)
+    _anexar(posts_filepath, posts, post)
+    return _copia(post)
 
 
 def leer_todos_los_posts(posts_filepath: str) -> List[Dict[str, Any]]:
@@ -399,9 +853,9 @@ def leer_todos_los_posts(posts_filepath: str) -> List[Dict[str, Any]]:
         posts_filepath: Ruta al JSON de publicaciones.
 
     Returns:
-        List[Dict[str, Any]]: Lista de posts.
+        List[Dict[str, Any]]: Copia de la lista de posts.
     """
-    return gestor_datos.cargar_datos(posts_filepath)
+    return [_copia(post) for post in _cargar(posts_filepath)]
 
 
 def listar_posts_por_autor(posts_filepath: str, id_autor: str | int) \
@@ -415,9 +869,9 @@ def listar_posts_por_autor(posts_filepath: str, id_autor: str | int) \
     Returns:
         List[Dict[str, Any]]: Publicaciones del autor.
     """
-    id_str = str(id_autor)
-    posts = gestor_datos.cargar_datos(posts_filepath)
-    return [p for p in posts if p.get("id_autor") == id_str]
+    posts = _cargar(posts_filepath)
+    indice = _indice_posts_por_autor(posts_filepath, posts)
+    return [_copia(posts[i]) for i in indice.get(_clave(id_autor), [])]
 
 
 def buscar_posts_por_tag(posts_filepath: str, tag: str) -> List[Dict[str, Any]]:
@@ -437,9 +891,41 @@ def buscar_posts_por_tag(posts_filepath: str, tag: str) -> List[Dict[str, Any]]:
     """
     if not _es_str_no_vacio(tag):
         raise ValidacionError("El tag de búsqueda no puede estar vacío.")
-    t = tag.strip().lower()
-    posts = gestor_datos.cargar_datos(posts_filepath)
-    return [p for p in posts if t in [tt.lower() for tt in (p.get("tags") or [])]]
+    posts = _cargar(posts_filepath)
+    posiciones = _indice_tags(posts_filepath, posts).get(tag.strip().lower(), [])
+    return [_copia(posts[i]) for i in posiciones]
+
+
+def buscar_post_por_tag_y_autor(posts_filepath: str, tag: str, id_autor: str | int) \
+        -> Optional[Dict[str, Any]]:
+    """Obtiene el primer post de un autor que contenga el tag indicado.
+
+    Cruza los índices por tag y por autor recorriendo la lista más corta,
+    sin filtrar todos los posts del tag en una segunda pasada.
+
+    Args:
+        posts_filepath: Ruta al JSON de publicaciones.
+        tag: Tag a buscar (insensible a mayúsculas/minúsculas).
+        id_autor: ID del autor.
+
+    Returns:
+        Optional[Dict[str, Any]]: Post encontrado o None.
+
+    Raises:
+        ValidacionError: Si el tag está vacío.
+    """
+    if not _es_str_no_vacio(tag):
+        raise ValidacionError("El tag de búsqueda no puede estar vacío.")
+    posts = _cargar(posts_filepath)
+    del_tag = _indice_tags(posts_filepath, posts).get(tag.strip().lower(), [])
+    del_autor = _indice_posts_por_autor(posts_filepath, posts).get(_clave(id_autor), [])
+    # Ambas listas están en orden: el primer acierto de la corta es el primero
+    corta, larga = sorted((del_tag, del_autor), key=len)
+    en_larga = set(larga)
+    for i in corta:
+        if i in en_larga:
+            return _copia(posts[i])
+    return None
 
 
 def buscar_post_por_id(posts_filepath: str, id_post: str | int) \
@@ -453,12 +939,9 @@ def buscar_post_por_id(posts_filepath: str, id_post: str | int) \
     Returns:
         Optional[Dict[str, Any]]: Post encontrado o None.
     """
-    posts = gestor_datos.cargar_datos(posts_filepath)
-    id_str = str(id_post)
-    for p in posts:
-        if p.get("id_post") == id_str:
-            return p
-    return None
+    posts = _cargar(posts_filepath)
+    idx = _indice_ids(posts_filepath, posts, "id_post").get(_clave(id_post))
+    return None if idx is None else _copia(posts[idx])
 
 
 def actualizar_post(
@@ -485,38 +968,46 @@ def actualizar_post(
         AccesoNoAutorizado: Si el post no pertenece al autor.
         ValidacionError: Si algún campo es inválido.
     """
-    posts = gestor_datos.cargar_datos(posts_filepath)
-    id_post_str = str(id_post)
-    id_autor_sesion_str = str(id_autor_en_sesion)
+    posts = _cargar(posts_filepath)
+    id_post_str = _clave(id_post)
+    id_autor_sesion_str = _clave(id_autor_en_sesion)
 
-    idx = -1
-    for i, p in enumerate(posts):
-        if p.get("id_post") == id_post_str:
-            idx = i
-            break
+    idx = _indice_ids(posts_filepath, posts, "id_post").get(id_post_str, -1)
     if idx == -1:
         raise PostNoEncontrado(f"No existe post con id_post='{id_post_str}'.")
 
-    post = dict(posts[idx])  # copia
-    if post.get("id_autor") != id_autor_sesion_str:
+    post = posts[idx]
+    if post["id_autor"] != id_autor_sesion_str:
         raise AccesoNoAutorizado("No puedes modificar publicaciones de otros autores.")
 
+    # Se valida todo antes de tocar el registro cacheado (se muta en sitio).
+    cambios: Dict[str, Any] = {}
+
     if "titulo" in datos_nuevos:
         if not _es_str_no_vacio(datos_nuevos["titulo"]):
             raise ValidacionError("El título no puede estar vacío.")
-        post["titulo"] = str(datos_nuevos["titulo"]).strip()
+        cambios["titulo"] = str(datos_nuevos["titulo"]).strip()
 
     if "contenido" in datos_nuevos:
         if not _es_str_no_vacio(datos_nuevos["contenido"]):
             raise ValidacionError("El contenido no puede estar vacío.")
-        post["contenido"] = str(datos_nuevos["contenido"]).strip()
+        cambios["contenido"] = str(datos_nuevos["contenido"]).strip()
 
     if "tags" in datos_nuevos:
-        post["tags"] = _parsear_tags(datos_nuevos["tags"])
-
-    posts[idx] = post
-    gestor_datos.guardar_datos(posts_filepath, posts)
-    return post
+        cambios["tags"] = _parsear_tags(datos_nuevos["tags"])
+        tags_idx = _indice_tags(posts_filepath, posts)
+        for t in _tags_indexables(post):
+            tags_idx[t].remove(idx)
+            if not tags_idx[t]:
+                del tags_idx[t]
+        for t in cambios["tags"]:
+            posiciones = tags_idx.setdefault(t, [])
+            posiciones.append(idx)
+            posiciones.sort()
+
+    post.update(cambios)
+    _guardar(posts_filepath, posts)
+    return _copia(post)
 
 
 def eliminar_post(
@@ -537,24 +1028,20 @@ def eliminar_post(
     Raises:
         AccesoNoAutorizado: Si el post no pertenece al autor.
     """
-    posts = gestor_datos.cargar_datos(posts_filepath)
-    id_post_str = str(id_post)
-    id_autor_sesion_str = str(id_autor_en_sesion)
-
-    post = None
-    for p in posts:
-        if p.get("id_post") == id_post_str:
-            post = p
-            break
+    posts = _cargar(posts_filepath)
+    id_post_str = _clave(id_post)
+    id_autor_sesion_str = _clave(id_autor_en_sesion)
 
-    if post is None:
+    idx = _indice_ids(posts_filepath, posts, "id_post").get(id_post_str)
+    if idx is None:
         return False
+    post = posts[idx]
 
-    if post.get("id_autor") != id_autor_sesion_str:
+    if post["id_autor"] != id_autor_sesion_str:
         raise AccesoNoAutorizado("No puedes eliminar publicaciones de otros autores.")
 
-    posts = [p for p in posts if p.get("id_post") != id_post_str]
-    gestor_datos.guardar_datos(posts_filepath, posts)
+    _eliminar_posicion(posts_filepath, posts, idx, "id_post")
+    _guardar(posts_filepath, posts)
     return True
 
 
@@ -591,33 +1078,29 @@ def agregar_comentario_a_post(
     if not _es_str_no_vacio(contenido):
         raise ValidacionError("El contenido del comentario es obligatorio.")
 
-    posts = gestor_datos.cargar_datos(posts_filepath)
-    id_post_str = str(id_post)
+    posts = _cargar(posts_filepath)
+    id_post_str = _clave(id_post)
 
-    idx = -1
-    for i, p in enumerate(posts):
-        if p.get("id_post") == id_post_str:
-            idx = i
-            break
+    idx = _indice_ids(posts_filepath, posts, "id_post").get(id_post_str, -1)
     if idx == -1:
         raise PostNoEncontrado(f"No existe post con id_post='{id_post_str}'.")
 
-    post = dict(posts[idx])  # copia
-    comentarios: List[Dict[str, Any]] = list(post.get("comentarios") or [])
-    nuevo_id = _generar_id_comentario(post)
+    post = posts[idx]
+    # Se trabaja sobre la lista del post (sin copia); _cargar garantiza que existe.
+    comentarios: List[Dict[str, Any]] = post.setdefault("comentarios", [])
+    nuevo_id = _siguiente_id_comentario(posts_filepath, post)
     comentario = {
         "id_comentario": str(nuevo_id),
         "autor": autor.strip(),
         "contenido": contenido.strip(),
         "fecha": _ahora_str(),
-        "id_autor": str(id_autor) if id_autor is not None else "",
+        "id_autor": _clave(id_autor) if id_autor is not None else "",
     }
+    indice = _indice_comentarios(posts_filepath, post)
     comentarios.append(comentario)
-    post["comentarios"] = comentarios
-
-    posts[idx] = post
-    gestor_datos.guardar_datos(posts_filepath, posts)
-    return comentario
+    indice.setdefault(comentario["id_comentario"], len(comentarios) - 1)
+    _guardar(posts_filepath, posts)
+    return dict(comentario)
 
 
 def listar_comentarios_de_post(posts_filepath: str, id_post: str | int) \
@@ -666,38 +1149,34 @@ def eliminar_comentario_de_post(
         PostNoEncontrado: Si el post no existe.
         AccesoNoAutorizado: Si no es dueño del comentario.
     """
-    posts = gestor_datos.cargar_datos(posts_filepath)
-    id_post_str = str(id_post)
-    id_com_str = str(id_comentario)
+    posts = _cargar(posts_filepath)
+    id_post_str = _clave(id_post)
+    id_com_str = _clave(id_comentario)
 
-    pidx = -1
-    for i, p in enumerate(posts):
-        if p.get("id_post") == id_post_str:
-            pidx = i
-            break
+    pidx = _indice_ids(posts_filepath, posts, "id_post").get(id_post_str, -1)
     if pidx == -1:
         raise PostNoEncontrado(f"No existe post con id_post='{id_post_str}'.")
 
-    post = dict(posts[pidx])
-    comentarios: List[Dict[str, Any]] = list(post.get("comentarios") or [])
+    comentarios: List[Dict[str, Any]] = posts[pidx].setdefault("comentarios", [])
+    indice = _indice_comentarios(posts_filepath, posts[pidx])
 
-    c_encontrado = None
-    for c in comentarios:
-        if c.get("id_comentario") == id_com_str:
-            c_encontrado = c
-            break
-
-    if c_encontrado is None:
+    cidx = indice.get(id_com_str, -1)
+    if cidx == -1:
         return False
+    c_encontrado = comentarios[cidx]
 
     if c_encontrado.get("id_autor") and id_autor_en_sesion is not None:
-        if str(c_encontrado.get("id_autor")) != str(id_autor_en_sesion):
+        if _clave(c_encontrado.get("id_autor")) != _clave(id_autor_en_sesion):
             raise AccesoNoAutorizado("No puedes eliminar comentarios de otros autores.")
 
-    comentarios = [c for c in comentarios if c.get("id_comentario") != id_com_str]
-    post["comentarios"] = comentarios
-    posts[pidx] = post
-    gestor_datos.guardar_datos(posts_filepath, posts)
+    del comentarios[cidx]
+    del indice[id_com_str]
+    for clave, pos in indice.items():
+        if pos > cidx:
+            indice[clave] = pos - 1
+    # El máximo puede bajar: se recalcula en la próxima alta, como antes.
+    _MAX_ID_COMENTARIOS.get(posts_filepath, {}).pop(id_post_str, None)
+    _guardar(posts_filepath, posts)
     return True
 
 
@@ -728,34 +1207,25 @@ def actualizar_comentario_de_post(
         ValidacionError: Si 'contenido' es inválido.
         AccesoNoAutorizado: Si no es dueño del comentario.
     """
-    posts = gestor_datos.cargar_datos(posts_filepath)
-    id_post_str = str(id_post)
-    id_com_str = str(id_comentario)
+    posts = _cargar(posts_filepath)
+    id_post_str = _clave(id_post)
+    id_com_str = _clave(id_comentario)
 
-    pidx = -1
-    for i, p in enumerate(posts):
-        if p.get("id_post") == id_post_str:
-            pidx = i
-            break
+    pidx = _indice_ids(posts_filepath, posts, "id_post").get(id_post_str, -1)
     if pidx == -1:
         raise PostNoEncontrado(f"No existe post con id_post='{id_post_str}'.")
 
-    post = dict(posts[pidx])
-    comentarios: List[Dict[str, Any]] = list(post.get("comentarios") or [])
+    comentarios: List[Dict[str, Any]] = posts[pidx].setdefault("comentarios", [])
 
-    cidx = -1
-    for i, c in enumerate(comentarios):
-        if c.get("id_comentario") == id_com_str:
-            cidx = i
-            break
+    cidx = _indice_comentarios(posts_filepath, posts[pidx]).get(id_com_str, -1)
     if cidx == -1:
         raise ValidacionError("No se encontró el comentario indicado.")
 
-    comentario = dict(comentarios[cidx])
+    comentario = comentarios[cidx]
 
     # Autorización (si ambas partes están presentes)
     if comentario.get("id_autor") and id_autor_en_sesion is not None:
-        if str(comentario.get("id_autor")) != str(id_autor_en_sesion):
+        if _clave(comentario.get("id_autor")) != _clave(id_autor_en_sesion):
             raise AccesoNoAutorizado("No puedes editar comentarios de otros autores.")
 
     # Validar y aplicar cambios permitidos
@@ -767,11 +1237,8 @@ def actualizar_comentario_de_post(
         comentario["contenido"] = nuevo_contenido.strip()
 
     # Persistir
-    comentarios[cidx] = comentario
-    post["comentarios"] = comentarios
-    posts[pidx] = post
-    gestor_datos.guardar_datos(posts_filepath, posts)
-    return comentario
+    _guardar(posts_filepath, posts)
+    return dict(comentario)
 
 
 
@@ -787,6 +1254,7 @@ __all__ = [
     "crear_autor",
     "leer_todos_los_autores",
     "buscar_autor_por_id",
+    "autor_existe",
     "buscar_autor_por_email",
     "actualizar_autor",
     "eliminar_autor",
@@ -795,6 +1263,7 @@ __all__ = [
     "leer_todos_los_posts",
     "listar_posts_por_autor",
     "buscar_posts_por_tag",
+    "buscar_post_por_tag_y_autor",
     "buscar_post_por_id",
     "actualizar_post",
     "eliminar_post",
@@ -2,16 +2,85 @@
 """
 Módulo de Persistencia de Datos.
 """
+import atexit  # Volcar escrituras diferidas al terminar el proceso
+import collections  # namedtuple para filas de autores de solo lectura
 import csv  # Lectura/escritura de archivos CSV
+import functools  # Memorizar directorios ya creados
+import gzip  # Compresión de JSON (.json.gz)
 import json  # Manejo de estructuras y archivos JSON
+import mmap  # Lectura mapeada en memoria de JSON grandes
 import os  # Operaciones con rutas y sistema de archivos
+import re  # Ajuste de la sangría de orjson
 import tempfile  # Archivos temporales para escritura atómica
-from io import StringIO
-from typing import Any, Dict, List  # Anotaciones de tipos para claridad
+import threading  # Temporizadores de escrituras diferidas
+from concurrent.futures import ThreadPoolExecutor  # Lecturas en paralelo
+from contextlib import contextmanager  # Agrupar escrituras en un lote
+from typing import (  # Anotaciones de tipos para claridad
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+try:
+    import orjson  # Serializador JSON en C (opcional, más rápido que json)
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+try:
+    import zstandard  # Compresión zstd para .json.zst (opcional)
+except ImportError:  # pragma: no cover - depende del entorno
+    zstandard = None
 
 # Constantes de cabeceras para CSV de autores
 CAMPOS_AUTORES = ["id_autor", "nombre_autor", "email", "password_hash"]
 
+# Extensiones tratadas como JSON; las comprimidas se leen y escriben enteras.
+_EXTENSIONES_JSON = (".json", ".json.gz", ".json.zst")
+# Nivel de zstd: buena relación velocidad/tamaño para texto JSON.
+_NIVEL_ZSTD = 3
+# Errores de un archivo corrupto o truncado (los de zstd, si está instalado).
+_ERRORES_ILEGIBLE: Tuple[type, ...] = (
+    json.JSONDecodeError, UnicodeDecodeError, gzip.BadGzipFile, EOFError,
+) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
+# Cabecera del CSV de autores ya codificada (fin de línea \r\n como csv.writer).
+_CABECERA_AUTORES = (",".join(CAMPOS_AUTORES) + "\r\n").encode("utf-8")
+
+# Fila de autor liviana (sin dict por fila) para cargar_datos(como_dicts=False).
+Autor = collections.namedtuple("Autor", CAMPOS_AUTORES)
+
+# Tamaño de buffer de E/S: menos llamadas al sistema que el valor por defecto.
+_TAM_BUFFER = 64 * 1024
+# A partir de este tamaño el JSON se lee con mmap (solo con orjson).
+_UMBRAL_MMAP = 1 << 20
+# Máximo de hilos para cargar_muchos() (lecturas de E/S, liberan el GIL).
+_MAX_HILOS_LECTURA = 8
+
+# Sangría del JSON en disco, la misma con o sin orjson: cambiar de entorno
+# no reescribe todo el archivo. orjson solo produce 2 y se duplica.
+_SANGRIA_JSON = 4
+_SANGRIA_ORJSON = re.compile(rb"^ +", re.MULTILINE)
+
+# Lotes de escritura abiertos (ruta absoluta -> nivel de anidamiento) y último
+# contenido pendiente de escribir por ruta.
+_LOTES: Dict[str, int] = {}
+_PENDIENTES: Dict[str, List[Dict[str, Any]]] = {}
+
+# Escrituras diferidas (guardar_datos(diferir=True)): temporizador por ruta.
+# Los datos esperan en _PENDIENTES hasta que pasa la demora sin cambios.
+_TEMPORIZADORES: Dict[str, threading.Timer] = {}
+_DEMORA_DIFERIDA = 0.05  # segundos
+_CERROJO_DIFERIDO = threading.RLock()
+
+# Caché de lectura: ruta absoluta -> (mtime_ns, tamaño, inodo) y datos leídos.
+_CACHE_LECTURA: Dict[str, Tuple[Tuple[int, int, int], List[Dict[str, Any]]]] = {}
+
 
 
 def _es_csv(filepath: str) -> bool:
@@ -33,25 +102,108 @@ def _es_json(filepath: str) -> bool:
         filepath: Ruta del archivo.
 
     Returns:
-        bool: True si termina en .json; False en caso contrario.
+        bool: True si termina en .json, .json.gz o .json.zst.
+    """
+    return filepath.lower().endswith(_EXTENSIONES_JSON)
+
+
+def _compresion(filepath: str) -> Optional[str]:
+    """Indica la compresión de un archivo JSON según su extensión.
+
+    Args:
+        filepath: Ruta del archivo.
+
+    Returns:
+        Optional[str]: "gz", "zst" o None si no está comprimido.
+    """
+    nombre = filepath.lower()
+    if nombre.endswith(".json.gz"):
+        return "gz"
+    if nombre.endswith(".json.zst"):
+        return "zst"
+    return None
+
+
+def _zstd() -> Any:
+    """Devuelve el módulo zstandard o falla con un mensaje claro.
+
+    Returns:
+        Any: Módulo zstandard.
+
+    Raises:
+        ImportError: Si el paquete opcional no está instalado.
+    """
+    if zstandard is None:
+        raise ImportError("Los archivos .json.zst requieren el paquete 'zstandard'.")
+    return zstandard
+
+
+def _comprimir(contenido: bytes, compresion: str) -> bytes:
+    """Comprime un documento para .json.gz o .json.zst.
+
+    Args:
+        contenido: Bytes del documento JSON.
+        compresion: "gz" o "zst".
+
+    Returns:
+        bytes: Contenido comprimido.
+    """
+    if compresion == "gz":
+        # mtime=0: mismo contenido, mismos bytes (sin marca de tiempo)
+        return gzip.compress(contenido, mtime=0)
+    return _zstd().ZstdCompressor(level=_NIVEL_ZSTD).compress(contenido)
+
+
+def _descomprimir(contenido: bytes, compresion: str) -> bytes:
+    """Descomprime el contenido de un .json.gz o .json.zst.
+
+    Args:
+        contenido: Bytes leídos del archivo.
+        compresion: "gz" o "zst".
+
+    Returns:
+        bytes: Documento JSON sin comprimir.
     """
-    return filepath.lower().endswith(".json")
+    if compresion == "gz":
+        return gzip.decompress(contenido)
+    # decompressobj() también acepta tramas sin tamaño de contenido en la
+    # cabecera (escritas por streaming), que decompress() rechaza.
+    return _zstd().ZstdDecompressor().decompressobj().decompress(contenido)
 
 
 def _asegurar_directorio(filepath: str) -> None:
     """Crea el directorio padre si no existe.
 
     Args:
-        filepath: Ruta del archivo objetivo.
+        filepath: Ruta del archivo objetivo (si ya es absoluta no se normaliza).
 
     Returns:
         None
     """
-    directorio = os.path.dirname(os.path.abspath(filepath))
+    if not os.path.isabs(filepath):
+        filepath = os.path.abspath(filepath)  # getcwd() solo para rutas relativas
+    directorio = os.path.dirname(filepath)
     if directorio and not os.path.exists(directorio):
         os.makedirs(directorio, exist_ok=True)
 
 
+@functools.lru_cache(maxsize=256)
+def _crear_directorio(directorio: str) -> None:
+    """Crea un directorio absoluto una sola vez por proceso (memorizado).
+
+    Lo usa la escritura atómica, que se ejecuta en cada guardado; si el
+    directorio desaparece, quien llama limpia la memoria y reintenta.
+
+    Args:
+        directorio: Ruta absoluta del directorio.
+
+    Returns:
+        None
+    """
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+
+
 def _campos_csv_para(filepath: str) -> List[str]:
     """Determina los campos que se usarán en el CSV.
 
@@ -70,8 +222,87 @@ def _campos_csv_para(filepath: str) -> List[str]:
     return CAMPOS_AUTORES
 
 
-def _escritura_atomica(path_destino: str, contenido: str, modo_binario: bool = False) \
-        -> None:
+@contextmanager
+def _archivo_atomico(path_destino: str, modo_binario: bool = False,
+                     directorio: Optional[str] = None) -> Iterator[IO]:
+    """Abre un temporal junto al destino y lo reemplaza atómicamente al cerrar.
+
+    Permite escribir por partes (streaming) sin armar todo el contenido en
+    memoria. Si el bloque falla, el temporal se borra y el destino no cambia.
+
+    Args:
+        path_destino: Ruta del archivo destino.
+        modo_binario: Indica si se escribe en binario.
+        directorio: Directorio absoluto del destino, si quien llama ya lo tiene.
+
+    Yields:
+        IO: Archivo temporal abierto para escritura (texto con newline="").
+    """
+    if directorio is None:
+        directorio = os.path.dirname(os.path.abspath(path_destino)) or "."
+    _crear_directorio(directorio)
+    opciones = {
+        "mode": "wb" if modo_binario else "w",
+        "encoding": None if modo_binario else "utf-8",
+        "newline": None if modo_binario else "",
+        "suffix": ".tmpjson" if _es_json(path_destino) else ".tmpcsv",
+        "buffering": _TAM_BUFFER,
+        "delete": False,
+        "dir": directorio,
+    }
+
+    try:
+        tmp = tempfile.NamedTemporaryFile(**opciones)
+    except FileNotFoundError:
+        # El directorio se borró después de memorizarlo: se vuelve a crear.
+        _crear_directorio.cache_clear()
+        _crear_directorio(directorio)
+        tmp = tempfile.NamedTemporaryFile(**opciones)
+    try:
+        with tmp:
+            yield tmp
+            # Datos en disco antes del rename: tras un corte no queda un
+            # destino truncado.
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp.name, path_destino)
+        _sincronizar_directorio(directorio)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
+def _sincronizar_directorio(directorio: str) -> None:
+    """Hace fsync del directorio para que el rename sea durable (POSIX).
+
+    En plataformas sin O_DIRECTORY (Windows) no hace nada.
+
+    Args:
+        directorio: Ruta del directorio que contiene el archivo.
+
+    Returns:
+        None
+    """
+    flag = getattr(os, "O_DIRECTORY", None)
+    if flag is None:
+        return
+    try:
+        fd = os.open(directorio, os.O_RDONLY | flag)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # Algunos sistemas de archivos no admiten fsync de directorios
+    finally:
+        os.close(fd)
+
+
+def _escritura_atomica(path_destino: str, contenido: str, modo_binario: bool = False,
+                      directorio: Optional[str] = None) -> None:
     """Escribe contenido a un archivo de forma atómica.
 
     Crea un archivo temporal en el mismo directorio, escribe y reemplaza.
@@ -80,22 +311,208 @@ def _escritura_atomica(path_destino: str, contenido: str, modo_binario: bool = F
         path_destino: Ruta del archivo destino.
         contenido: Contenido a escribir.
         modo_binario: Indica si se escribe en binario.
+        directorio: Directorio absoluto del destino, si quien llama ya lo tiene.
 
     Returns:
         None
     """
-    _asegurar_directorio(path_destino)
-    directorio = os.path.dirname(os.path.abspath(path_destino)) or "."
-    suffix = ".tmpjson" if _es_json(path_destino) else ".tmpcsv"
-    mode = "wb" if modo_binario else "w"
-    encoding = None if modo_binario else "utf-8"
-
-    with tempfile.NamedTemporaryFile(mode=mode, delete=False, dir=directorio,
-                                     suffix=suffix, encoding=encoding) as tmp:
+    with _archivo_atomico(path_destino, modo_binario, directorio) as tmp:
         tmp.write(contenido)
-        tmp_path = tmp.name
 
-    os.replace(tmp_path, path_destino)
+
+def _fila_csv(item: Dict[str, Any], campos: List[str]) -> List[str]:
+    """Convierte un registro en la fila CSV posicional de 'campos'.
+
+    Args:
+        item: Registro a convertir.
+        campos: Columnas en orden.
+
+    Returns:
+        List[str]: Valores como str (None y ausentes como cadena vacía).
+    """
+    # Un solo get por columna y sin append por celda
+    return ["" if (valor := item.get(k)) is None else str(valor) for k in campos]
+
+
+def _campo_csv(valor: Any) -> bytes:
+    """Codifica una celda CSV en UTF-8, con comillas solo si hacen falta.
+
+    Sigue las reglas de csv.writer (QUOTE_MINIMAL): se entrecomilla si hay
+    coma, comillas o saltos de línea, duplicando las comillas internas.
+
+    Args:
+        valor: Valor de la celda (None se escribe vacío).
+
+    Returns:
+        bytes: Celda lista para unir con b",".
+    """
+    texto = "" if valor is None else str(valor)
+    if '"' in texto:
+        return b'"' + texto.replace('"', '""').encode("utf-8") + b'"'
+    if "," in texto or "\n" in texto or "\r" in texto:
+        return b'"' + texto.encode("utf-8") + b'"'
+    return texto.encode("utf-8")
+
+
+def _fila_csv_bytes(item: Dict[str, Any]) -> bytes:
+    """Arma la línea CSV de un autor (columnas de CAMPOS_AUTORES) en bytes.
+
+    Escrita a mano en línea recta para el esquema fijo: sin bucle por
+    columnas ni búsqueda de campos. Debe seguir el orden de CAMPOS_AUTORES.
+
+    Args:
+        item: Registro del autor.
+
+    Returns:
+        bytes: Línea terminada en \r\n.
+    """
+    get = item.get
+    return b",".join([_campo_csv(get("id_autor")),
+                      _campo_csv(get("nombre_autor")),
+                      _campo_csv(get("email")),
+                      _campo_csv(get("password_hash"))]) + b"\r\n"
+
+
+def _clave_ruta(filepath: str) -> str:
+    """Normaliza la ruta usada como clave de lotes y caché de lectura.
+
+    Args:
+        filepath: Ruta del archivo.
+
+    Returns:
+        str: Ruta absoluta.
+    """
+    return os.path.abspath(filepath)
+
+
+def en_lote(filepath: str) -> bool:
+    """Indica si las escrituras sobre el archivo están diferidas por un lote.
+
+    Args:
+        filepath: Ruta del archivo.
+
+    Returns:
+        bool: True si hay un lote abierto para esa ruta.
+    """
+    return _clave_ruta(filepath) in _LOTES
+
+
+@contextmanager
+def lote(filepath: str) -> Iterator[None]:
+    """Agrupa las escrituras sobre un archivo y las vuelca una sola vez al salir.
+
+    Dentro del bloque, guardar_datos() y anexar_registro() solo recuerdan el
+    último contenido; cargar_datos() lo devuelve para leer lo ya escrito. Al
+    salir del lote más externo (incluso por una excepción) se escribe el
+    archivo una vez.
+
+    Ejemplo:
+        with gestor_datos.lote(posts_filepath):
+            for fila in filas:
+                crear_post(posts_filepath, ...)
+
+    Args:
+        filepath: Ruta del archivo CSV/JSON.
+
+    Yields:
+        None
+    """
+    clave = _clave_ruta(filepath)
+    _LOTES[clave] = _LOTES.get(clave, 0) + 1
+    try:
+        yield
+    finally:
+        _LOTES[clave] -= 1
+        if not _LOTES[clave]:
+            del _LOTES[clave]
+            pendientes = _PENDIENTES.pop(clave, None)
+            if pendientes is not None:
+                guardar_datos(filepath, pendientes)
+
+
+def _cancelar_diferido(clave: str) -> None:
+    """Cancela la escritura diferida de una ruta y descarta sus datos.
+
+    Args:
+        clave: Ruta absoluta del archivo.
+
+    Returns:
+        None
+    """
+    with _CERROJO_DIFERIDO:
+        temporizador = _TEMPORIZADORES.pop(clave, None)
+        if temporizador is not None:
+            temporizador.cancel()
+            if clave not in _LOTES:
+                _PENDIENTES.pop(clave, None)
+
+
+def _volcar_diferido(clave: str) -> None:
+    """Escribe los datos diferidos de una ruta (callback del temporizador).
+
+    Si hay un lote abierto sobre la ruta, el volcado queda a cargo del lote.
+    Los datos siguen en _PENDIENTES hasta que la escritura termina, así una
+    lectura concurrente (que espera el cerrojo) nunca ve el archivo viejo.
+
+    Args:
+        clave: Ruta absoluta del archivo.
+
+    Returns:
+        None
+    """
+    with _CERROJO_DIFERIDO:
+        _TEMPORIZADORES.pop(clave, None)
+        if clave in _LOTES:
+            return
+        datos = _PENDIENTES.get(clave)
+        if datos is not None:
+            try:
+                _escribir(clave, clave, datos, True)
+            finally:
+                del _PENDIENTES[clave]
+
+
+def volcar_pendientes() -> None:
+    """Escribe ya todas las escrituras diferidas que sigan en espera.
+
+    Se registra con atexit para no perder datos al cerrar el programa.
+
+    Returns:
+        None
+    """
+    with _CERROJO_DIFERIDO:
+        for clave, temporizador in list(_TEMPORIZADORES.items()):
+            temporizador.cancel()
+            _volcar_diferido(clave)
+
+
+atexit.register(volcar_pendientes)
+
+
+def _serializar_json(datos: Any, indentar: bool = True) -> bytes:
+    """Serializa a JSON en UTF-8 (sin escapar), con sangría o compacto.
+
+    Usa orjson si está instalado y json de la biblioteca estándar si no.
+
+    Args:
+        datos: Estructura a serializar.
+        indentar: Si es False produce JSON compacto (más rápido y pequeño).
+
+    Returns:
+        bytes: Documento JSON codificado en UTF-8.
+    """
+    if orjson is not None:
+        if not indentar:
+            return orjson.dumps(datos, option=orjson.OPT_NON_STR_KEYS)
+        contenido = orjson.dumps(
+            datos, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        )
+        # Sin saltos de línea dentro de las cadenas JSON: todo espacio al
+        # inicio de línea es sangría.
+        return _SANGRIA_ORJSON.sub(lambda m: m.group() * 2, contenido)
+    if indentar:
+        return json.dumps(datos, ensure_ascii=False, indent=4).encode("utf-8")
+    return json.dumps(datos, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 def inicializar_archivo(filepath: str) -> None:
@@ -110,92 +527,549 @@ def inicializar_archivo(filepath: str) -> None:
     Returns:
         None
     """
+    if os.path.exists(filepath):
+        return  # Caso habitual: ni siquiera hace falta revisar el directorio
+
+    es_csv = _es_csv(filepath)
+    if not es_csv and not _es_json(filepath):
+        return  # Formato no soportado: no se crea nada
+
     _asegurar_directorio(filepath)
+    try:
+        # O_EXCL: crear solo si no existe, sin carrera entre exists() y open()
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+    except FileExistsError:
+        return  # Otro proceso/llamada lo creó primero: no se pisa su contenido
 
-    if not os.path.exists(filepath):
-        if _es_csv(filepath):
-            campos = _campos_csv_para(filepath)
+    compresion = None if es_csv else _compresion(filepath)
+    if compresion is not None:
+        with os.fdopen(fd, mode="wb") as archivo:
+            archivo.write(_comprimir(b"[]", compresion))
+        return
+
+    with os.fdopen(fd, mode="w", newline="", encoding="utf-8") as archivo:
+        if es_csv:
             # Escribimos cabeceras
-            with open(filepath, mode="w", newline="", encoding="utf-8") as csv_file:
-                writer = csv.DictWriter(csv_file, fieldnames=campos)
-                writer.writeheader()
-        elif _es_json(filepath):
-            with open(filepath, mode="w", encoding="utf-8") as json_file:
-                json.dump([], json_file, ensure_ascii=False, indent=4)
+            csv.writer(archivo).writerow(_campos_csv_para(filepath))
+        else:
+            archivo.write("[]")
+
+
+def _firma(filepath: str) -> Optional[Tuple[int, int, int]]:
+    """Obtiene (mtime_ns, tamaño, inodo) del archivo, o None si no existe.
+
+    El inodo cambia con cada escritura atómica aunque el mtime coincida.
+
+    Args:
+        filepath: Ruta del archivo.
+
+    Returns:
+        Optional[Tuple[int, int, int]]: Firma del archivo.
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
 
 
-def cargar_datos(filepath: str) -> List[Dict[str, Any]]:
+def cargar_datos(filepath: str, como_dicts: bool = True) \
+        -> Union[List[Dict[str, Any]], List[Autor]]:
     """Carga datos desde un archivo CSV o JSON.
 
     - Si el archivo no existe, se inicializa y retorna lista vacía.
     - CSV: celdas como strings y solo columnas esperadas.
     - JSON: si el contenido no es lista válida, retorna [].
+    - Si el archivo no cambió desde la última lectura (misma firma), no se
+      vuelve a parsear: se devuelve una copia de las filas cacheadas.
+    - Las filas devueltas nunca son las de la caché ni las de un lote:
+      quien llama puede mutarlas sin alterar lecturas posteriores.
 
     Args:
         filepath: Ruta del archivo a cargar.
+        como_dicts: Solo CSV; False devuelve tuplas Autor de solo lectura
+            (menos memoria por fila, acceso por atributo). JSON siempre
+            devuelve diccionarios.
 
     Returns:
-        List[Dict[str, Any]]: Datos cargados como lista de diccionarios.
+        Union[List[Dict[str, Any]], List[Autor]]: Datos cargados.
     """
-    inicializar_archivo(filepath)
+    if not como_dicts and _es_csv(filepath):
+        return _cargar_autores(filepath)
+
+    clave = _clave_ruta(filepath)
+    with _CERROJO_DIFERIDO:  # Espera a que termine un volcado diferido en curso
+        pendientes = _PENDIENTES.get(clave)
+        if pendientes is not None:
+            return _copiar_filas(pendientes)
+
+    # Un único stat: sirve para la caché y para detectar que no existe.
+    firma = _firma(filepath)
+    if firma is None:
+        # Archivo nuevo: se inicializa vacío y no hay nada que parsear.
+        inicializar_archivo(clave)
+        return []
+    hit = _CACHE_LECTURA.get(clave)
+    if hit is not None and hit[0] == firma:
+        return _copiar_filas(hit[1])
+
+    datos = _leer_archivo(filepath, firma[1])
+    _CACHE_LECTURA[clave] = (firma, datos)
+    return _copiar_filas(datos)
+
+
+def _copiar_filas(datos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copia las filas para no compartir dicts con la caché de lectura.
+
+    También se copian las listas anidadas (tags, comentarios) y sus dicts,
+    que el modelo modifica en sitio.
+
+    Args:
+        datos: Filas cacheadas o pendientes.
+
+    Returns:
+        List[Dict[str, Any]]: Filas nuevas con el mismo contenido.
+    """
+    copias = []
+    for fila in datos:
+        copia = dict(fila)
+        for campo, valor in copia.items():
+            if type(valor) is list:
+                copia[campo] = [dict(v) if type(v) is dict else v for v in valor]
+        copias.append(copia)
+    return copias
+
+
+def _autor_de_dict(item: Dict[str, Any]) -> Autor:
+    """Convierte un registro de autor en una tupla Autor.
 
+    Args:
+        item: Diccionario del autor.
+
+    Returns:
+        Autor: Tupla con las columnas de CAMPOS_AUTORES ("" si faltan).
+    """
+    return Autor._make(_fila_csv(item, CAMPOS_AUTORES))
+
+
+def _cargar_autores(filepath: str) -> List[Autor]:
+    """Carga un CSV de autores como tuplas Autor sin crear dicts por fila.
+
+    Respeta los lotes abiertos y reutiliza la caché de lectura si ya hay
+    una lectura vigente; si no, parsea directamente a tuplas (sin cachear).
+
+    Args:
+        filepath: Ruta del archivo CSV.
+
+    Returns:
+        List[Autor]: Autores en el orden del archivo.
+    """
+    clave = _clave_ruta(filepath)
+    with _CERROJO_DIFERIDO:
+        pendientes = _PENDIENTES.get(clave)
+        if pendientes is not None:
+            return [_autor_de_dict(item) for item in pendientes]
+
+    firma = _firma(filepath)
+    if firma is None:
+        inicializar_archivo(clave)
+        return []
+    hit = _CACHE_LECTURA.get(clave)
+    if hit is not None and hit[0] == firma:
+        return [_autor_de_dict(item) for item in hit[1]]
     try:
-        if _es_csv(filepath):
-            with open(filepath, mode="r", newline="", encoding="utf-8") as csv_file:
-                lector = csv.DictReader(csv_file)
-                # Normalizamos: garantizamos solo las columnas definidas
-                campos = lector.fieldnames or _campos_csv_para(filepath)
-                datos: List[Dict[str, Any]] = []
-                for fila in lector:
-                    # Conservar solo campos conocidos y convertir a str
-                    limpio = {k: str(fila.get(k, "")).strip() for k in campos}
-                    datos.append(limpio)
-                return datos
+        return _leer_csv_tuplas(filepath)
+    except (FileNotFoundError, UnicodeDecodeError):
+        return []
+
+
+def cargar_muchos(filepaths: Sequence[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Carga varios archivos a la vez, leyendo en paralelo los que no están en caché.
 
+    Los archivos sin cambios (o con escrituras pendientes de un lote) se
+    resuelven al instante; el resto se parsea en un pool de hilos, de modo
+    que el tiempo total se acerca al de la lectura más lenta.
+
+    Args:
+        filepaths: Rutas a cargar (los duplicados se leen una sola vez).
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Ruta -> datos, como cargar_datos().
+    """
+    resultado: Dict[str, List[Dict[str, Any]]] = dict.fromkeys(filepaths)  # type: ignore[arg-type]
+    por_leer: List[str] = []
+    for ruta in resultado:
+        clave = _clave_ruta(ruta)
+        firma = _firma(ruta)
+        hit = _CACHE_LECTURA.get(clave)
+        en_cache = hit is not None and hit[0] == firma
+        if clave in _PENDIENTES or firma is None or en_cache:
+            resultado[ruta] = cargar_datos(ruta)
+        else:
+            por_leer.append(ruta)
+
+    if len(por_leer) == 1:
+        resultado[por_leer[0]] = cargar_datos(por_leer[0])
+    elif por_leer:
+        hilos = min(_MAX_HILOS_LECTURA, len(por_leer))
+        with ThreadPoolExecutor(max_workers=hilos) as pool:
+            resultado.update(zip(por_leer, pool.map(cargar_datos, por_leer)))
+    return resultado
+
+
+def _leer_archivo(filepath: str, tamano: int = 0) -> List[Dict[str, Any]]:
+    """Lee y parsea el archivo CSV o JSON (sin caché).
+
+    Args:
+        filepath: Ruta del archivo a leer (ya inicializado).
+        tamano: Tamaño conocido del archivo en bytes (decide si usar mmap).
+
+    Returns:
+        List[Dict[str, Any]]: Datos leídos; [] si es ilegible o no soportado.
+    """
+    try:
+        if _es_csv(filepath):
+            return _leer_csv(filepath)
         if _es_json(filepath):
-            with open(filepath, mode="r", encoding="utf-8") as json_file:
-                datos = json.load(json_file)
-                return datos if isinstance(datos, list) else []
-    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
-        # En caso de archivo corrupto o ilegible, devolvemos lista vacía.
+            return _leer_json(filepath, tamano)
+    except (FileNotFoundError, *_ERRORES_ILEGIBLE):
+        # En caso de archivo corrupto o ilegible (o gzip/zstd truncado), lista vacía.
         return []
 
     # Formato no soportado
     return []
 
 
-def guardar_datos(filepath: str, datos: List[Dict[str, Any]]) -> None:
+def _leer_csv(filepath: str) -> List[Dict[str, Any]]:
+    """Parsea un CSV con cabecera a una lista de dicts de str sin espacios.
+
+    Args:
+        filepath: Ruta del archivo CSV.
+
+    Returns:
+        List[Dict[str, Any]]: Filas con las columnas de la cabecera.
+    """
+    with open(filepath, mode="r", newline="", encoding="utf-8",
+              buffering=_TAM_BUFFER) as csv_file:
+        lector = csv.reader(csv_file)
+        # Normalizamos: garantizamos solo las columnas de la cabecera
+        campos = next(lector, None) or _campos_csv_para(filepath)
+        total = len(campos)
+        datos: List[Dict[str, Any]] = []
+        # Nombres locales: evitan búsquedas globales en el bucle
+        agregar, strip, _dict, _zip = datos.append, str.strip, dict, zip
+        if campos == CAMPOS_AUTORES:
+            # Esquema conocido: posiciones fijas y un dict literal por fila
+            for fila in lector:
+                if not fila:
+                    continue
+                if len(fila) < total:
+                    fila += [""] * (total - len(fila))
+                agregar({"id_autor": fila[0].strip(),
+                         "nombre_autor": fila[1].strip(),
+                         "email": fila[2].strip(),
+                         "password_hash": fila[3].strip()})
+            return datos
+        for fila in lector:
+            if not fila:
+                continue  # Línea en blanco (igual que DictReader)
+            if len(fila) < total:
+                fila += [""] * (total - len(fila))
+            # zip descarta celdas sobrantes; los valores ya son str
+            agregar(_dict(_zip(campos, map(strip, fila))))
+        return datos
+
+
+def _leer_csv_tuplas(filepath: str) -> List[Autor]:
+    """Parsea un CSV de autores directamente a tuplas Autor.
+
+    Las columnas se ubican por la cabecera; las que falten quedan en "".
+
+    Args:
+        filepath: Ruta del archivo CSV.
+
+    Returns:
+        List[Autor]: Filas con valores str sin espacios.
+    """
+    with open(filepath, mode="r", newline="", encoding="utf-8",
+              buffering=_TAM_BUFFER) as csv_file:
+        lector = csv.reader(csv_file)
+        cabecera = next(lector, None) or CAMPOS_AUTORES
+        total = len(cabecera)
+        posiciones = [cabecera.index(c) if c in cabecera else None
+                      for c in CAMPOS_AUTORES]
+        directo = posiciones == list(range(len(CAMPOS_AUTORES)))
+        datos: List[Autor] = []
+        agregar, crear, strip = datos.append, Autor._make, str.strip
+        for fila in lector:
+            if not fila:
+                continue
+            if len(fila) < total:
+                fila += [""] * (total - len(fila))
+            if directo:
+                agregar(crear(map(strip, fila[:len(posiciones)])))
+            else:
+                agregar(crear("" if i is None else fila[i].strip()
+                              for i in posiciones))
+        return datos
+
+
+def _leer_json(filepath: str, tamano: int = 0) -> List[Dict[str, Any]]:
+    """Parsea un JSON; si no contiene una lista devuelve [].
+
+    Args:
+        filepath: Ruta del archivo JSON.
+        tamano: Tamaño del archivo; desde _UMBRAL_MMAP se usa mmap con orjson.
+
+    Returns:
+        List[Dict[str, Any]]: Lista leída.
+
+    Raises:
+        json.JSONDecodeError: Si el contenido no es JSON válido.
+    """
+    compresion = _compresion(filepath)
+    if compresion is not None:
+        with open(filepath, mode="rb", buffering=_TAM_BUFFER) as json_file:
+            contenido = _descomprimir(json_file.read(), compresion)
+        datos = (orjson.loads(contenido) if orjson is not None
+                 else json.loads(contenido))
+    elif orjson is not None and tamano >= _UMBRAL_MMAP:
+        # El kernel pagina bajo demanda y orjson parsea la vista sin copiarla
+        with open(filepath, mode="rb") as json_file:
+            fd = json_file.fileno()
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapa, \
+                    memoryview(mapa) as vista:
+                datos = orjson.loads(vista)
+    elif orjson is not None:
+        with open(filepath, mode="rb", buffering=_TAM_BUFFER) as json_file:
+            datos = orjson.loads(json_file.read())
+    else:
+        with open(filepath, mode="r", encoding="utf-8",
+                  buffering=_TAM_BUFFER) as json_file:
+            datos = json.load(json_file)
+    return datos if isinstance(datos, list) else []
+
+
+def guardar_datos(filepath: str, datos: List[Dict[str, Any]], indentar: bool = True,
+                  diferir: bool = False) -> None:
     """Guarda una lista de diccionarios en CSV o JSON.
 
     - CSV: cabeceras fijas, valores convertidos a str, escritura atómica.
-    - JSON: escritura atómica con indentación y UTF-8.
+    - JSON: escritura atómica en UTF-8, con indentación salvo indentar=False.
+    - .json.gz / .json.zst: el mismo documento comprimido (zstd es opcional).
+    - Dentro de lote(): no escribe; guarda los datos hasta cerrar el lote
+      (el volcado final usa la indentación por defecto).
+    - Con diferir=True: guarda los datos en memoria y escribe una sola vez
+      cuando pasan _DEMORA_DIFERIDA segundos sin otro guardado de la ruta
+      (o al llamar volcar_pendientes()), con la indentación por defecto.
 
     Args:
         filepath: Ruta del archivo a escribir.
         datos: Lista de diccionarios a persistir.
+        indentar: Solo JSON; False escribe compacto (más rápido de codificar).
+        diferir: Agrupar guardados seguidos en una única escritura.
 
     Returns:
         None
     """
-    if _es_csv(filepath):
-        campos = _campos_csv_para(filepath)
-        # Construimos el contenido CSV en memoria para escritura atómica.
+    clave = _clave_ruta(filepath)
+    if clave in _LOTES:
+        _PENDIENTES[clave] = datos
+        return
+    if diferir:
+        with _CERROJO_DIFERIDO:
+            _cancelar_diferido(clave)
+            _PENDIENTES[clave] = datos
+            temporizador = threading.Timer(_DEMORA_DIFERIDA, _volcar_diferido,
+                                           args=(clave,))
+            temporizador.daemon = True
+            _TEMPORIZADORES[clave] = temporizador
+            temporizador.start()
+        return
+    with _CERROJO_DIFERIDO:
+        # Bajo el cerrojo: un volcado diferido en curso termina antes, y no
+        # puede pisar después esta escritura con datos más viejos.
+        if _TEMPORIZADORES:
+            _cancelar_diferido(clave)  # Esta escritura reemplaza a la diferida
+        _escribir(filepath, clave, datos, indentar)
 
 
-        buffer = StringIO()
-        writer = csv.DictWriter(buffer, fieldnames=campos)
-        writer.writeheader()
+def _escribir(filepath: str, clave: str, datos: List[Dict[str, Any]],
+              indentar: bool) -> None:
+    """Escribe el archivo completo de forma atómica (sin lotes ni diferidos).
+
+    Args:
+        filepath: Ruta del archivo a escribir.
+        clave: Ruta absoluta (_clave_ruta) del archivo.
+        datos: Lista de diccionarios a persistir.
+        indentar: Solo JSON; False escribe compacto.
 
-        for item in datos or []:
-            fila = {k: str(item.get(k, "") if item.get(k, "") is not None else "")
-                    for k in campos}
-            writer.writerow(fila)
+    Returns:
+        None
+    """
+    # Los datos escritos pueden diferir de lo que devolvería una relectura
+    # (CSV: solo columnas conocidas y str), así que se descarta la caché.
+    _CACHE_LECTURA.pop(clave, None)
+    # La ruta absoluta ya calculada evita otro abspath (getcwd) al escribir.
+    directorio = os.path.dirname(clave)
 
-        _escritura_atomica(filepath, buffer.getvalue(), modo_binario=False)
+    if _es_csv(filepath):
+        campos = _campos_csv_para(filepath)
+        if campos == CAMPOS_AUTORES:
+            # Esquema fijo: cada fila se arma como bytes sin pasar por csv.writer.
+            with _archivo_atomico(clave, modo_binario=True,
+                                  directorio=directorio) as tmp:
+                tmp.write(_CABECERA_AUTORES)
+                tmp.writelines(map(_fila_csv_bytes, datos or []))
+            return
+        # Filas posicionales escritas directo al temporal (sin StringIO ni dicts).
+        with _archivo_atomico(clave, directorio=directorio) as tmp:
+            writer = csv.writer(tmp)
+            writer.writerow(campos)
+            writer.writerows(_fila_csv(item, campos) for item in datos or [])
         return
 
     if _es_json(filepath):
-        # Dump JSON con indentación y UTF-8 sin escape
-        contenido = json.dumps(datos or [], ensure_ascii=False, indent=4)
-        _escritura_atomica(filepath, contenido, modo_binario=False)
+        # Documento completo en memoria y una sola escritura: json.dumps usa
+        # el codificador en C, mientras que json.dump (por partes) recorre la
+        # estructura en Python y resulta varias veces más lento.
+        contenido = _serializar_json(datos or [], indentar)
+        compresion = _compresion(filepath)
+        if compresion is not None:
+            # La sangría casi no ocupa una vez comprimida: se conserva.
+            contenido = _comprimir(contenido, compresion)
+        _escritura_atomica(clave, contenido, modo_binario=True,
+                           directorio=directorio)
         return
+
+
+def _anexar_json(filepath: str, registro: Dict[str, Any]) -> None:
+    """Agrega un registro al final de la lista JSON sin reescribir el archivo.
+
+    Sobrescribe en sitio solo el corchete de cierre con el nuevo elemento y
+    hace fsync. Si la escritura falla, restaura el cierre original y deja
+    el archivo como estaba; un corte de energía a mitad puede dejarlo
+    truncado, y entonces anexar_registro() se niega a reescribirlo.
+
+    Args:
+        filepath: Ruta del archivo JSON.
+        registro: Diccionario a agregar.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: Si el archivo no termina en una lista JSON.
+    """
+    sangria = b" " * _SANGRIA_JSON
+    elemento = b"\n".join(sangria + linea
+                          for linea in _serializar_json(registro).splitlines())
+
+    with open(filepath, mode="r+b") as json_file:
+        json_file.seek(0, os.SEEK_END)
+        fin = json_file.tell()
+        inicio_cola = max(0, fin - 4096)
+        json_file.seek(inicio_cola)
+        cola_original = json_file.read()
+        cola = cola_original.rstrip()
+        if not cola.endswith(b"]"):
+            raise ValueError("El archivo JSON no termina en una lista.")
+        previo = cola[:-1].rstrip()
+        if not previo or previo[-1:] not in (b"[", b"}"):
+            raise ValueError("Final de lista JSON no reconocido.")
+        separador = b"\n" if previo.endswith(b"[") else b",\n"
+
+        corte = inicio_cola + len(previo)
+        try:
+            json_file.seek(corte)
+            json_file.write(separador + elemento + b"\n]")
+            json_file.truncate()
+            json_file.flush()
+            os.fsync(json_file.fileno())
+        except BaseException:
+            # Vuelve al tamaño y cierre previos: la lista sigue siendo válida.
+            json_file.seek(corte)
+            json_file.write(cola_original[len(previo):])
+            json_file.truncate()
+            json_file.flush()
+            os.fsync(json_file.fileno())
+            raise
+
+
+def _leer_json_para_reescribir(filepath: str) -> List[Dict[str, Any]]:
+    """Lee un JSON que se va a reescribir entero, sin tomar lo ilegible por [].
+
+    cargar_datos() devuelve [] ante un archivo corrupto; reescribir a partir
+    de eso borraría los registros que aún se podrían recuperar a mano.
+
+    Args:
+        filepath: Ruta del archivo JSON (ya inicializado).
+
+    Returns:
+        List[Dict[str, Any]]: Datos actuales ([] si el archivo está vacío).
+
+    Raises:
+        ValueError: Si el archivo existe pero no se puede parsear.
+    """
+    tamano = os.path.getsize(filepath)
+    if not tamano:
+        return []
+    try:
+        return _leer_json(filepath, tamano)
+    except _ERRORES_ILEGIBLE as exc:
+        raise ValueError(f"No se pudo leer {filepath}; no se sobrescribe.") from exc
+
+
+def anexar_registro(filepath: str, registro: Dict[str, Any]) -> None:
+    """Agrega un único registro al final del archivo (CSV o JSON).
+
+    Evita reescribir todos los registros previos en cada alta:
+    - CSV: agrega una fila con las cabeceras fijas.
+    - JSON: reemplaza el cierre de la lista por el nuevo elemento.
+    Si el JSON no tiene la forma esperada o está comprimido (.json.gz,
+    .json.zst), recurre a guardar_datos().
+    Dentro de lote() o con una escritura diferida en espera, el registro se
+    suma al contenido pendiente.
+
+    Args:
+        filepath: Ruta del archivo de datos.
+        registro: Diccionario a agregar.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: Si el JSON está corrupto (no se reescribe para no perderlo).
+    """
+    clave = _clave_ruta(filepath)
+    # Bajo el cerrojo, como guardar_datos(): un volcado diferido en curso no
+    # puede reemplazar el archivo justo después de agregar el registro.
+    with _CERROJO_DIFERIDO:
+        if clave in _LOTES or clave in _TEMPORIZADORES:
+            datos = cargar_datos(filepath)
+            datos.append(registro)
+            guardar_datos(filepath, datos, diferir=clave in _TEMPORIZADORES)
+            return
+
+        _CACHE_LECTURA.pop(clave, None)
+        inicializar_archivo(clave)
+
+        if _es_csv(filepath):
+            campos = _campos_csv_para(filepath)
+            with open(filepath, mode="a", newline="", encoding="utf-8",
+                      buffering=_TAM_BUFFER) as csv_file:
+                csv.writer(csv_file).writerow(_fila_csv(registro, campos))
+            return
+
+        if _es_json(filepath):
+            if _compresion(filepath) is None:
+                try:
+                    _anexar_json(filepath, registro)
+                    return
+                except ValueError:
+                    pass
+            # Comprimido o con forma inesperada: se reescribe el documento entero,
+            # salvo que no se pueda leer (se perderían los registros previos).
+            datos = _leer_json_para_reescribir(clave)
+            datos.append(registro)
+            guardar_datos(filepath, datos)
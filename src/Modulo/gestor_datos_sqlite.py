@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Persistencia de Datos sobre SQLite.
+
+Alternativa a `gestor_datos` con la misma API pública, pero guardando cada
+colección en una base SQLite: los autores en una tabla con columnas fijas y
+el resto (posts) como documentos JSON indexados por su id. El tipo de
+colección se indica con el parámetro `autores` (o se toma de la base). Así un alta o una
+modificación escribe solo la fila afectada en lugar de reescribir el archivo.
+Los archivos CSV/JSON se pueden importar y exportar con `gestor_datos`.
+"""
+import json  # Documentos JSON dentro de la base
+import os  # Operaciones con rutas y sistema de archivos
+import sqlite3  # Motor de base de datos embebido (biblioteca estándar)
+import threading  # Una conexión por hilo
+from typing import Any, Dict, List, Optional, Tuple  # Anotaciones de tipos
+
+import gestor_datos  # Import/export desde CSV y JSON
+
+# Columnas de la tabla de autores (mismas cabeceras que el CSV).
+CAMPOS_AUTORES = gestor_datos.CAMPOS_AUTORES
+
+# Ajustes por conexión: WAL permite leer mientras se escribe y NORMAL evita
+# un fsync por transacción (sigue siendo seguro ante caídas del proceso).
+_PRAGMAS = ("PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL")
+
+# Altas planas: guardar_datos() conserva los registros tal cual, incluso con
+# ids repetidos (como los archivos de `gestor_datos`).
+_SQL_INSERTAR_AUTOR = (
+    f"INSERT INTO autores ({', '.join(CAMPOS_AUTORES)}) "
+    f"VALUES ({', '.join('?' * len(CAMPOS_AUTORES))})"
+)
+_SQL_INSERTAR_DOCUMENTO = "INSERT INTO documentos (id, datos) VALUES (?, ?)"
+# Ediciones por id: afectan solo a la primera fila con ese id (la que usan
+# los índices del modelo), sin cambiar su posición.
+_SQL_ACTUALIZAR_AUTOR = (
+    "UPDATE autores SET "
+    + ", ".join(f"{c} = ?" for c in CAMPOS_AUTORES[1:])
+    + " WHERE fila = (SELECT MIN(fila) FROM autores WHERE id_autor = ?)"
+)
+_SQL_ACTUALIZAR_DOCUMENTO = (
+    "UPDATE documentos SET datos = ? "
+    "WHERE fila = (SELECT MIN(fila) FROM documentos WHERE id = ?)"
+)
+
+# Tabla de cada tipo de colección: (nombre, columna del id, DDL).
+_TABLAS = {
+    True: ("autores", "id_autor", (
+        "CREATE TABLE IF NOT EXISTS autores (fila INTEGER PRIMARY KEY, "
+        + ", ".join(f"{c} TEXT NOT NULL DEFAULT ''" for c in CAMPOS_AUTORES)
+        + ")",
+        "CREATE INDEX IF NOT EXISTS autores_id ON autores (id_autor)",
+    )),
+    # id puede ser NULL (documentos sin id_post).
+    False: ("documentos", "id", (
+        "CREATE TABLE IF NOT EXISTS documentos (fila INTEGER PRIMARY KEY, "
+        "id TEXT, datos TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS documentos_id ON documentos (id)",
+    )),
+}
+
+# Estado del hilo actual: ruta absoluta -> conexión, y ruta absoluta -> tipo
+# de colección ya resuelto (True = autores) con su tabla creada.
+_LOCAL = threading.local()
+
+
+def _conexion(filepath: str) -> sqlite3.Connection:
+    """Devuelve la conexión del hilo actual a la base, creándola si falta.
+
+    Args:
+        filepath: Ruta de la base de datos.
+
+    Returns:
+        sqlite3.Connection: Conexión abierta (sin crear tablas).
+    """
+    conexiones: Optional[Dict[str, sqlite3.Connection]] = getattr(
+        _LOCAL, "conexiones", None
+    )
+    if conexiones is None:
+        conexiones = _LOCAL.conexiones = {}
+        _LOCAL.tipos = {}
+    clave = os.path.abspath(filepath)
+    conn = conexiones.get(clave)
+    if conn is not None:
+        return conn
+
+    directorio = os.path.dirname(clave)
+    os.makedirs(directorio, exist_ok=True)
+    conn = sqlite3.connect(clave)
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    conexiones[clave] = conn
+    return conn
+
+
+def _coleccion(filepath: str, autores: Optional[bool]) \
+        -> Tuple[sqlite3.Connection, bool]:
+    """Abre la base y resuelve qué colección guarda, creando su tabla.
+
+    El tipo no se deduce del nombre del archivo: lo indica quien llama o,
+    con autores=None, se toma de la tabla que la base ya tiene (una base
+    nueva guarda documentos).
+
+    Args:
+        filepath: Ruta de la base de datos.
+        autores: True para autores, False para documentos, None para usar
+            el tipo de la base.
+
+    Returns:
+        Tuple[sqlite3.Connection, bool]: Conexión y si la colección es de autores.
+
+    Raises:
+        ValueError: Si se pide un tipo distinto del que la base ya guarda.
+    """
+    conn = _conexion(filepath)
+    tipos: Dict[str, bool] = _LOCAL.tipos
+    clave = os.path.abspath(filepath)
+    conocido = tipos.get(clave)
+    if conocido is not None and autores in (None, conocido):
+        return conn, conocido
+
+    existentes = {nombre for (nombre,) in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table'")}
+    if autores is None:
+        autores = "autores" in existentes
+    elif _TABLAS[not autores][0] in existentes:
+        raise ValueError(f"La base {filepath} ya guarda otra colección.")
+    with conn:
+        for sentencia in _TABLAS[autores][2]:
+            conn.execute(sentencia)
+    tipos[clave] = autores
+    return conn, autores
+
+
+def cerrar(filepath: Optional[str] = None) -> None:
+    """Cierra las conexiones abiertas por el hilo actual.
+
+    Args:
+        filepath: Base a cerrar; None cierra todas.
+
+    Returns:
+        None
+    """
+    conexiones: Dict[str, sqlite3.Connection] = getattr(_LOCAL, "conexiones", {})
+    claves = list(conexiones) if filepath is None else [os.path.abspath(filepath)]
+    for clave in claves:
+        conn = conexiones.pop(clave, None)
+        if conn is not None:
+            conn.close()
+        getattr(_LOCAL, "tipos", {}).pop(clave, None)
+
+
+def _fila_autor(registro: Dict[str, Any]) -> List[str]:
+    """Convierte un autor en la tupla de columnas de la tabla.
+
+    Args:
+        registro: Diccionario del autor.
+
+    Returns:
+        List[str]: Valores en el orden de CAMPOS_AUTORES (None -> "").
+    """
+    return ["" if (v := registro.get(c)) is None else str(v) for c in CAMPOS_AUTORES]
+
+
+def _fila_documento(registro: Dict[str, Any]) -> tuple:
+    """Convierte un post en (id, json) para la tabla de documentos.
+
+    Args:
+        registro: Diccionario del post.
+
+    Returns:
+        tuple: id_post como texto (o None) y el documento serializado.
+    """
+    id_doc = registro.get("id_post")
+    return (None if id_doc is None else str(id_doc),
+            json.dumps(registro, ensure_ascii=False))
+
+
+def inicializar_archivo(filepath: str, *, autores: Optional[bool] = None) -> None:
+    """Crea la base y su tabla si no existen.
+
+    Args:
+        filepath: Ruta de la base de datos.
+        autores: Tipo de colección (ver _coleccion).
+
+    Returns:
+        None
+    """
+    _coleccion(filepath, autores)
+
+
+def cargar_datos(filepath: str, *, autores: Optional[bool] = None) \
+        -> List[Dict[str, Any]]:
+    """Carga todos los registros de la base en orden de alta.
+
+    Args:
+        filepath: Ruta de la base de datos.
+        autores: Tipo de colección (ver _coleccion).
+
+    Returns:
+        List[Dict[str, Any]]: Lista de registros; [] si la base está vacía.
+    """
+    conn, autores = _coleccion(filepath, autores)
+    if autores:
+        cursor = conn.execute(
+            f"SELECT {', '.join(CAMPOS_AUTORES)} FROM autores ORDER BY fila"
+        )
+        return [dict(zip(CAMPOS_AUTORES, fila)) for fila in cursor]
+    cursor = conn.execute("SELECT datos FROM documentos ORDER BY fila")
+    return [json.loads(datos) for (datos,) in cursor]
+
+
+def guardar_datos(filepath: str, datos: List[Dict[str, Any]], *,
+                  autores: Optional[bool] = None) -> None:
+    """Reemplaza todo el contenido de la base en una sola transacción.
+
+    Los registros se guardan tal cual y en orden, aunque repitan un id.
+    Para cambios puntuales conviene guardar_registro()/eliminar_registro(),
+    que solo tocan la fila afectada.
+
+    Args:
+        filepath: Ruta de la base de datos.
+        datos: Lista de registros a persistir.
+        autores: Tipo de colección (ver _coleccion).
+
+    Returns:
+        None
+    """
+    conn, autores = _coleccion(filepath, autores)
+    with conn:
+        if autores:
+            conn.execute("DELETE FROM autores")
+            conn.executemany(_SQL_INSERTAR_AUTOR, map(_fila_autor, datos or []))
+        else:
+            conn.execute("DELETE FROM documentos")
+            conn.executemany(_SQL_INSERTAR_DOCUMENTO,
+                             map(_fila_documento, datos or []))
+
+
+def anexar_registro(filepath: str, registro: Dict[str, Any], *,
+                    autores: Optional[bool] = None) -> None:
+    """Agrega (o actualiza, si el id ya existe) un único registro.
+
+    Args:
+        filepath: Ruta de la base de datos.
+        registro: Diccionario a agregar.
+        autores: Tipo de colección (ver _coleccion).
+
+    Returns:
+        None
+    """
+    guardar_registro(filepath, registro, autores=autores)
+
+
+def guardar_registro(filepath: str, registro: Dict[str, Any], *,
+                     autores: Optional[bool] = None) -> None:
+    """Actualiza la primera fila con el id del registro o, si no hay, lo agrega.
+
+    Args:
+        filepath: Ruta de la base de datos.
+        registro: Diccionario con id_autor (autores) o id_post (posts).
+        autores: Tipo de colección (ver _coleccion).
+
+    Returns:
+        None
+    """
+    conn, autores = _coleccion(filepath, autores)
+    with conn:
+        if autores:
+            fila = _fila_autor(registro)
+            cursor = conn.execute(_SQL_ACTUALIZAR_AUTOR, fila[1:] + fila[:1])
+            if not cursor.rowcount:
+                conn.execute(_SQL_INSERTAR_AUTOR, fila)
+        else:
+            id_doc, documento = _fila_documento(registro)
+            cursor = conn.execute(_SQL_ACTUALIZAR_DOCUMENTO, (documento, id_doc))
+            if not cursor.rowcount:
+                conn.execute(_SQL_INSERTAR_DOCUMENTO, (id_doc, documento))
+
+
+def eliminar_registro(filepath: str, id_registro: Any, *,
+                      autores: Optional[bool] = None) -> bool:
+    """Elimina la primera fila con el id indicado.
+
+    Args:
+        filepath: Ruta de la base de datos.
+        id_registro: id_autor o id_post del registro.
+        autores: Tipo de colección (ver _coleccion).
+
+    Returns:
+        bool: True si se eliminó una fila; False si no existía.
+    """
+    conn, autores = _coleccion(filepath, autores)
+    tabla, columna, _ = _TABLAS[autores]
+    with conn:
+        cursor = conn.execute(
+            f"DELETE FROM {tabla} WHERE fila = "
+            f"(SELECT MIN(fila) FROM {tabla} WHERE {columna} = ?)",
+            (str(id_registro),))
+    return cursor.rowcount > 0
+
+
+def importar(origen: str, destino: str, *, autores: Optional[bool] = None) -> int:
+    """Copia un archivo CSV/JSON de `gestor_datos` a una base SQLite.
+
+    Args:
+        origen: Ruta del archivo CSV o JSON.
+        destino: Ruta de la base de datos.
+        autores: Tipo de colección; None lo deduce del origen (el único CSV
+            que maneja `gestor_datos` es el de autores).
+
+    Returns:
+        int: Cantidad de registros importados.
+    """
+    if autores is None:
+        autores = origen.lower().endswith(".csv")
+    datos = gestor_datos.cargar_datos(origen)
+    guardar_datos(destino, datos, autores=autores)
+    return len(datos)
+
+
+def exportar(origen: str, destino: str, *, autores: Optional[bool] = None) -> int:
+    """Vuelca una base SQLite a un archivo CSV/JSON de `gestor_datos`.
+
+    Args:
+        origen: Ruta de la base de datos.
+        destino: Ruta del archivo CSV o JSON.
+        autores: Tipo de colección (ver _coleccion).
+
+    Returns:
+        int: Cantidad de registros exportados.
+    """
+    datos = cargar_datos(origen, autores=autores)
+    gestor_datos.guardar_datos(destino, datos)
+    return len(datos)
@@ -18,10 +18,16 @@ from __future__ import (
 )
 
 # NUEVO: hashing de contraseñas (en memoria)
-import hashlib  # Hashing (SHA-256) para proteger contraseñas
+import functools  # Memorizar encabezados de pantalla
+import hashlib  # Hashing (scrypt; SHA-256 para hashes antiguos) de contraseñas
+import hmac  # Comparación en tiempo constante de hashes
 import os  # Manejo de rutas y sistema de archivos
 import secrets  # Generación de valores aleatorios seguros (salts)
-from typing import Any, Dict, List, Optional  # Tipos auxiliares para anotar firmas
+import sys  # Detectar entrada por tubería (modo guion)
+import time  # Medición de tiempos al calibrar Argon2
+from collections import Counter  # Conteo de tags
+from concurrent.futures import Future, ThreadPoolExecutor  # Hash en segundo plano
+from typing import Any, Dict, List, Optional, Tuple  # Tipos para anotar firmas
 
 import blog_multi_usuario as modelo  # Lógica de negocio (modelo del dominio)
 import gestor_datos  # Persistencia (lectura/escritura CSV/JSON)
@@ -34,11 +40,86 @@ from rich.prompt import Confirm, Prompt  # Prompts interactivos (texto y confirm
 from rich.table import Table  # Tablas con estilos y columnas
 from rich.text import Text  # Texto con estilos
 
+try:
+    import argon2  # Hash Argon2id de contraseñas (opcional, extra "seguro")
+except ImportError:  # pragma: no cover - depende del entorno
+    argon2 = None
+
+try:
+    import termios  # Modo de terminal para leer una tecla sin Enter (POSIX)
+    import tty  # Modo cbreak (POSIX)
+except ImportError:  # pragma: no cover - depende de la plataforma
+    termios = tty = None
+
+try:
+    import msvcrt  # Lectura de una tecla sin Enter (Windows)
+except ImportError:  # pragma: no cover - depende de la plataforma
+    msvcrt = None
+
 console = Console()
 
 # --- Constantes (evitar valores mágicos) ---
 MIN_PASSWORD_LENGTH = 4
 RESUMEN_COMENTARIO_MAX = 80
+# Caracteres que se conservan al recortar (se reservan 3 para '...').
+_CORTE_COMENTARIO = RESUMEN_COMENTARIO_MAX - 3
+
+# Parámetros de scrypt (KDF con uso intensivo de memoria: ~32 MiB por hash).
+SCRYPT_N = 2**15
+SCRYPT_R = 8
+SCRYPT_P = 1
+SCRYPT_DKLEN = 32
+# Memoria máxima permitida a scrypt (128 * n * r más margen).
+_SCRYPT_MAXMEM = 64 * 1024 * 1024
+# Prefijo del formato "scrypt$<salt>$<n>$<r>$<p>$<hash_hex>".
+_PREFIJO_SCRYPT = "scrypt$"
+_PARTES_SCRYPT = 6
+
+# Argon2id (si argon2-cffi está instalado): 64 MiB (base de OWASP) y las
+# pasadas que quepan en ~300 ms en esta máquina, sin superar 800 ms por
+# verificación (3 intentos de login no deben congelar la consola).
+# Sus hashes empiezan por "$argon2".
+_PREFIJO_ARGON2 = "$argon2"
+ARGON2_MEMORIA_KIB = 64 * 1024
+_ARGON2_MEMORIA_MIN_KIB = 19 * 1024  # Mínimo recomendado por OWASP
+_ARGON2_OBJETIVO_S = 0.3
+_ARGON2_MAXIMO_S = 0.8
+_ARGON2_PASADAS_MAX = 10
+_ARGON2_MUESTRAS = 3  # Impar: la mediana es el valor central
+# Parámetros calibrados (se guardan junto a AUTORES_CSV) y hasher en uso:
+# ruta del archivo de parámetros -> argon2.PasswordHasher.
+_ARCHIVO_ARGON2 = "argon2.json"
+_ARGON2: Dict[str, Any] = {}
+
+
+# --- Estilos de paneles (títulos parseados una sola vez) ---
+_PANEL_ERROR = {
+    "border_style": "red",
+    "title": Text.from_markup("[bold red]Error[/bold red]"),
+}
+_PANEL_OK = {
+    "border_style": "green",
+    "title": Text.from_markup("[bold green]Éxito[/bold green]"),
+}
+_PANEL_AVISO = {
+    "border_style": "yellow",
+    "title": Text.from_markup("[bold yellow]Aviso[/bold yellow]"),
+}
+
+
+# Intentos de contraseña por inicio de sesión y el panel de error para cada
+# cantidad restante (índice = intentos que quedan).
+MAX_INTENTOS_LOGIN = 3
+_PANELES_INTENTO_FALLIDO = tuple(
+    Panel(
+        Text(f"Contraseña incorrecta. Intentos restantes: {i}", style="bright_red"),
+        **_PANEL_ERROR,
+    )
+    for i in range(MAX_INTENTOS_LOGIN)
+)
+
+# Sufijo común de los prompts de pedir() (Text ya armado, sin markup).
+_SUFIJO_SALIR = Text(" (0 para salir)", style="dim")
 
 
 # --- Cancelación de formularios ---
@@ -70,9 +151,10 @@ def pedir(
     Raises:
         Cancelado: Cuando el usuario ingresa "0".
     """
-    etiqueta = (
-        f"[magenta]{mensaje}[/magenta] [dim](0 para salir)[/dim]"
-    )
+    # Text en lugar de markup: Rich no reparsea la etiqueta y el mensaje se
+    # muestra literal (sin interpretar corchetes).
+    etiqueta = Text(mensaje, style="magenta")
+    etiqueta.append_text(_SUFIJO_SALIR)
     if default is None:
         raw = Prompt.ask(etiqueta, password=password)
     else:
@@ -100,13 +182,7 @@ def mostrar_advertencia(mensaje: str) -> None:
     Returns:
         None
     """
-    console.print(
-        Panel(
-            f"[yellow]{mensaje}[/yellow]",
-            border_style="yellow",
-            title="[bold yellow]Aviso[/bold yellow]",
-        )
-    )
+    console.print(Panel(f"[yellow]{mensaje}[/yellow]", **_PANEL_AVISO))
 
 
 def pedir_obligatorio(
@@ -145,42 +221,263 @@ def pedir_obligatorio(
         )
 
 
-def _hash_password(pwd: str, salt: Optional[str] = None) -> str:
+def _scrypt_hex(pwd: str, salt: bytes, n: int, r: int, p: int) -> str:
+    """
+    Deriva la clave scrypt de una contraseña.
+
+    Args:
+        pwd: Contraseña en texto plano.
+        salt: Salt en bytes.
+        n: Factor de costo (potencia de 2).
+        r: Tamaño de bloque.
+        p: Paralelismo.
+
+    Returns:
+        str: Clave derivada en hexadecimal.
+
+    Raises:
+        ValueError: Si los parámetros no son válidos.
+    """
+    return hashlib.scrypt(
+        pwd.encode("utf-8"), salt=salt, n=n, r=r, p=p,
+        maxmem=_SCRYPT_MAXMEM, dklen=SCRYPT_DKLEN,
+    ).hex()
+
+
+def _hash_password_sha256(pwd: str, salt: str) -> str:
     """
-    Genera un hash seguro (salt + SHA-256) para una contraseña.
+    Calcula el hash del formato antiguo (salt + SHA-256).
 
-    Formato devuelto: "<salt>$<hash_hex>".
+    Solo se usa para verificar contraseñas guardadas antes de scrypt.
 
     Args:
         pwd: Contraseña en texto plano.
-        salt: Salt hexadecimal opcional; si no se provee, se genera.
+        salt: Salt hexadecimal.
 
     Returns:
-        str: Cadena con el salt y el hash concatenados.
+        str: Cadena "<salt>$<hash_hex>".
     """
-    if salt is None:
-        salt = secrets.token_hex(16)
-    h = hashlib.sha256()
-    h.update((salt + pwd).encode("utf-8"))
+    # Dos update() equivalen a hashear salt + pwd sin armar la concatenación
+    h = hashlib.sha256(salt.encode("utf-8"))
+    h.update(pwd.encode("utf-8"))
     return f"{salt}${h.hexdigest()}"
 
 
+def _tiempo_verificacion(hasher: Any) -> float:
+    """
+    Mide la mediana de varias verificaciones Argon2 con un hasher dado.
+
+    Args:
+        hasher: argon2.PasswordHasher a medir.
+
+    Returns:
+        float: Segundos por verificación.
+    """
+    muestra = hasher.hash("calibracion")
+    tiempos = []
+    for _ in range(_ARGON2_MUESTRAS):
+        inicio = time.perf_counter()
+        hasher.verify(muestra, "calibracion")
+        tiempos.append(time.perf_counter() - inicio)
+    # Mediana sin importar statistics (cuesta ~4 ms al arrancar)
+    return sorted(tiempos)[len(tiempos) // 2]
+
+
+def _calibrar_argon2() -> Dict[str, int]:
+    """
+    Elige los parámetros Argon2id para esta máquina.
+
+    Estima las pasadas (time_cost) que entran en _ARGON2_OBJETIVO_S a partir
+    de una medición con una sola pasada, y baja pasadas (y luego memoria)
+    hasta que la verificación no supere _ARGON2_MAXIMO_S.
+
+    Returns:
+        Dict[str, int]: time_cost, memory_cost (KiB) y parallelism.
+    """
+    memoria = ARGON2_MEMORIA_KIB
+    una = _tiempo_verificacion(
+        argon2.PasswordHasher(time_cost=1, memory_cost=memoria, parallelism=1)
+    )
+    pasadas = max(1, min(_ARGON2_PASADAS_MAX, int(_ARGON2_OBJETIVO_S / una)))
+    while True:
+        params = {"time_cost": pasadas, "memory_cost": memoria, "parallelism": 1}
+        if _tiempo_verificacion(argon2.PasswordHasher(**params)) <= _ARGON2_MAXIMO_S:
+            return params
+        if pasadas > 1:
+            pasadas -= 1
+        elif memoria // 2 >= _ARGON2_MEMORIA_MIN_KIB:
+            memoria //= 2
+        else:
+            return params
+
+
+def _argon2() -> Optional[Any]:
+    """
+    Devuelve el hasher Argon2id calibrado, creándolo la primera vez.
+
+    Los parámetros se leen de _ARCHIVO_ARGON2 (junto a AUTORES_CSV) o, si no
+    existe, se calibran y se guardan ahí. Cada hash lleva sus parámetros, así
+    que cambiarlos no invalida contraseñas ya guardadas.
+
+    Returns:
+        Optional[argon2.PasswordHasher]: Hasher, o None sin argon2-cffi.
+    """
+    if argon2 is None:
+        return None
+    ruta = os.path.join(os.path.dirname(AUTORES_CSV), _ARCHIVO_ARGON2)
+    hasher = _ARGON2.get(ruta)
+    if hasher is not None:
+        return hasher
+    guardados = gestor_datos.cargar_datos(ruta) if os.path.exists(ruta) else []
+    if guardados:
+        params = {k: int(v) for k, v in guardados[0].items()}
+    else:
+        params = _calibrar_argon2()
+        gestor_datos.guardar_datos(ruta, [params])
+    hasher = _ARGON2[ruta] = argon2.PasswordHasher(**params)
+    return hasher
+
+
+def _hash_password(pwd: str, salt: Optional[str] = None) -> str:
+    """
+    Genera un hash seguro (Argon2id o scrypt, con salt) para una contraseña.
+
+    Con argon2-cffi instalado se usa Argon2id (formato PHC "$argon2id$...").
+    Si no, o si se fija el salt, se usa scrypt con el formato
+    "scrypt$<salt>$<n>$<r>$<p>$<hash_hex>". Ambos guardan los parámetros,
+    lo que permite endurecerlos más adelante sin invalidar hashes viejos.
+
+    Args:
+        pwd: Contraseña en texto plano.
+        salt: Salt hexadecimal opcional (solo scrypt); si no, se genera.
+
+    Returns:
+        str: Cadena con el esquema, el salt, los parámetros y el hash.
+    """
+    hasher = _argon2() if salt is None else None
+    if hasher is not None:
+        return hasher.hash(pwd)
+    # Salt generado directamente en bytes; el hex solo se usa para guardarlo
+    salt_b = secrets.token_bytes(16) if salt is None else bytes.fromhex(salt)
+    dk = _scrypt_hex(pwd, salt_b, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    return (f"{_PREFIJO_SCRYPT}{salt_b.hex()}$"
+            f"{SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${dk}")
+
+
+# Un hilo para derivar hashes: scrypt libera el GIL, así la consola sigue
+# respondiendo (y se puede escribir en disco) mientras se calcula.
+_HASH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hash")
+
+
+def _hash_password_async(pwd: str) -> Future:
+    """
+    Inicia el cálculo del hash de una contraseña en segundo plano.
+
+    Args:
+        pwd: Contraseña en texto plano.
+
+    Returns:
+        Future: Resultado futuro de _hash_password(pwd).
+    """
+    return _HASH_POOL.submit(_hash_password, pwd)
+
+
+def _esperar_hash(futuro: Future) -> str:
+    """
+    Espera el hash iniciado con _hash_password_async mostrando un indicador.
+
+    Args:
+        futuro: Cálculo en curso.
+
+    Returns:
+        str: Hash de la contraseña.
+    """
+    with console.status("[cyan]Protegiendo la contraseña...[/cyan]"):
+        return futuro.result()
+
+
 def _verify_password(stored: str, pwd: str) -> bool:
     """
     Verifica una contraseña comparándola con un hash almacenado.
 
+    Acepta Argon2id (si argon2-cffi está instalado), el formato scrypt y el
+    antiguo "<salt>$<hash_hex>" (SHA-256) de cuentas creadas antes del cambio.
+
     Args:
-        stored: Valor almacenado con formato "<salt>$<hash_hex>".
+        stored: Valor almacenado (Argon2id, scrypt o "<salt>$<hash_hex>").
         pwd: Contraseña en texto plano a validar.
 
     Returns:
         bool: True si coincide; False en caso contrario.
     """
     try:
-        salt, _ = stored.split("$", 1)
+        if stored.startswith(_PREFIJO_ARGON2):
+            hasher = _argon2()
+            if hasher is None:
+                raise ValueError("Hash Argon2 sin argon2-cffi instalado.")
+            try:
+                return hasher.verify(stored, pwd)
+            except argon2.exceptions.VerificationError:
+                return False
+        if stored.startswith(_PREFIJO_SCRYPT):
+            partes = stored.split("$")
+            if len(partes) != _PARTES_SCRYPT:
+                raise ValueError("Formato scrypt inválido.")
+            _, salt, n, r, p, _ = partes
+            dk = _scrypt_hex(pwd, bytes.fromhex(salt), int(n), int(r), int(p))
+            calculado = f"{_PREFIJO_SCRYPT}{salt}${n}${r}${p}${dk}"
+        else:
+            salt, _ = stored.split("$", 1)
+            calculado = _hash_password_sha256(pwd, salt)
     except ValueError:
+        # InvalidHashError de argon2 también hereda de ValueError.
+        # Se calcula igual un hash para que el tiempo de respuesta no revele
+        # si el valor almacenado era válido.
+        _hash_password(pwd)
         return False
-    return _hash_password(pwd, salt) == stored
+    # compare_digest: el tiempo no depende de cuántos caracteres coinciden
+    return hmac.compare_digest(calculado.encode("utf-8"), stored.encode("utf-8"))
+
+
+def _necesita_rehash(stored: str) -> bool:
+    """
+    Indica si un hash válido usa un esquema o parámetros ya superados.
+
+    Args:
+        stored: Hash almacenado que acaba de verificarse.
+
+    Returns:
+        bool: True si conviene recalcularlo con _hash_password().
+    """
+    hasher = _argon2()
+    if hasher is not None:
+        return (not stored.startswith(_PREFIJO_ARGON2)
+                or hasher.check_needs_rehash(stored))
+    parametros = f"${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}$"
+    return not (stored.startswith(_PREFIJO_SCRYPT) and parametros in stored)
+
+
+def _actualizar_hash_si_obsoleto(autor: Dict[str, Any], pwd: str) -> None:
+    """
+    Recalcula y persiste el hash de un autor tras un inicio de sesión válido.
+
+    Así las cuentas con SHA-256, scrypt o parámetros antiguos migran al
+    esquema actual sin pedir un cambio de contraseña.
+
+    Args:
+        autor: Autor que acaba de autenticarse (se actualiza en memoria).
+        pwd: Contraseña en texto plano ya verificada.
+
+    Returns:
+        None
+    """
+    if not _necesita_rehash(autor.get("password_hash", "")):
+        return
+    pwd_hash = _esperar_hash(_hash_password_async(pwd))
+    modelo.actualizar_autor(
+        AUTORES_CSV, autor["id_autor"], {"password_hash": pwd_hash}
+    )
+    autor["password_hash"] = pwd_hash
 
 
 def pedir_password_nuevo() -> str:
@@ -217,34 +514,50 @@ DIRECTORIO_DATOS = os.path.join(BASE_DIR, "data")
 AUTORES_CSV = os.path.join(DIRECTORIO_DATOS, "autores.csv")
 POSTS_JSON = os.path.join(DIRECTORIO_DATOS, "posts.json")
 
+# Índice de autores por id, reutilizado mientras el CSV no cambie en disco:
+# ruta -> ((mtime_ns, tamaño, inodo), índice).
+_CACHE_AUTORES: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Dict[str, Any]]]] = {}
+
+# Conteo de tags ya ordenado, con la misma invalidación por firma:
+# ruta -> ((mtime_ns, tamaño, inodo), [(tag, usos), ...]).
+_CACHE_TAGS: Dict[str, Tuple[Tuple[int, int, int], List[Tuple[str, int]]]] = {}
+
 
 # --- Estado de sesión (simulado) ---
-class Sesion:
+class _Sesion:
     """
     Gestiona el estado de la sesión del usuario actual.
 
-    Atributos de clase:
+    Se usa una única instancia (`sesion`); con slots, leer sus atributos es
+    un acceso directo sin diccionario ni recorrido de la clase.
+
+    Atributos:
         id_autor (Optional[str]): ID del autor autenticado.
         nombre_autor (Optional[str]): Nombre visible del autor.
         email (Optional[str]): Correo electrónico del autor.
+        descripcion (str): Estado "Conectado como ..." ya escapado para Rich;
+            se arma al iniciar sesión, no en cada visita al menú.
     """
 
-    id_autor: Optional[str] = None
-    nombre_autor: Optional[str] = None
-    email: Optional[str] = None
+    __slots__ = ("id_autor", "nombre_autor", "email", "descripcion")
+
+    def __init__(self) -> None:
+        """Crea una sesión vacía (sin autor autenticado)."""
+        self.id_autor: Optional[str] = None
+        self.nombre_autor: Optional[str] = None
+        self.email: Optional[str] = None
+        self.descripcion = ""
 
-    @classmethod
-    def activa(cls) -> bool:
+    def activa(self) -> bool:
         """
         Indica si existe una sesión activa.
 
         Returns:
             bool: True si hay un autor en sesión; False en caso contrario.
         """
-        return cls.id_autor is not None
+        return self.id_autor is not None
 
-    @classmethod
-    def establecer(cls, autor: Dict[str, Any]) -> None:
+    def establecer(self, autor: Dict[str, Any]) -> None:
         """
         Establece la sesión con los datos del autor autenticado.
 
@@ -254,21 +567,29 @@ class Sesion:
         Returns:
             None
         """
-        cls.id_autor = autor.get("id_autor")
-        cls.nombre_autor = autor.get("nombre_autor")
-        cls.email = autor.get("email")
+        self.id_autor = autor.get("id_autor")
+        self.nombre_autor = autor.get("nombre_autor")
+        self.email = autor.get("email")
+        self.descripcion = (
+            f"Conectado como [bold green]"
+            f"{escape(self.nombre_autor or '')}[/bold green] "
+            f"<{escape(self.email or '')}> (ID {escape(str(self.id_autor or ''))})"
+        )
 
-    @classmethod
-    def limpiar(cls) -> None:
+    def limpiar(self) -> None:
         """
         Limpia el estado de la sesión (cierra sesión).
 
         Returns:
             None
         """
-        cls.id_autor = None
-        cls.nombre_autor = None
-        cls.email = None
+        self.id_autor = None
+        self.nombre_autor = None
+        self.email = None
+        self.descripcion = ""
+
+
+sesion = _Sesion()
 
 
 # --- Helpers UI ---
@@ -283,6 +604,112 @@ def init_archivos() -> None:
     gestor_datos.inicializar_archivo(POSTS_JSON)
 
 
+# Piezas fijas de render_post_twitter (Text ya armados, sin markup).
+_SIN_COMENTARIOS = Text("Sé el primero en comentar...", style="dim")
+_TITULO_COMENTARIOS = Text("Comentarios")
+# Línea en blanco entre renderables agrupados (equivale a console.print()).
+_SEPARADOR = Text()
+
+# Paneles de contenido fijo: se construyen una vez y se reimprimen.
+_BANNER = Panel.fit(
+    Text("Sistema de Blog Multi-usuario", style="bold cyan"),
+    border_style="bright_magenta",
+)
+# Rutas relativas a BASE_DIR, derivadas de las constantes de datos.
+_LINEA_ARCHIVOS = Text.assemble(
+    "Archivos de Datos: ",
+    (os.path.relpath(AUTORES_CSV, BASE_DIR), "green"),
+    ", ",
+    (os.path.relpath(POSTS_JSON, BASE_DIR), "green"),
+)
+_AVISO_REQUIERE_SESION = Panel(
+    Text.from_markup(
+        "[yellow]Sin sesión activa: solo puedes visualizar y listar.[/yellow]\n"
+        "[white]Para crear, editar o eliminar, inicia sesión o regístrate.[/white]"
+    ),
+    title=Text.from_markup("[bold cyan]Acción restringida[/bold cyan]"),
+    border_style="bright_cyan",
+)
+
+
+# Menú principal (markup parseado una vez); solo cambia el subtítulo, que
+# mostrar_menu_principal() actualiza con el estado de la sesión.
+_MENU_PRINCIPAL = Panel(
+    Text.from_markup(
+        "[bold cyan]Bienvenido a Nuestro Blog Multi-usuario[/bold cyan]\n"
+        "[bold cyan]1)[/bold cyan] [bold yellow]Publicaciones (POSTS)"
+        "[/bold yellow]\n"
+        "[bold cyan]2)[/bold cyan] [bold yellow]Comentarios[/bold yellow]\n"
+        "[bold cyan]3)[/bold cyan] [bold yellow]Autores[/bold yellow]\n"
+        "[bold cyan]4)[/bold cyan] [bold yellow]Sesión[/bold yellow]"
+    ),
+    title=Text.from_markup("[bold cyan]MENÚ PRINCIPAL[/bold cyan]"),
+    border_style="bright_cyan",
+    subtitle_align="right",
+)
+_SIN_SESION = Text("Sin sesión", style="bright_yellow")
+_SALIR = Text("5. Salir", style="bold red")
+_OPCIONES_PRINCIPAL = frozenset({"1", "2", "3", "4", "5"})
+# Prompt y aviso de _elegir_opcion (Text ya armados, sin markup).
+_PROMPT_OPCION = Text.assemble(("Opción", "magenta"), ": ")
+_OPCION_INVALIDA = Text("Elija una de las opciones disponibles.", style="red")
+
+# Submenús y sus opciones válidas: iguales en cada vuelta del bucle.
+_MENU_AUTORES = Panel(
+    Text.from_markup(
+        "[bold yellow]1[/bold yellow]. Crear autor\n"
+        "[bold yellow]2[/bold yellow]. Ver autores\n"
+        "[bold yellow]3[/bold yellow]. Actualizar autor\n"
+        "[bold yellow]4[/bold yellow]. Eliminar autor\n"
+        "[bold yellow]5[/bold yellow]. Volver"
+    ),
+    title=Text.from_markup("[bold cyan]Autores[/bold cyan]"),
+    border_style="bright_blue",
+)
+_OPCIONES_AUTORES = ["1", "2", "3", "4", "5"]
+_MENU_PUBLICACIONES = Panel(
+    Text.from_markup(
+        "[bold yellow]1[/bold yellow]. Crear post (requiere sesión)\n"
+        "[bold yellow]2[/bold yellow]. Listar posts de un autor\n"
+        "[bold yellow]3[/bold yellow]. Buscar posts por tag\n"
+        "[bold yellow]4[/bold yellow]. Editar mi post "
+        "(requiere sesión)\n"
+        "[bold yellow]5[/bold yellow]. Eliminar mi post "
+        "(requiere sesión)\n"
+        "[bold yellow]6[/bold yellow]. Volver"
+    ),
+    title=Text.from_markup("[bold cyan]Publicaciones[/bold cyan]"),
+    border_style="bright_blue",
+)
+_OPCIONES_PUBLICACIONES = ["1", "2", "3", "4", "5", "6"]
+_MENU_COMENTARIOS = Panel(
+    Text.from_markup(
+        "[bold yellow]1.[/bold yellow]Agregar comentario\n"
+        "[bold yellow]2.[/bold yellow] Editar mi comentario\n"
+        "[bold yellow]3.[/bold yellow] Eliminar mi comentario\n"
+        "[bold yellow]4.[/bold yellow] Volver"
+    ),
+    title=Text.from_markup("[bold cyan]Comentarios[/bold cyan]"),
+    border_style="bright_blue",
+)
+_OPCIONES_COMENTARIOS = ["1", "2", "3", "4"]
+
+
+@functools.lru_cache(maxsize=None)
+def _encabezado(titulo: str, borde: str = "bright_blue") -> Panel:
+    """
+    Devuelve el panel de título de una pantalla, construido una sola vez.
+
+    Args:
+        titulo: Texto del título (sin markup; se muestra en negrita cian).
+        borde: Estilo del borde del panel.
+
+    Returns:
+        Panel: Panel ajustado al contenido, reutilizable entre llamadas.
+    """
+    return Panel.fit(Text(titulo, style="bold cyan"), border_style=borde)
+
+
 def banner() -> None:
     """
     Muestra el banner principal de la aplicación.
@@ -290,12 +717,7 @@ def banner() -> None:
     Returns:
         None
     """
-    console.print(
-        Panel.fit(
-            "[bold cyan]Sistema de Blog Multi-usuario[/bold cyan]",
-            border_style="bright_magenta",
-        )
-    )
+    console.print(_BANNER)
 
 
 def mostrar_error(mensaje: str) -> None:
@@ -308,13 +730,7 @@ def mostrar_error(mensaje: str) -> None:
     Returns:
         None
     """
-    console.print(
-        Panel(
-            f"[bright_red]{mensaje}[/bright_red]",
-            border_style="red",
-            title="[bold red]Error[/bold red]",
-        )
-    )
+    console.print(Panel(f"[bright_red]{mensaje}[/bright_red]", **_PANEL_ERROR))
 
 
 def mostrar_ok(mensaje: str) -> None:
@@ -327,13 +743,7 @@ def mostrar_ok(mensaje: str) -> None:
     Returns:
         None
     """
-    console.print(
-        Panel(
-            f"[bright_green]{mensaje}[/bright_green]",
-            border_style="green",
-            title="[bold green]Éxito[/bold green]",
-        )
-    )
+    console.print(Panel(f"[bright_green]{mensaje}[/bright_green]", **_PANEL_OK))
 
 
 def _avisar_requiere_sesion() -> None:
@@ -343,14 +753,7 @@ def _avisar_requiere_sesion() -> None:
     Returns:
         None
     """
-    console.print(
-        Panel(
-            "[yellow]Sin sesión activa: solo puedes visualizar y listar.[/yellow]\n"
-            "[white]Para crear, editar o eliminar, inicia sesión o regístrate.[/white]",
-            title="[bold cyan]Acción restringida[/bold cyan]",
-            border_style="bright_cyan",
-        )
-    )
+    console.print(_AVISO_REQUIERE_SESION)
 
 
 def input_email() -> str:
@@ -363,32 +766,74 @@ def input_email() -> str:
     return Prompt.ask("[magenta]Email[/magenta]").strip().lower()
 
 
+def _firma_archivo(ruta: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Obtiene la firma de un archivo para invalidar los índices en memoria.
+
+    Args:
+        ruta: Archivo a inspeccionar.
+
+    Returns:
+        Optional[Tuple[int, int, int]]: (mtime_ns, tamaño, inodo), o None si
+        el archivo no existe o no se puede leer.
+    """
+    try:
+        st = os.stat(ruta)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
 def cargar_autores_indexado() -> Dict[str, Dict[str, Any]]:
     """
     Carga todos los autores y retorna un índice por id_autor.
 
+    El índice se reconstruye solo si AUTORES_CSV cambió (mtime, tamaño o
+    inodo); si no, se devuelve el mismo diccionario (no modificarlo).
+
     Returns:
         Dict[str, Dict[str, Any]]: Mapa id_autor -> autor.
     """
+    firma = _firma_archivo(AUTORES_CSV)
+    hit = _CACHE_AUTORES.get(AUTORES_CSV)
+    if firma is not None and hit is not None and hit[0] == firma:
+        return hit[1]
+
     autores = modelo.leer_todos_los_autores(AUTORES_CSV)
-    return {a["id_autor"]: a for a in autores}
+    indice = {a["id_autor"]: a for a in autores}
+    if firma is not None:
+        _CACHE_AUTORES[AUTORES_CSV] = (firma, indice)
+    return indice
 
 
-def nombre_autor(id_autor: str) -> str:
+def _nombre_en_indice(autores: Dict[str, Dict[str, Any]], id_autor: str) -> str:
     """
-    Obtiene el nombre visible de un autor a partir de su ID.
+    Resuelve el nombre visible de un autor en un índice ya cargado.
 
     Args:
+        autores: Índice id_autor -> autor.
         id_autor: Identificador del autor.
 
     Returns:
         str: Nombre del autor o "Autor #<id>" si no se encuentra.
     """
-    autores = cargar_autores_indexado()
     autor = autores.get(id_autor)
     return autor["nombre_autor"] if autor else f"Autor #{id_autor}"
 
 
+def nombre_autor(id_autor: str) -> str:
+    """
+    Obtiene el nombre visible de un autor a partir de su ID.
+
+    Args:
+        id_autor: Identificador del autor.
+
+    Returns:
+        str: Nombre del autor o "Autor #<id>" si no se encuentra.
+    """
+    return _nombre_en_indice(cargar_autores_indexado(), id_autor)
+
+
 def tabla_autores(autores: List[Dict[str, Any]]) -> Table:
     """
     Construye una tabla Rich con la lista de autores.
@@ -411,11 +856,27 @@ def tabla_autores(autores: List[Dict[str, Any]]) -> Table:
     tabla.add_column("Email")
 
     autores_ordenados = sorted(autores, key=lambda a: int(a["id_autor"]))
+    agregar = tabla.add_row
     for a in autores_ordenados:
-        tabla.add_row(a["id_autor"], a["nombre_autor"], a["email"])
+        agregar(a["id_autor"], a["nombre_autor"], a["email"])
     return tabla
 
 
+def _celdas_post(post: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """
+    Calcula las celdas de un post para tabla_posts (sin ID ni autor).
+
+    Args:
+        post: Publicación.
+
+    Returns:
+        Tuple[str, str, str, str]: Título, fecha, tags y nº de comentarios.
+    """
+    return (post["titulo"], post["fecha_publicacion"],
+            ", ".join(post.get("tags") or ()),
+            str(len(post.get("comentarios") or ())))
+
+
 def tabla_posts(posts: List[Dict[str, Any]], mostrar_autor: bool = True) -> Table:
     """
     Construye una tabla Rich con publicaciones.
@@ -442,14 +903,22 @@ def tabla_posts(posts: List[Dict[str, Any]], mostrar_autor: bool = True) -> Tabl
     tabla.add_column("Tags", width=30)
     tabla.add_column("Comentarios", justify="right", width=12)
 
-    for p in sorted(posts, key=lambda x: int(x["id_post"])):
-        tags = ", ".join(p.get("tags") or [])
-        n_com = len(p.get("comentarios") or [])
-        fila = [p["id_post"]]
-        if mostrar_autor:
-            fila.append(nombre_autor(p["id_autor"]))
-        fila.extend([p["titulo"], p["fecha_publicacion"], tags, str(n_com)])
-        tabla.add_row(*fila)
+    ordenados = sorted(posts, key=lambda x: int(x["id_post"]))
+    # Filas calculadas en una pasada, sin condiciones por fila; el bucle
+    # final solo las agrega a la tabla.
+    if mostrar_autor:
+        # Un solo índice para toda la tabla (no una búsqueda de autores por fila)
+        autores = cargar_autores_indexado()
+        filas = [
+            (p["id_post"], _nombre_en_indice(autores, p["id_autor"]),
+             *_celdas_post(p))
+            for p in ordenados
+        ]
+    else:
+        filas = [(p["id_post"], *_celdas_post(p)) for p in ordenados]
+    agregar = tabla.add_row
+    for fila in filas:
+        agregar(*fila)
 
     return tabla
 
@@ -464,6 +933,19 @@ def render_post_twitter(post: Dict[str, Any]) -> None:
     Returns:
         None
     """
+    console.print(_post_twitter(post))
+
+
+def _post_twitter(post: Dict[str, Any]) -> Group:
+    """
+    Construye la vista tipo 'tweet' de un post sin imprimirla.
+
+    Args:
+        post: Publicación a mostrar.
+
+    Returns:
+        Group: Panel del post (con comentarios) y, si tiene, la línea de tags.
+    """
     autor = nombre_autor(post["id_autor"])
     titulo = post["titulo"]
     contenido = post["contenido"]
@@ -488,35 +970,31 @@ def render_post_twitter(post: Dict[str, Any]) -> None:
         padding=(1, 2),
     )
 
-    # Comentarios
-    comentarios_tbl = Table.grid(padding=(0, 1))
-    comentarios_tbl.add_column(justify="left", ratio=1)
+    # Comentarios: un Panel por comentario, en una sola columna.
     comentarios = post.get("comentarios") or []
     if comentarios:
+        comentarios_tbl = Table.grid(padding=(0, 1))
+        comentarios_tbl.add_column(justify="left", ratio=1)
+        agregar = comentarios_tbl.add_row
         for c in comentarios:
-            cab = Text(
-                f"{c['autor']} · {c['fecha']}",
-                style="magenta",
-            )
-            comentarios_tbl.add_row(
+            agregar(
                 Panel(
                     Text(c["contenido"]),
-                    title=cab,
+                    title=Text(f"{c['autor']} · {c['fecha']}", style="magenta"),
                     border_style="magenta",
                 )
             )
+        bloque_comentarios = comentarios_tbl
     else:
-        comentarios_tbl.add_row(
-            Text("Sé el primero en comentar...", style="dim")
-        )
+        bloque_comentarios = _SIN_COMENTARIOS
 
     post_panel = Panel.fit(
         Group(
             header,
             cuerpo,
             Panel(
-                comentarios_tbl,
-                title="Comentarios",
+                bloque_comentarios,
+                title=_TITULO_COMENTARIOS,
                 border_style="blue",
             ),
         ),
@@ -524,9 +1002,9 @@ def render_post_twitter(post: Dict[str, Any]) -> None:
         border_style="blue",
         padding=(1, 1),
     )
-    console.print(post_panel)
     if tags:
-        console.print(Text(f"Tags: {tags}", style="yellow"))
+        return Group(post_panel, Text(f"Tags: {tags}", style="yellow"))
+    return Group(post_panel)
 
 
 def ver_post_con_interacciones(id_post: str) -> None:
@@ -548,8 +1026,8 @@ def ver_post_con_interacciones(id_post: str) -> None:
     render_post_twitter(post)
     console.print()
     if Confirm.ask("¿Quieres comentar ahora?", default=False):
-        if Sesion.activa():
-            autor_nombre = Sesion.nombre_autor or "Anónimo"
+        if sesion.activa():
+            autor_nombre = sesion.nombre_autor or "Anónimo"
             contenido = Prompt.ask("Escribe tu comentario").strip()
             if contenido:
                 try:
@@ -558,7 +1036,7 @@ def ver_post_con_interacciones(id_post: str) -> None:
                         post["id_post"],
                         autor_nombre,
                         contenido,
-                        id_autor=Sesion.id_autor,
+                        id_autor=sesion.id_autor,
                     )
                     mostrar_ok("¡Comentario publicado!")
                 except modelo.ErrorDeDominio as e:
@@ -574,7 +1052,7 @@ def ver_post_ui() -> None:
     Returns:
         None
     """
-    console.print(Panel.fit("[bold cyan]Ver Publicación[/bold cyan]"))
+    console.print(_encabezado("Ver Publicación", "none"))
     id_post = Prompt.ask("[magenta]ID del post[/magenta]").strip()
     if id_post == "0":
         console.print("[yellow]Operación cancelada.[/yellow]")
@@ -593,31 +1071,48 @@ BIENVENIDA_CONTENIDO = (
     "Consejo: usa tags para organizar tus temas favoritos."
 )
 
+# Post de bienvenida ya asegurado en este proceso:
+# (AUTORES_CSV, POSTS_JSON) -> (id_autor del Sistema, id_post).
+_BIENVENIDA: Dict[Tuple[str, str], Tuple[str, str]] = {}
+
 
 def ensure_sistema_y_bienvenida() -> Dict[str, Any]:
     """
     Asegura la existencia del autor 'Sistema' y su post de bienvenida.
 
+    Tras la primera vez, el post se obtiene por su ID (búsqueda indexada);
+    solo si ya no existe o cambió de dueño se vuelve a verificar todo.
+
     Returns:
         Dict[str, Any]: Publicación de bienvenida (creada o existente).
     """
+    clave = (AUTORES_CSV, POSTS_JSON)
+    recordado = _BIENVENIDA.get(clave)
+    if recordado is not None:
+        id_sistema, id_post = recordado
+        post = modelo.buscar_post_por_id(POSTS_JSON, id_post)
+        if post is not None and post.get("id_autor") == id_sistema:
+            return post
+
     # Asegurar autor Sistema
     autor_sys = modelo.buscar_autor_por_email(AUTORES_CSV, SISTEMA_EMAIL)
     if not autor_sys:
         autor_sys = modelo.crear_autor(AUTORES_CSV, SISTEMA_NOMBRE, SISTEMA_EMAIL)
-    # Asegurar post de bienvenida
-    posts = modelo.buscar_posts_por_tag(POSTS_JSON, BIENVENIDA_TAG)
-    posts = [p for p in posts if p.get("id_autor") == autor_sys["id_autor"]]
-    if posts:
-        return posts[0]
-    return modelo.crear_post(
-        POSTS_JSON,
-        autor_sys["id_autor"],
-        BIENVENIDA_TITULO,
-        BIENVENIDA_CONTENIDO,
-        [BIENVENIDA_TAG, "intro"],
-        validar_autor_en=AUTORES_CSV,
+    # Asegurar post de bienvenida (búsqueda indexada por tag y autor)
+    post = modelo.buscar_post_por_tag_y_autor(
+        POSTS_JSON, BIENVENIDA_TAG, autor_sys["id_autor"]
     )
+    if post is None:
+        post = modelo.crear_post(
+            POSTS_JSON,
+            autor_sys["id_autor"],
+            BIENVENIDA_TITULO,
+            BIENVENIDA_CONTENIDO,
+            [BIENVENIDA_TAG, "intro"],
+            validar_autor_en=AUTORES_CSV,
+        )
+    _BIENVENIDA[clave] = (autor_sys["id_autor"], post["id_post"])
+    return post
 
 
 def mostrar_post_bienvenida_y_comentar() -> None:
@@ -635,8 +1130,8 @@ def mostrar_post_bienvenida_y_comentar() -> None:
         "¿Quieres comentar en la bienvenida ahora?",
         default=False,
     ):
-        if Sesion.activa():
-            autor_nombre = Sesion.nombre_autor or "Anónimo"
+        if sesion.activa():
+            autor_nombre = sesion.nombre_autor or "Anónimo"
             contenido = Prompt.ask("Escribe tu comentario").strip()
             if contenido:
                 try:
@@ -645,7 +1140,7 @@ def mostrar_post_bienvenida_y_comentar() -> None:
                         post["id_post"],
                         autor_nombre,
                         contenido,
-                        id_autor=Sesion.id_autor,
+                        id_autor=sesion.id_autor,
                     )
                     mostrar_ok("¡Comentario publicado!")
                 except modelo.ErrorDeDominio as e:
@@ -664,7 +1159,7 @@ def onboarding_inicio() -> bool:
         bool: True si se completó el inicio (login/registro) o ya había sesión;
               False si el usuario decide salir.
     """
-    while not Sesion.activa():
+    while not sesion.activa():
         menu = Table.grid(expand=True)
         menu.add_column(ratio=1, justify="center")
         menu.add_row(Text("Bienvenido", style="bold bright_cyan"))
@@ -707,12 +1202,7 @@ def registrar_ui() -> bool:
     Returns:
         bool: True si se registró e inició sesión; False si se canceló o falló.
     """
-    console.print(
-        Panel.fit(
-            "[bold cyan]Registro de Autor[/bold cyan]",
-            border_style="bright_blue",
-        )
-    )
+    console.print(_encabezado("Registro de Autor"))
     try:
         nombre = pedir_obligatorio("Nombre del autor")
         email = pedir_obligatorio("Email", to_lower=True)
@@ -722,7 +1212,7 @@ def registrar_ui() -> bool:
         while True:
             try:
                 pwd = pedir_password_nuevo()
-                pwd_hash = _hash_password(pwd)
+                pwd_hash = _esperar_hash(_hash_password_async(pwd))
                 modelo.actualizar_autor(
                     AUTORES_CSV,
                     autor["id_autor"],
@@ -753,8 +1243,8 @@ def registrar_ui() -> bool:
 
                 return False
 
-        Sesion.establecer(autor)
-        mostrar_ok(f"Cuenta creada. Bienvenido, {autor['nombre_autor']}.")
+        sesion.establecer(autor)
+        mostrar_ok(f"Cuenta creada. Bienvenido, {escape(autor['nombre_autor'])}.")
 
         return True
     except Cancelado:
@@ -774,12 +1264,7 @@ def crear_autor_ui() -> None:
     Returns:
         None
     """
-    console.print(
-        Panel.fit(
-            "[bold cyan]Crear Autor[/bold cyan]",
-            border_style="bright_blue",
-        )
-    )
+    console.print(_encabezado("Crear Autor"))
     try:
         nombre = pedir_obligatorio("Nombre del autor")
         email = pedir_obligatorio("Email", to_lower=True)
@@ -787,7 +1272,7 @@ def crear_autor_ui() -> None:
         # Solicitar contraseña para el autor creado
         try:
             pwd = pedir_password_nuevo()
-            pwd_hash = _hash_password(pwd)
+            pwd_hash = _esperar_hash(_hash_password_async(pwd))
             modelo.actualizar_autor(
                 AUTORES_CSV,
                 autor["id_autor"],
@@ -821,12 +1306,7 @@ def ver_autores_ui() -> None:
     Returns:
         None
     """
-    console.print(
-        Panel.fit(
-            "[bold cyan]Lista de Autores[/bold cyan]",
-            border_style="bright_blue",
-        )
-    )
+    console.print(_encabezado("Lista de Autores"))
     autores = modelo.leer_todos_los_autores(AUTORES_CSV)
     if not autores:
         console.print("[yellow]No hay autores registrados.[/yellow]")
@@ -845,19 +1325,14 @@ def actualizar_autor_ui() -> None:
     Raises:
         Cancelado: Si el usuario cancela durante la edición.
     """
-    console.print(
-        Panel.fit(
-            "[bold cyan]Actualizar Autor[/bold cyan]",
-            border_style="bright_blue",
-        )
-    )
+    console.print(_encabezado("Actualizar Autor"))
     # NUEVO: solo el autor en sesión puede editar su propio perfil
-    if not Sesion.activa():
+    if not sesion.activa():
         _avisar_requiere_sesion()
 
         return
     try:
-        id_autor = Sesion.id_autor  # usar siempre el autor en sesión
+        id_autor = sesion.id_autor  # usar siempre el autor en sesión
         autor_actual = modelo.buscar_autor_por_id(AUTORES_CSV, id_autor)
         if not autor_actual:
             mostrar_error("No se encontró el autor de la sesión.")
@@ -894,8 +1369,8 @@ def actualizar_autor_ui() -> None:
             )
             mostrar_ok(
                 "Autor actualizado: "
-                f"{autor_act['nombre_autor']} "
-                f"<{autor_act['email']}>"
+                f"{escape(autor_act['nombre_autor'])} "
+                f"<{escape(autor_act['email'])}>"
             )
     except Cancelado:
         console.print("[yellow]Operación cancelada.[/yellow]")
@@ -915,20 +1390,15 @@ def eliminar_autor_ui() -> None:
     Returns:
         None
     """
-    console.print(
-        Panel.fit(
-            "[bold cyan]Eliminar Autor[/bold cyan]",
-            border_style="bright_blue",
-        )
-    )
+    console.print(_encabezado("Eliminar Autor"))
     # NUEVO: solo el autor en sesión puede eliminar su propia cuenta
-    if not Sesion.activa():
+    if not sesion.activa():
         _avisar_requiere_sesion()
 
         return
 
     # Mostrar datos del autor a eliminar (el propio)
-    autor_actual = modelo.buscar_autor_por_id(AUTORES_CSV, Sesion.id_autor)
+    autor_actual = modelo.buscar_autor_por_id(AUTORES_CSV, sesion.id_autor)
     if not autor_actual:
         mostrar_error("No se encontró el autor de la sesión.")
 
@@ -950,10 +1420,10 @@ def eliminar_autor_ui() -> None:
 
         return
 
-    ok = modelo.eliminar_autor(AUTORES_CSV, Sesion.id_autor)
+    ok = modelo.eliminar_autor(AUTORES_CSV, sesion.id_autor)
     if ok:
         mostrar_ok("Cuenta eliminada. La sesión se cerrará.")
-        Sesion.limpiar()
+        sesion.limpiar()
     else:
         mostrar_error("No se pudo eliminar la cuenta.")
 
@@ -968,20 +1438,10 @@ def menu_autores() -> None:
         None
     """
     while True:
-        console.print(
-            Panel(
-                "[bold yellow]1[/bold yellow]. Crear autor\n"
-                "[bold yellow]2[/bold yellow]. Ver autores\n"
-                "[bold yellow]3[/bold yellow]. Actualizar autor\n"
-                "[bold yellow]4[/bold yellow]. Eliminar autor\n"
-                "[bold yellow]5[/bold yellow]. Volver",
-                title="[bold cyan]Autores[/bold cyan]",
-                border_style="bright_blue",
-            )
-        )
+        console.print(_MENU_AUTORES)
         opcion = Prompt.ask(
             "[magenta]Opción[/magenta]",
-            choices=["1", "2", "3", "4", "5"],
+            choices=_OPCIONES_AUTORES,
             show_choices=False,
         )
         if opcion == "1":
@@ -1004,18 +1464,13 @@ def menu_sesion() -> None:
     Returns:
         None
     """
-    if Sesion.activa():
-        estado = (
-            f"Conectado como [bold green]"
-            f"{escape(Sesion.nombre_autor or '')}[/bold green] "
-            f"<{escape(Sesion.email or '')}> (ID {escape(str(Sesion.id_autor or ''))})"
-        )
+    if sesion.activa():
         console.print(
-            Panel(estado, title="[bold cyan]Sesión[/bold cyan]"
+            Panel(sesion.descripcion, title="[bold cyan]Sesión[/bold cyan]"
                   , border_style="bright_cyan")
         )
         if Confirm.ask("[magenta]¿Desea cerrar sesión ahora?[/magenta]", default=True):
-            Sesion.limpiar()
+            sesion.limpiar()
             mostrar_ok("Sesión cerrada.")
         else:
             console.print("[cyan]Operación cancelada.[/cyan]")
@@ -1043,9 +1498,7 @@ def iniciar_sesion_ui() -> bool:  # noqa: PLR0911, PLR0915
     Returns:
         bool: True si inicia sesión correctamente; False en caso contrario.
     """
-    console.print(
-        Panel.fit("[bold cyan]Iniciar Sesión[/bold cyan]", border_style="bright_cyan")
-    )
+    console.print(_encabezado("Iniciar Sesión", "bright_cyan"))
     try:
         email = pedir_obligatorio("Email", to_lower=True)
         autor = modelo.buscar_autor_por_email(AUTORES_CSV, email)
@@ -1059,7 +1512,7 @@ def iniciar_sesion_ui() -> bool:  # noqa: PLR0911, PLR0915
                 )
                 try:
                     pwd_new = pedir_password_nuevo()
-                    pwd_hash = _hash_password(pwd_new)
+                    pwd_hash = _esperar_hash(_hash_password_async(pwd_new))
                     modelo.actualizar_autor(
                         AUTORES_CSV, autor["id_autor"], {"password_hash": pwd_hash}
                     )
@@ -1077,19 +1530,18 @@ def iniciar_sesion_ui() -> bool:  # noqa: PLR0911, PLR0915
                     raise Cancelado()
 
             # Validar contraseña persistida
-            intentos = 3
+            intentos = MAX_INTENTOS_LOGIN
             while intentos > 0:
                 pwd = pedir("Contraseña", password=True)
                 if _verify_password(autor.get("password_hash", ""), pwd):
-                    Sesion.establecer(autor)
-                    mostrar_ok(f"Bienvenido, {autor['nombre_autor']}.")
+                    _actualizar_hash_si_obsoleto(autor, pwd)
+                    sesion.establecer(autor)
+                    mostrar_ok(f"Bienvenido, {escape(autor['nombre_autor'])}.")
 
                     return True
                 else:
                     intentos -= 1
-                    mostrar_error(
-                        f"Contraseña incorrecta. Intentos restantes: {intentos}"
-                    )
+                    console.print(_PANELES_INTENTO_FALLIDO[intentos])
             console.print("[red]Demasiados intentos fallidos.[/red]")
 
             return False
@@ -1103,14 +1555,16 @@ def iniciar_sesion_ui() -> bool:  # noqa: PLR0911, PLR0915
             nombre = pedir_obligatorio("Nombre del autor")
             try:
                 pwd_new = pedir_password_nuevo()
-                pwd_hash = _hash_password(pwd_new)
+                # El hash se calcula mientras se da de alta el autor
+                futuro = _hash_password_async(pwd_new)
                 autor = modelo.crear_autor(AUTORES_CSV, nombre, email)
+                pwd_hash = _esperar_hash(futuro)
                 modelo.actualizar_autor(
                     AUTORES_CSV, autor["id_autor"], {"password_hash": pwd_hash}
                 )
                 autor["password_hash"] = pwd_hash
-                Sesion.establecer(autor)
-                mostrar_ok(f"Cuenta creada e iniciada: {nombre}.")
+                sesion.establecer(autor)
+                mostrar_ok(f"Cuenta creada e iniciada: {escape(nombre)}.")
 
                 return True
             except (modelo.EmailDuplicado, modelo.ValidacionError) as e:
@@ -1136,23 +1590,10 @@ def menu_publicaciones() -> None:
         None
     """
     while True:
-        console.print(
-            Panel(
-                "[bold yellow]1[/bold yellow]. Crear post (requiere sesión)\n"
-                "[bold yellow]2[/bold yellow]. Listar posts de un autor\n"
-                "[bold yellow]3[/bold yellow]. Buscar posts por tag\n"
-                "[bold yellow]4[/bold yellow]. Editar mi post "
-                "(requiere sesión)\n"
-                "[bold yellow]5[/bold yellow]. Eliminar mi post "
-                "(requiere sesión)\n"
-                "[bold yellow]6[/bold yellow]. Volver",
-                title="[bold cyan]Publicaciones[/bold cyan]",
-                border_style="bright_blue",
-            )
-        )
+        console.print(_MENU_PUBLICACIONES)
         opcion = Prompt.ask(
             "[magenta]Opción[/magenta]",
-            choices=["1", "2", "3", "4", "5", "6"],
+            choices=_OPCIONES_PUBLICACIONES,
             show_choices=False,
         )
         if opcion == "1":
@@ -1176,23 +1617,19 @@ def crear_post_ui() -> None:
     Returns:
         None
     """
-    if not Sesion.activa():
+    if not sesion.activa():
         mostrar_error("Debe iniciar sesión para crear publicaciones.")
 
         return
 
-    console.print(
-        Panel.fit(
-            "[bold cyan]Crear Publicación[/bold cyan]"
-            , border_style="bright_blue")
-    )
+    console.print(_encabezado("Crear Publicación"))
     try:
         titulo = pedir_obligatorio("Título")
         contenido = pedir_obligatorio("Contenido")
         tags = pedir("Tags (separados por comas)", default="")
         post = modelo.crear_post(
             POSTS_JSON,
-            Sesion.id_autor,
+            sesion.id_autor,
             titulo,
             contenido,
             tags,
@@ -1214,21 +1651,16 @@ def listar_posts_de_autor_ui() -> None:
     Returns:
         None
     """
-    console.print(
-        Panel.fit(
-            "[bold cyan]Posts por Autor[/bold cyan]",
-            border_style="bright_blue",
-        )
-    )
+    console.print(_encabezado("Posts por Autor"))
     if Confirm.ask(
         "[magenta]¿Usar autor en sesión?[/magenta]",
-        default=Sesion.activa(),
+        default=sesion.activa(),
     ):
-        if not Sesion.activa():
+        if not sesion.activa():
             mostrar_error("No hay sesión activa.")
 
             return
-        id_autor = Sesion.id_autor
+        id_autor = sesion.id_autor
     else:
         # Mostrar tabla de autores para guiar la selección
         autores = modelo.leer_todos_los_autores(AUTORES_CSV)
@@ -1237,9 +1669,8 @@ def listar_posts_de_autor_ui() -> None:
 
             return
         console.print(tabla_autores(autores))
-        ids_validos = {a["id_autor"] for a in autores}
         id_autor = Prompt.ask("[magenta]ID del autor[/magenta]").strip()
-        if id_autor not in ids_validos:
+        if id_autor not in cargar_autores_indexado():
             mostrar_error("El ID de autor no es válido.")
 
             return
@@ -1252,9 +1683,8 @@ def listar_posts_de_autor_ui() -> None:
     console.print(tabla_posts(posts, mostrar_autor=False))
     # Abrir en vista detalle
     if Confirm.ask("[magenta]¿Abrir un post en vista detalle?[/magenta]", default=True):
-        ids_validos = {p["id_post"] for p in posts}
         id_sel = Prompt.ask("[magenta]ID del post a abrir[/magenta]").strip()
-        if id_sel not in ids_validos:
+        if not _id_en_lista(posts, id_sel):
             mostrar_error("El ID no pertenece a la lista mostrada.")
 
             return
@@ -1269,12 +1699,7 @@ def buscar_post_por_tag_ui() -> None:
     Returns:
         None
     """
-    console.print(
-        Panel.fit(
-            "[bold cyan]Buscar Posts por Tag[/bold cyan]\n",
-            border_style="bright_blue",
-        )
-    )
+    console.print(_encabezado("Buscar Posts por Tag\n"))
     # Mostrar primero los tags disponibles con su conteo
     tags_conteo = _recolectar_tags_conteo()
     if not tags_conteo:
@@ -1307,11 +1732,10 @@ def buscar_post_por_tag_ui() -> None:
             "[magenta]¿Abrir un post en vista detalle?[/magenta]",
             default=True,
         ):
-            ids_validos = {p["id_post"] for p in posts}
             id_sel = Prompt.ask(
                 "[magenta]ID del post a abrir[/magenta]"
             ).strip()
-            if id_sel not in ids_validos:
+            if not _id_en_lista(posts, id_sel):
                 mostrar_error(
                     "El ID no pertenece a la lista mostrada."
                 )
@@ -1321,6 +1745,23 @@ def buscar_post_por_tag_ui() -> None:
         mostrar_error(str(e))
 
 
+def _id_en_lista(posts: List[Dict[str, Any]], id_post: str) -> bool:
+    """
+    Indica si un ID elegido por el usuario está entre los posts mostrados.
+
+    Se recorre la lista (cortando en la primera coincidencia) en lugar de
+    armar un set de IDs que solo se consultaría una vez.
+
+    Args:
+        posts: Publicaciones listadas en pantalla.
+        id_post: ID ingresado.
+
+    Returns:
+        bool: True si algún post de la lista tiene ese ID.
+    """
+    return any(p["id_post"] == id_post for p in posts)
+
+
 def _obtener_mis_posts() -> List[Dict[str, Any]]:
     """
     Obtiene todas las publicaciones del autor en sesión.
@@ -1328,9 +1769,9 @@ def _obtener_mis_posts() -> List[Dict[str, Any]]:
     Returns:
         List[Dict[str, Any]]: Lista de posts propios (o vacía si no hay sesión).
     """
-    if not Sesion.activa():
+    if not sesion.activa():
         return []
-    return modelo.listar_posts_por_autor(POSTS_JSON, Sesion.id_autor)
+    return modelo.listar_posts_por_autor(POSTS_JSON, sesion.id_autor)
 
 
 def _mostrar_tabla_y_detalle_posts(posts: List[Dict[str, Any]]) -> None:
@@ -1346,17 +1787,21 @@ def _mostrar_tabla_y_detalle_posts(posts: List[Dict[str, Any]]) -> None:
     if not posts:
         console.print("[yellow]No tienes publicaciones.[/yellow]")
         return
-    console.print(tabla_posts(posts, mostrar_autor=False))
-    console.print()  # separación
+    # Tabla y detalles en un solo print: una pasada de render y de escritura
+    partes: List[Any] = [tabla_posts(posts, mostrar_autor=False), _SEPARADOR]
     for p in posts:
-        render_post_twitter(p)
-        console.print()  # separación entre posts
+        partes += (_post_twitter(p), _SEPARADOR)
+    console.print(Group(*partes))
 
 
 def _cargar_todos_los_posts() -> List[Dict[str, Any]]:
     """
     Carga sin validación estricta el JSON de posts desde disco.
 
+    gestor_datos.cargar_datos no vuelve a parsear mientras la firma del
+    archivo (mtime, tamaño, inodo) no cambie. Cada escritura descarta esa
+    caché, y la lectura siguiente parsea el archivo otra vez.
+
     Returns:
         List[Dict[str, Any]]: Lista de publicaciones (normaliza campos mínimos).
     """
@@ -1376,18 +1821,27 @@ def _recolectar_tags_conteo():
     """
     Recolecta todos los tags usados en publicaciones y su conteo.
 
+    El conteo se recalcula solo si POSTS_JSON cambió en disco.
+
     Returns:
         List[Tuple[str, int]]: Lista de pares (tag, conteo) ordenada por uso desc.
     """
-    posts = _cargar_todos_los_posts()
-    contador: Dict[str, int] = {}
-    for p in posts:
-        for t in p.get("tags") or []:
-            t_norm = str(t).strip()
-            if t_norm:
-                contador[t_norm] = contador.get(t_norm, 0) + 1
+    firma = _firma_archivo(POSTS_JSON)
+    hit = _CACHE_TAGS.get(POSTS_JSON)
+    if firma is not None and hit is not None and hit[0] == firma:
+        return list(hit[1])
+
+    contador: Counter[str] = Counter(
+        t_norm
+        for p in _cargar_todos_los_posts()
+        for t in p.get("tags") or []
+        if (t_norm := str(t).strip())
+    )
     # Orden: más usados primero, luego alfabético
-    return sorted(contador.items(), key=lambda kv: (-kv[1], kv[0].lower()))
+    tags_conteo = sorted(contador.items(), key=lambda kv: (-kv[1], kv[0].lower()))
+    if firma is not None:
+        _CACHE_TAGS[POSTS_JSON] = (firma, tags_conteo)
+    return list(tags_conteo)
 
 
 def _tabla_tags(tags_conteo) -> Table:
@@ -1409,8 +1863,9 @@ def _tabla_tags(tags_conteo) -> Table:
     )
     tabla.add_column("Tag", width=28)
     tabla.add_column("Usos", justify="right", width=6)
+    agregar = tabla.add_row
     for tag, cnt in tags_conteo:
-        tabla.add_row(str(tag), str(cnt))
+        agregar(str(tag), str(cnt))
     return tabla
 
 
@@ -1422,23 +1877,48 @@ def _recolectar_mis_comentarios() -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: Cada item contiene
         id_comentario, id_post, fecha, autor y contenido.
     """
-    if not Sesion.activa():
+    if not sesion.activa():
         return []
-    posts = _cargar_todos_los_posts()
+    sid = str(sesion.id_autor)
     mis: List[Dict[str, Any]] = []
-    for p in posts:
+    agregar = mis.append
+    for p in _cargar_todos_los_posts():
+        id_post = str(p.get("id_post"))
         for c in p.get("comentarios") or []:
-            if str(c.get("id_autor") or "") == str(Sesion.id_autor):
-                mis.append({
-                    "id_comentario": str(c.get("id_comentario")),
-                    "id_post": str(p.get("id_post")),
-                    "fecha": str(c.get("fecha", "")),
-                    "autor": str(c.get("autor", "")),
-                    "contenido": str(c.get("contenido", "")),
-                })
+            id_c = c.get("id_autor")
+            # El modelo guarda ids como texto; str() solo para JSON editados
+            if id_c != sid and (id_c is None or str(id_c) != sid):
+                continue
+            agregar({
+                "id_comentario": str(c.get("id_comentario")),
+                "id_post": id_post,
+                "fecha": c.get("fecha", ""),
+                "autor": c.get("autor", ""),
+                "contenido": c.get("contenido", ""),
+            })
     return mis
 
 
+def _indice_mi_comentario(
+    mis: List[Dict[str, Any]], id_comentario: str, id_post: str
+) -> Optional[int]:
+    """
+    Ubica un comentario dentro de la lista de _recolectar_mis_comentarios.
+
+    Args:
+        mis: Comentarios propios ya recolectados.
+        id_comentario: ID del comentario.
+        id_post: ID del post que lo contiene.
+
+    Returns:
+        Optional[int]: Posición en la lista, o None si no está.
+    """
+    for i, c in enumerate(mis):
+        if c["id_comentario"] == id_comentario and c["id_post"] == id_post:
+            return i
+    return None
+
+
 def _tabla_mis_comentarios(mis: List[Dict[str, Any]]) -> Table:
     """
     Construye una tabla con los comentarios del autor en sesión.
@@ -1460,18 +1940,15 @@ def _tabla_mis_comentarios(mis: List[Dict[str, Any]]) -> Table:
     tabla.add_column("ID Post", width=8)
     tabla.add_column("Fecha", width=19)
     tabla.add_column("Contenido", overflow="fold")
+    agregar = tabla.add_row
     for c in mis:
         contenido = c["contenido"]
-        if len(contenido) <= RESUMEN_COMENTARIO_MAX:
-            contenido_corto = contenido
-        else:
-            # Reservar 3 caracteres para '...'
-            contenido_corto = contenido[: RESUMEN_COMENTARIO_MAX - 3] + "..."
-        tabla.add_row(
+        agregar(
             c["id_comentario"],
             c["id_post"],
             c["fecha"],
-            contenido_corto,
+            contenido if len(contenido) <= RESUMEN_COMENTARIO_MAX
+            else contenido[:_CORTE_COMENTARIO] + "...",
         )
     return tabla
 
@@ -1492,17 +1969,12 @@ def _mostrar_tabla_y_detalle_mis_comentarios(mis: List[Dict[str, Any]]) -> None:
     console.print(_tabla_mis_comentarios(mis))
     console.print()
     # Mostrar detalle de los posts donde están mis comentarios (sin repetir)
-    posts_unicos = []
-    vistos = set()
-    for c in mis:
-        if c["id_post"] not in vistos:
-            vistos.add(c["id_post"])
-            posts_unicos.append(c["id_post"])
-    for id_post in posts_unicos:
+    partes: List[Any] = []
+    for id_post in dict.fromkeys(c["id_post"] for c in mis):
         post = modelo.buscar_post_por_id(POSTS_JSON, id_post)
         if post:
-            render_post_twitter(post)
-            console.print()
+            partes += (_post_twitter(post), _SEPARADOR)
+    console.print(Group(*partes))
 
 
 def editar_post_ui() -> None:  # noqa: PLR0911, PLR0912, PLR0915
@@ -1512,15 +1984,11 @@ def editar_post_ui() -> None:  # noqa: PLR0911, PLR0912, PLR0915
     Returns:
         None
     """
-    if not Sesion.activa():
+    if not sesion.activa():
         mostrar_error("Debe iniciar sesión para editar sus publicaciones.")
         return
 
-    console.print(
-        Panel.fit(
-            "[bold cyan]Editar Publicación[/bold cyan]", border_style="bright_blue"
-        )
-    )
+    console.print(_encabezado("Editar Publicación"))
 
     # 1) Mostrar primero mis posts (tabla + detalle)
     mis_posts = _obtener_mis_posts()
@@ -1530,12 +1998,11 @@ def editar_post_ui() -> None:  # noqa: PLR0911, PLR0912, PLR0915
     _mostrar_tabla_y_detalle_posts(mis_posts)
 
     # 2) Pedir ID del post a editar (validando que sea mío)
-    ids_validos = {p["id_post"] for p in mis_posts}
     id_post = Prompt.ask("[magenta]ID del post a editar[/magenta]").strip()
     if id_post == "0":
         console.print("[yellow]Operación cancelada.[/yellow]")
         return
-    if id_post not in ids_validos:
+    if not _id_en_lista(mis_posts, id_post):
         mostrar_error("El ID indicado no pertenece a tus publicaciones.")
         return
 
@@ -1585,8 +2052,8 @@ def editar_post_ui() -> None:  # noqa: PLR0911, PLR0912, PLR0915
         return
 
     try:
-        post_act = modelo.actualizar_post(POSTS_JSON, id_post, Sesion.id_autor, nuevos)
-        mostrar_ok(f"Post actualizado: {post_act['titulo']}")
+        post_act = modelo.actualizar_post(POSTS_JSON, id_post, sesion.id_autor, nuevos)
+        mostrar_ok(f"Post actualizado: {escape(post_act['titulo'])}")
         # 5) Mostrar resultado: tabla actualizada + vista detalle del post
         mis_posts = _obtener_mis_posts()
         _mostrar_tabla_y_detalle_posts(mis_posts)
@@ -1606,15 +2073,11 @@ def eliminar_post_ui() -> None:
     Returns:
         None
     """
-    if not Sesion.activa():
+    if not sesion.activa():
         mostrar_error("Debe iniciar sesión para eliminar sus publicaciones.")
         return
 
-    console.print(
-        Panel.fit(
-            "[bold cyan]Eliminar Publicación[/bold cyan]\n", border_style="bright_blue"
-        )
-    )
+    console.print(_encabezado("Eliminar Publicación\n"))
 
     # 1) Mostrar primero mis posts (tabla + detalle)
     mis_posts = _obtener_mis_posts()
@@ -1624,13 +2087,12 @@ def eliminar_post_ui() -> None:
     _mostrar_tabla_y_detalle_posts(mis_posts)
 
     # 2) Pedir ID del post a eliminar (validando que sea mío)
-    ids_validos = {p["id_post"] for p in mis_posts}
     id_post = Prompt.ask("[magenta]ID del post a eliminar[/magenta]").strip()
     if id_post == "0":
         console.print("[yellow]Operación cancelada.[/yellow]")
 
         return
-    if id_post not in ids_validos:
+    if not _id_en_lista(mis_posts, id_post):
         mostrar_error("El ID indicado no pertenece a tus publicaciones.")
 
         return
@@ -1643,7 +2105,7 @@ def eliminar_post_ui() -> None:
         return
 
     try:
-        ok = modelo.eliminar_post(POSTS_JSON, id_post, Sesion.id_autor)
+        ok = modelo.eliminar_post(POSTS_JSON, id_post, sesion.id_autor)
         if ok:
             mostrar_ok("Publicación eliminada.")
         else:
@@ -1665,15 +2127,10 @@ def eliminar_comentario_ui() -> None:  # noqa: PLR0912
     Returns:
         None
     """
-    console.print(
-        Panel.fit(
-            "[bold cyan]Eliminar Comentario[/bold cyan]",
-            border_style="bright_magenta",
-        )
-    )
+    console.print(_encabezado("Eliminar Comentario", "bright_magenta"))
 
     # Requiere sesión para filtrar “mis comentarios”
-    if not Sesion.activa():
+    if not sesion.activa():
         mostrar_error("Debe iniciar sesión para eliminar sus comentarios.")
         return
 
@@ -1719,14 +2176,17 @@ def eliminar_comentario_ui() -> None:  # noqa: PLR0912
 
     try:
         ok = modelo.eliminar_comentario_de_post(
-            POSTS_JSON, id_post, id_com, id_autor_en_sesion=Sesion.id_autor
+            POSTS_JSON, id_post, id_com, id_autor_en_sesion=sesion.id_autor
         )
         if ok:
             mostrar_ok("Comentario eliminado.")
+            # Se quita de la lista ya recolectada en vez de recorrer todo de nuevo
+            i = _indice_mi_comentario(mis_coms, id_com, id_post)
+            if i is not None:
+                del mis_coms[i]
         else:
             mostrar_error("No se encontró el comentario.")
         # 4) Mostrar resultado: tabla actualizada + detalle de posts con mis comentarios
-        mis_coms = _recolectar_mis_comentarios()
         if mis_coms:
             _mostrar_tabla_y_detalle_mis_comentarios(mis_coms)
         else:
@@ -1743,16 +2203,11 @@ def agregar_comentario_ui() -> None:
     Returns:
         None
     """
-    if not Sesion.activa():
+    if not sesion.activa():
         mostrar_error("Debe iniciar sesión para comentar.")
         return
 
-    console.print(
-        Panel.fit(
-            "[bold cyan]Agregar Comentario[/bold cyan]",
-            border_style="bright_magenta",
-        )
-    )
+    console.print(_encabezado("Agregar Comentario", "bright_magenta"))
     id_post = Prompt.ask("[magenta]ID del post a comentar[/magenta]").strip()
     if id_post == "0":
         console.print("[yellow]Operación cancelada.[/yellow]")
@@ -1775,9 +2230,9 @@ def agregar_comentario_ui() -> None:
         modelo.agregar_comentario_a_post(
             POSTS_JSON,
             id_post,
-            Sesion.nombre_autor or "Anónimo",
+            sesion.nombre_autor or "Anónimo",
             contenido,
-            id_autor=Sesion.id_autor,
+            id_autor=sesion.id_autor,
         )
         mostrar_ok("¡Comentario publicado!")
         # Mostrar el post actualizado en vista detalle
@@ -1797,16 +2252,11 @@ def editar_comentario_ui() -> None:  # noqa: PLR0911, PLR0912, PLR0915
     Returns:
         None
     """
-    if not Sesion.activa():
+    if not sesion.activa():
         mostrar_error("Debe iniciar sesión para editar sus comentarios.")
         return
 
-    console.print(
-        Panel.fit(
-            "[bold cyan]Editar Comentario[/bold cyan]",
-            border_style="bright_magenta",
-        )
-    )
+    console.print(_encabezado("Editar Comentario", "bright_magenta"))
 
     # 1) Mostrar primero mis comentarios (tabla + detalle de sus posts)
     mis_coms = _recolectar_mis_comentarios()
@@ -1848,7 +2298,7 @@ def editar_comentario_ui() -> None:  # noqa: PLR0911, PLR0912, PLR0915
     for c in post.get("comentarios") or []:
         if (
             str(c.get("id_comentario")) == id_com
-            and str(c.get("id_autor")) == str(Sesion.id_autor)
+            and str(c.get("id_autor")) == str(sesion.id_autor)
         ):
             comentario_actual = c
             break
@@ -1870,12 +2320,12 @@ def editar_comentario_ui() -> None:  # noqa: PLR0911, PLR0912, PLR0915
     try:
         # Se asume que el modelo expone esta operación. Si no existe, mostrar aviso.
         if hasattr(modelo, "actualizar_comentario_de_post"):
-            modelo.actualizar_comentario_de_post(
+            actualizado = modelo.actualizar_comentario_de_post(
                 POSTS_JSON,
                 id_post,
                 id_com,
                 {"contenido": nuevo_contenido},
-                id_autor_en_sesion=Sesion.id_autor,
+                id_autor_en_sesion=sesion.id_autor,
             )
             mostrar_ok("Comentario actualizado.")
         else:
@@ -1886,8 +2336,10 @@ def editar_comentario_ui() -> None:  # noqa: PLR0911, PLR0912, PLR0915
             return
 
         # 4) Mostrar resultado: tabla actualizada +
-        # detalle de los posts donde tengo comentarios
-        mis_coms = _recolectar_mis_comentarios()
+        # detalle de los posts donde tengo comentarios (solo cambió uno)
+        i = _indice_mi_comentario(mis_coms, id_com, id_post)
+        if i is not None:
+            mis_coms[i]["contenido"] = actualizado["contenido"]
         if mis_coms:
             _mostrar_tabla_y_detalle_mis_comentarios(mis_coms)
         else:
@@ -1913,19 +2365,10 @@ def menu_comentarios() -> None:
         None
     """
     while True:
-        console.print(
-            Panel(
-                "[bold yellow]1.[/bold yellow]Agregar comentario\n"
-                "[bold yellow]2.[/bold yellow] Editar mi comentario\n"
-                "[bold yellow]3.[/bold yellow] Eliminar mi comentario\n"
-                "[bold yellow]4.[/bold yellow] Volver",
-                title="[bold cyan]Comentarios[/bold cyan]",
-                border_style="bright_blue",
-            )
-        )
+        console.print(_MENU_COMENTARIOS)
         opcion = Prompt.ask(
             "[magenta]Opción[/magenta]",
-            choices=["1", "2", "3", "4"],
+            choices=_OPCIONES_COMENTARIOS,
             show_choices=False,
         )
         if opcion == "1":
@@ -1939,6 +2382,65 @@ def menu_comentarios() -> None:
 
 
 # --- Menú principal ---
+def _leer_tecla() -> str:
+    """
+    Lee una sola tecla de la terminal sin esperar Enter.
+
+    En POSIX pone la terminal en modo cbreak (Ctrl+C sigue interrumpiendo)
+    y la restaura al terminar descartando lo que quedó sin leer (el Enter
+    tras la tecla o el resto de una secuencia de escape); en Windows usa
+    msvcrt.
+
+    Returns:
+        str: Carácter pulsado.
+
+    Raises:
+        EOFError: Si la entrada se cerró.
+    """
+    if msvcrt is not None:
+        return msvcrt.getwch()
+    fd = sys.stdin.fileno()
+    anterior = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        tecla = sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSAFLUSH, anterior)
+    if not tecla:
+        raise EOFError
+    return tecla
+
+
+def _elegir_opcion(opciones: frozenset[str]) -> str:
+    """
+    Lee una opción de menú y la valida contra un conjunto fijo.
+
+    Para una elección de un carácter no hace falta la maquinaria de
+    Prompt.ask. En una terminal basta con pulsar la tecla (sin Enter);
+    con la entrada redirigida se lee una línea. Se repite la pregunta
+    mientras la opción no sea válida.
+
+    Args:
+        opciones: Valores aceptados (de un carácter).
+
+    Returns:
+        str: Opción elegida (siempre dentro de `opciones`).
+    """
+    una_tecla = sys.stdin.isatty() and (msvcrt is not None or termios is not None)
+    while True:
+        if una_tecla:
+            console.print(_PROMPT_OPCION, end="")
+            opcion = _leer_tecla()
+            # Eco + salto de línea; las teclas de control no se muestran.
+            eco = opcion.strip() if opcion.isprintable() else ""
+            console.print(eco, highlight=False, markup=False)
+        else:
+            opcion = console.input(_PROMPT_OPCION).strip()
+        if opcion in opciones:
+            return opcion
+        console.print(_OPCION_INVALIDA)
+
+
 def mostrar_menu_principal() -> None:
     """
     Muestra el menú principal y el estado de sesión como subtítulo.
@@ -1946,32 +2448,58 @@ def mostrar_menu_principal() -> None:
     Returns:
         None
     """
-    sesion_txt = (
+    _MENU_PRINCIPAL.subtitle = (
         Text.assemble(
             Text("Conectado: ", style="bright_green"),
             Text(
-                f"{Sesion.nombre_autor} <{Sesion.email}>",
+                f"{sesion.nombre_autor} <{sesion.email}>",
                 style="green",
             ),
         )
-        if Sesion.activa()
-        else Text("Sin sesión", style="bright_yellow")
+        if sesion.activa()
+        else _SIN_SESION
     )
-    console.print(
-        Panel(
-            "[bold cyan]Bienvenido a Nuestro Blog Multi-usuario[/bold cyan]\n"
-            "[bold cyan]1)[/bold cyan] [bold yellow]Publicaciones (POSTS)"
-            "[/bold yellow]\n"
-            "[bold cyan]2)[/bold cyan] [bold yellow]Comentarios[/bold yellow]\n"
-            "[bold cyan]3)[/bold cyan] [bold yellow]Autores[/bold yellow]\n"
-            "[bold cyan]4)[/bold cyan] [bold yellow]Sesión[/bold yellow]",
-            title="[bold cyan]MENÚ PRINCIPAL[/bold cyan]",
-            border_style="bright_cyan",
-            subtitle=sesion_txt,
-            subtitle_align="right",
-        )
-    )
-    console.print("[bold red]5. Salir[/bold red]")
+    # Menú y opción de salida en un solo print (un render y una escritura)
+    console.print(Group(_MENU_PRINCIPAL, _SALIR))
+
+
+# Pares (AUTORES_CSV, POSTS_JSON) ya preparados por _preparar_datos() en este
+# proceso, para no repetir la inicialización si main() se vuelve a llamar.
+_DATOS_PREPARADOS: set[Tuple[str, str]] = set()
+
+
+def _preparar_datos() -> None:
+    """
+    Crea los archivos de datos y el post de bienvenida una vez por proceso.
+
+    Se repite solo si cambian las rutas o si alguno de los archivos dejó de
+    existir desde la última preparación.
+
+    Returns:
+        None
+    """
+    clave = (AUTORES_CSV, POSTS_JSON)
+    if clave in _DATOS_PREPARADOS and all(map(os.path.exists, clave)):
+        return
+    init_archivos()
+    # Asegurar bienvenida del sistema
+    ensure_sistema_y_bienvenida()
+    _DATOS_PREPARADOS.add(clave)
+
+
+# Mensajes de salida (Text ya armados, sin markup).
+_HASTA_LUEGO = Text.assemble("\n", ("¡Hasta luego!", "bold magenta"))
+_INTERRUMPIDO = Text.assemble(
+    "\n\n", ("Programa interrumpido por el usuario. Adiós.", "bold red")
+)
+
+# Opción del menú principal -> submenú ("5", salir, no tiene entrada).
+_ACCIONES_PRINCIPAL = {
+    "1": menu_publicaciones,
+    "2": menu_comentarios,
+    "3": menu_autores,
+    "4": menu_sesion,
+}
 
 
 def main() -> None:
@@ -1984,49 +2512,34 @@ def main() -> None:
     Returns:
         None
     """
-    init_archivos()
-    # Asegurar bienvenida del sistema
-    ensure_sistema_y_bienvenida()
-    banner()
-    # Salida solicitada: etiqueta y rutas en verde
-    console.print(
-        (
-            "Archivos de Datos: "
-            f"[green]{os.path.join('data','autores.csv')}[/green], "
-            f"[green]{os.path.join('data','posts.json')}[/green]"
-        )
-    )
+    _preparar_datos()
+    # Banner y, debajo, la etiqueta con las rutas en verde (un solo print)
+    console.print(Group(_BANNER, _LINEA_ARCHIVOS))
 
     # Onboarding: inicio de sesión por defecto primero
     if not onboarding_inicio():
-        console.print("\n[bold magenta]¡Hasta luego![/bold magenta]")
+        console.print(_HASTA_LUEGO)
         return
 
+    # Con la entrada redirigida (guion o tubería) no hay nadie mirando el
+    # menú: se omite su redibujado y el fin de la entrada equivale a salir.
+    interactivo = sys.stdin.isatty()
     while True:
-        mostrar_menu_principal()
-        opcion = Prompt.ask(
-            "[magenta]Opción[/magenta]",
-            choices=["1", "2", "3", "4", "5"],
-            show_choices=False,
-        )
-        if opcion == "1":
-            menu_publicaciones()
-        elif opcion == "2":
-            menu_comentarios()
-        elif opcion == "3":
-            menu_autores()
-        elif opcion == "4":
-            menu_sesion()
-        elif opcion == "5":
-            console.print("\n[bold magenta]¡Hasta luego![/bold magenta]")
+        if interactivo:
+            mostrar_menu_principal()
+        try:
+            opcion = _elegir_opcion(_OPCIONES_PRINCIPAL)
+        except EOFError:
+            opcion = "5"
+        accion = _ACCIONES_PRINCIPAL.get(opcion)
+        if accion is None:  # "5": salir
+            console.print(_HASTA_LUEGO)
             break
+        accion()
 
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        console.print(
-            "\n\n[bold red]Programa interrumpido por el usuario. "
-            "Adiós.[/bold red]"
-        )
+        console.print(_INTERRUMPIDO)
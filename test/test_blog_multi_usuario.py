@@ -419,3 +419,310 @@ def test_actualizar_comentario_validaciones_y_autorizacion(modelo: Any) -> None:
         id_autor_en_sesion=a1["id_autor"],
     )
     assert c2["contenido"] == "Editado"
+
+
+# -------------------
+# Caché de lectura
+# -------------------
+
+def test_cache_se_invalida_si_el_archivo_cambia_en_disco(modelo: Any) -> None:
+    """
+    La caché devuelve los datos en memoria, pero detecta escrituras externas.
+    """
+    a1 = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    primera = modelo._cargar(modelo._AUTORES)  # type: ignore[attr-defined]
+    assert modelo._cargar(modelo._AUTORES) is primera  # type: ignore[attr-defined]
+
+    # Escritura externa (otro proceso/módulo) sobre el mismo archivo
+    externos = [dict(a1, nombre_autor="Alicia")]
+    gestor_datos.guardar_datos(modelo._AUTORES, externos)  # type: ignore[attr-defined]
+
+    autor = modelo.buscar_autor_por_id(modelo._AUTORES, a1["id_autor"])  # type: ignore[attr-defined]
+    assert autor and autor["nombre_autor"] == "Alicia"
+
+
+def test_lecturas_entregan_copias_de_la_cache(modelo: Any) -> None:
+    """
+    Mutar lo que devuelven las lecturas no altera la caché ni los índices.
+    """
+    autor = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    post = modelo.crear_post(modelo._POSTS, autor["id_autor"], "T", "C", "python")  # type: ignore[attr-defined]
+    modelo.agregar_comentario_a_post(modelo._POSTS, post["id_post"], "Bob", "Hola")  # type: ignore[attr-defined]
+
+    autores = modelo.leer_todos_los_autores(modelo._AUTORES)  # type: ignore[attr-defined]
+    autores[0]["email"] = "otro@example.com"
+    autores.clear()
+    encontrado = modelo.buscar_autor_por_id(modelo._AUTORES, autor["id_autor"])  # type: ignore[attr-defined]
+    assert encontrado is not None
+    encontrado["nombre_autor"] = "Mallory"
+
+    posts = modelo.leer_todos_los_posts(modelo._POSTS)  # type: ignore[attr-defined]
+    posts[0]["tags"].append("intrusa")
+    posts[0]["comentarios"][0]["contenido"] = "editado"
+    del modelo.buscar_posts_por_tag(modelo._POSTS, "python")[0]["id_autor"]  # type: ignore[attr-defined]
+    modelo.listar_posts_por_autor(modelo._POSTS, autor["id_autor"])[0]["titulo"] = "X"  # type: ignore[attr-defined]
+
+    assert modelo.buscar_autor_por_email(modelo._AUTORES, "alice@example.com") == autor  # type: ignore[attr-defined]
+    assert modelo.buscar_posts_por_tag(modelo._POSTS, "intrusa") == []  # type: ignore[attr-defined]
+    actual = modelo.buscar_post_por_id(modelo._POSTS, post["id_post"])  # type: ignore[attr-defined]
+    assert actual["titulo"] == "T" and actual["id_autor"] == autor["id_autor"]
+    assert actual["tags"] == ["python"]
+    assert actual["comentarios"][0]["contenido"] == "Hola"
+
+
+def test_altas_y_ediciones_no_comparten_registros(modelo: Any) -> None:
+    """
+    Lo que devuelven las altas y ediciones es una copia: editar no cambia los
+    registros que el llamador ya tenía, y mutar la copia no toca la caché.
+    """
+    autores, posts = modelo._AUTORES, modelo._POSTS  # type: ignore[attr-defined]
+    autor = modelo.crear_autor(autores, "Alice", "alice@example.com")
+    id_autor = autor["id_autor"]
+    previo = modelo.buscar_autor_por_id(autores, id_autor)
+    editado = modelo.actualizar_autor(autores, id_autor, {"nombre_autor": "Ali"})
+    assert previo["nombre_autor"] == autor["nombre_autor"] == "Alice"
+    editado["email"] = "otro@example.com"
+    assert modelo.buscar_autor_por_email(autores, "alice@example.com")
+
+    post = modelo.crear_post(posts, id_autor, "T", "C", [])
+    post["comentarios"].append({"id_comentario": "9"})
+    modelo.actualizar_post(posts, post["id_post"], id_autor, {"titulo": "T2"})
+    assert post["titulo"] == "T"
+
+    comentario = modelo.agregar_comentario_a_post(posts, post["id_post"], "Bob", "Hola")
+    modelo.actualizar_comentario_de_post(
+        posts, post["id_post"], comentario["id_comentario"], {"contenido": "Chau"}
+    )
+    assert comentario["contenido"] == "Hola"
+    guardados = modelo.listar_comentarios_de_post(posts, post["id_post"])
+    assert [c["contenido"] for c in guardados] == ["Chau"]
+
+
+def test_crear_post_no_pisa_posts_truncados(modelo: Any) -> None:
+    """
+    Un posts.json truncado se lee como [], pero un alta no lo reescribe.
+    """
+    autor = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    modelo.crear_post(modelo._POSTS, autor["id_autor"], "T1", "C1", [])  # type: ignore[attr-defined]
+    posts = Path(modelo._POSTS)  # type: ignore[attr-defined]
+    truncado = posts.read_bytes()[:-10]
+    posts.write_bytes(truncado)
+
+    with pytest.raises(ValueError):
+        modelo.crear_post(modelo._POSTS, autor["id_autor"], "T2", "C2", [])  # type: ignore[attr-defined]
+    assert posts.read_bytes() == truncado
+
+
+def test_indices_por_id_y_email_tras_eliminar(modelo: Any) -> None:
+    """
+    Las búsquedas por ID y email siguen siendo correctas tras altas y bajas.
+    """
+    a1 = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    a2 = modelo.crear_autor(modelo._AUTORES, "Bob", "bob@example.com")  # type: ignore[attr-defined]
+    p1 = modelo.crear_post(modelo._POSTS, a1["id_autor"], "T1", "C1", [])  # type: ignore[attr-defined]
+    p2 = modelo.crear_post(modelo._POSTS, a1["id_autor"], "T2", "C2", [])  # type: ignore[attr-defined]
+
+    assert modelo.eliminar_post(modelo._POSTS, p1["id_post"], a1["id_autor"])  # type: ignore[attr-defined]
+    assert modelo.buscar_post_por_id(modelo._POSTS, p1["id_post"]) is None  # type: ignore[attr-defined]
+    encontrado = modelo.buscar_post_por_id(modelo._POSTS, p2["id_post"])  # type: ignore[attr-defined]
+    assert encontrado and encontrado["titulo"] == "T2"
+
+    assert modelo.eliminar_autor(modelo._AUTORES, a1["id_autor"])  # type: ignore[attr-defined]
+    assert modelo.buscar_autor_por_email(modelo._AUTORES, "alice@example.com") is None  # type: ignore[attr-defined]
+    bob = modelo.buscar_autor_por_email(modelo._AUTORES, "BOB@example.com")  # type: ignore[attr-defined]
+    assert bob and bob["id_autor"] == a2["id_autor"]
+    assert not modelo.autor_existe(modelo._AUTORES, a1["id_autor"])  # type: ignore[attr-defined]
+    assert modelo.autor_existe(modelo._AUTORES, int(a2["id_autor"]))  # type: ignore[attr-defined]
+
+    modelo.actualizar_autor(  # type: ignore[attr-defined]
+        modelo._AUTORES,
+        a2["id_autor"],
+        {"email": "roberto@ex.com"},
+    )
+    assert modelo.buscar_autor_por_email(modelo._AUTORES, "bob@example.com") is None  # type: ignore[attr-defined]
+    assert modelo.buscar_autor_por_email(modelo._AUTORES, "roberto@ex.com")  # type: ignore[attr-defined]
+
+    # Los emails liberados por bajas o cambios vuelven a estar disponibles
+    modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    modelo.crear_autor(modelo._AUTORES, "Bob", "bob@example.com")  # type: ignore[attr-defined]
+    with pytest.raises(modelo.EmailDuplicado):  # type: ignore[attr-defined]
+        modelo.crear_autor(modelo._AUTORES, "Rob", "ROBERTO@ex.com")  # type: ignore[attr-defined]
+
+
+def test_indice_de_tags_tras_actualizar_y_eliminar(modelo: Any) -> None:
+    """
+    La búsqueda por tag refleja cambios de tags y bajas de posts.
+    """
+    a = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    p1 = modelo.crear_post(modelo._POSTS, a["id_autor"], "T1", "C1", ["py", "web"])  # type: ignore[attr-defined]
+    p2 = modelo.crear_post(modelo._POSTS, a["id_autor"], "T2", "C2", ["py"])  # type: ignore[attr-defined]
+
+    modelo.actualizar_post(  # type: ignore[attr-defined]
+        modelo._POSTS, p1["id_post"], a["id_autor"], {"tags": "web, Datos"}
+    )
+    py = modelo.buscar_posts_por_tag(modelo._POSTS, "PY")  # type: ignore[attr-defined]
+    assert [p["id_post"] for p in py] == [p2["id_post"]]
+    datos = modelo.buscar_posts_por_tag(modelo._POSTS, "datos")  # type: ignore[attr-defined]
+    assert [p["id_post"] for p in datos] == [p1["id_post"]]
+
+    assert modelo.eliminar_post(modelo._POSTS, p1["id_post"], a["id_autor"])  # type: ignore[attr-defined]
+    assert modelo.buscar_posts_por_tag(modelo._POSTS, "web") == []  # type: ignore[attr-defined]
+    py = modelo.buscar_posts_por_tag(modelo._POSTS, "py")  # type: ignore[attr-defined]
+    assert [p["titulo"] for p in py] == ["T2"]
+
+
+def test_indice_de_posts_por_autor(modelo: Any) -> None:
+    """
+    Listar posts por autor respeta el orden de alta y las bajas.
+    """
+    a = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    b = modelo.crear_autor(modelo._AUTORES, "Bob", "bob@example.com")  # type: ignore[attr-defined]
+    p1 = modelo.crear_post(modelo._POSTS, a["id_autor"], "T1", "C1", [])  # type: ignore[attr-defined]
+    modelo.crear_post(modelo._POSTS, b["id_autor"], "T2", "C2", [])  # type: ignore[attr-defined]
+    p3 = modelo.crear_post(modelo._POSTS, a["id_autor"], "T3", "C3", [])  # type: ignore[attr-defined]
+
+    mios = modelo.listar_posts_por_autor(modelo._POSTS, int(a["id_autor"]))  # type: ignore[attr-defined]
+    assert [p["id_post"] for p in mios] == [p1["id_post"], p3["id_post"]]
+
+    assert modelo.eliminar_post(modelo._POSTS, p1["id_post"], a["id_autor"])  # type: ignore[attr-defined]
+    mios = modelo.listar_posts_por_autor(modelo._POSTS, a["id_autor"])  # type: ignore[attr-defined]
+    assert [p["titulo"] for p in mios] == ["T3"]
+
+
+def test_buscar_post_por_tag_y_autor(modelo: Any) -> None:
+    """
+    Devuelve el primer post del autor con el tag, o None si no hay.
+    """
+    a = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    b = modelo.crear_autor(modelo._AUTORES, "Bob", "bob@example.com")  # type: ignore[attr-defined]
+    modelo.crear_post(modelo._POSTS, b["id_autor"], "T1", "C1", ["intro"])  # type: ignore[attr-defined]
+    modelo.crear_post(modelo._POSTS, a["id_autor"], "T2", "C2", ["otro"])  # type: ignore[attr-defined]
+    p3 = modelo.crear_post(modelo._POSTS, a["id_autor"], "T3", "C3", ["Intro"])  # type: ignore[attr-defined]
+    modelo.crear_post(modelo._POSTS, a["id_autor"], "T4", "C4", ["intro"])  # type: ignore[attr-defined]
+
+    hallado = modelo.buscar_post_por_tag_y_autor(  # type: ignore[attr-defined]
+        modelo._POSTS, " INTRO ", int(a["id_autor"])  # type: ignore[attr-defined]
+    )
+    assert hallado is not None and hallado["id_post"] == p3["id_post"]
+    assert modelo.buscar_post_por_tag_y_autor(  # type: ignore[attr-defined]
+        modelo._POSTS, "nada", a["id_autor"]  # type: ignore[attr-defined]
+    ) is None
+    with pytest.raises(modelo.ValidacionError):
+        modelo.buscar_post_por_tag_y_autor(modelo._POSTS, " ", a["id_autor"])  # type: ignore[attr-defined]
+
+
+def test_ids_consecutivos_con_maximo_cacheado(modelo: Any) -> None:
+    """
+    Los IDs siguen el máximo vigente, también tras eliminar el último.
+    """
+    a = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    p1 = modelo.crear_post(modelo._POSTS, a["id_autor"], "T1", "C1", [])  # type: ignore[attr-defined]
+    p2 = modelo.crear_post(modelo._POSTS, a["id_autor"], "T2", "C2", [])  # type: ignore[attr-defined]
+    assert (p1["id_post"], p2["id_post"]) == ("1", "2")
+
+    assert modelo.eliminar_post(modelo._POSTS, p2["id_post"], a["id_autor"])  # type: ignore[attr-defined]
+    p3 = modelo.crear_post(modelo._POSTS, a["id_autor"], "T3", "C3", [])  # type: ignore[attr-defined]
+    assert p3["id_post"] == "2"
+
+    c1 = modelo.agregar_comentario_a_post(modelo._POSTS, p1["id_post"], "Ana", "Uno")  # type: ignore[attr-defined]
+    c2 = modelo.agregar_comentario_a_post(modelo._POSTS, p1["id_post"], "Ana", "Dos")  # type: ignore[attr-defined]
+    assert (c1["id_comentario"], c2["id_comentario"]) == ("1", "2")
+    assert modelo.eliminar_comentario_de_post(  # type: ignore[attr-defined]
+        modelo._POSTS, p1["id_post"], c2["id_comentario"]
+    )
+    c3 = modelo.agregar_comentario_a_post(modelo._POSTS, p1["id_post"], "Ana", "Tres")  # type: ignore[attr-defined]
+    assert c3["id_comentario"] == "2"
+
+
+def test_alta_rechazada_no_consume_id(modelo: Any) -> None:
+    """
+    Un crear_post que falla la validación no reserva ID para el siguiente.
+    """
+    a = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    p1 = modelo.crear_post(modelo._POSTS, a["id_autor"], "T1", "C1", [])  # type: ignore[attr-defined]
+    for _ in range(2):
+        with pytest.raises(modelo.ValidacionError):
+            modelo.crear_post(modelo._POSTS, a["id_autor"], "T", "C", 123)  # type: ignore[attr-defined]
+    p2 = modelo.crear_post(modelo._POSTS, a["id_autor"], "T2", "C2", [])  # type: ignore[attr-defined]
+    assert (p1["id_post"], p2["id_post"]) == ("1", "2")
+
+
+def test_actualizar_invalido_no_modifica_el_registro(modelo: Any) -> None:
+    """
+    Si una validación falla, no queda ningún cambio parcial en memoria.
+    """
+    a = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    p = modelo.crear_post(modelo._POSTS, a["id_autor"], "T1", "C1", ["py"])  # type: ignore[attr-defined]
+
+    with pytest.raises(modelo.ValidacionError):  # type: ignore[attr-defined]
+        modelo.actualizar_autor(  # type: ignore[attr-defined]
+            modelo._AUTORES, a["id_autor"], {"nombre_autor": "Otra", "email": "mal"}
+        )
+    autor = modelo.buscar_autor_por_id(modelo._AUTORES, a["id_autor"])  # type: ignore[attr-defined]
+    assert autor and autor["nombre_autor"] == "Alice"
+
+    with pytest.raises(modelo.ValidacionError):  # type: ignore[attr-defined]
+        modelo.actualizar_post(  # type: ignore[attr-defined]
+            modelo._POSTS, p["id_post"], a["id_autor"], {"titulo": "Nuevo", "tags": 5}
+        )
+    post = modelo.buscar_post_por_id(modelo._POSTS, p["id_post"])  # type: ignore[attr-defined]
+    assert post and post["titulo"] == "T1" and post["tags"] == ["py"]
+
+
+def test_posts_externos_incompletos_se_normalizan(modelo: Any) -> None:
+    """
+    Los posts escritos a mano sin todos los campos se completan al cargar.
+    """
+    gestor_datos.guardar_datos(  # type: ignore[attr-defined]
+        modelo._POSTS,  # type: ignore[attr-defined]
+        [{"id_post": "7", "id_autor": "1", "titulo": "T", "tags": ["Python"]},
+         {"id_post": "8", "tags": None}],
+    )
+
+    post = modelo.buscar_post_por_id(modelo._POSTS, "8")  # type: ignore[attr-defined]
+    assert post and post["id_autor"] == "" and post["tags"] == []
+    assert post["comentarios"] == []
+    encontrados = modelo.buscar_posts_por_tag(modelo._POSTS, "python")  # type: ignore[attr-defined]
+    assert [p["id_post"] for p in encontrados] == ["7"]
+    nuevo = modelo.crear_post(modelo._POSTS, "1", "Otro", "C", [])  # type: ignore[attr-defined]
+    assert nuevo["id_post"] == "9"
+
+
+def test_altas_dentro_de_un_lote_se_escriben_al_salir(modelo: Any) -> None:
+    """
+    Varias altas dentro de gestor_datos.lote se persisten juntas al cerrar.
+    """
+    a = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    # Se usa el mismo módulo gestor_datos que importa el modelo
+    with modelo.gestor_datos.lote(modelo._POSTS):  # type: ignore[attr-defined]
+        for n in range(3):
+            modelo.crear_post(modelo._POSTS, a["id_autor"], f"T{n}", "C", ["x"])  # type: ignore[attr-defined]
+        assert gestor_datos.cargar_datos(modelo._POSTS) == []  # type: ignore[attr-defined]
+        en_memoria = modelo.buscar_posts_por_tag(modelo._POSTS, "x")  # type: ignore[attr-defined]
+        assert [p["id_post"] for p in en_memoria] == ["1", "2", "3"]
+
+    en_disco = gestor_datos.cargar_datos(modelo._POSTS)  # type: ignore[attr-defined]
+    assert [p["titulo"] for p in en_disco] == ["T0", "T1", "T2"]
+    assert modelo.buscar_post_por_id(modelo._POSTS, "3")  # type: ignore[attr-defined]
+
+
+def test_indice_de_comentarios_tras_eliminar_uno_intermedio(modelo: Any) -> None:
+    """
+    Tras borrar un comentario intermedio, los siguientes siguen localizables.
+    """
+    a = modelo.crear_autor(modelo._AUTORES, "Alice", "alice@example.com")  # type: ignore[attr-defined]
+    p = modelo.crear_post(modelo._POSTS, a["id_autor"], "T", "C", [])  # type: ignore[attr-defined]
+    ids = [
+        modelo.agregar_comentario_a_post(modelo._POSTS, p["id_post"], "Ana", f"c{n}")  # type: ignore[attr-defined]
+        ["id_comentario"]
+        for n in range(3)
+    ]
+
+    assert modelo.eliminar_comentario_de_post(modelo._POSTS, p["id_post"], ids[0])  # type: ignore[attr-defined]
+    assert not modelo.eliminar_comentario_de_post(modelo._POSTS, p["id_post"], ids[0])  # type: ignore[attr-defined]
+    editado = modelo.actualizar_comentario_de_post(  # type: ignore[attr-defined]
+        modelo._POSTS, p["id_post"], ids[2], {"contenido": "editado"}
+    )
+    assert editado["id_comentario"] == ids[2]
+    restantes = modelo.listar_comentarios_de_post(modelo._POSTS, p["id_post"])  # type: ignore[attr-defined]
+    assert [c["contenido"] for c in restantes] == ["c1", "editado"]
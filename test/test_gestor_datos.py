@@ -6,8 +6,15 @@ utilidades auxiliares, incluyendo casos de éxito y casos borde.
 from __future__ import annotations
 
 import csv
+import gzip
+import io
 import json
+import threading
+import time
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 import src.Modulo.gestor_datos as gd
 
@@ -53,6 +60,33 @@ def test_escritura_atomica_reemplaza_contenido(tmp_path: Path) -> None:
     assert json.loads(archivo.read_text(encoding="utf-8")) == [1, 2, 3]
 
 
+def test_escritura_atomica_recrea_directorio_borrado(tmp_path: Path) -> None:
+    """Si el directorio memorizado desaparece, se vuelve a crear."""
+    archivo = tmp_path / "datos" / "posts.json"
+    gd._escritura_atomica(str(archivo), "[]")  # noqa: SLF001
+    archivo.unlink()
+    archivo.parent.rmdir()
+
+    gd._escritura_atomica(str(archivo), "[1]")  # noqa: SLF001
+    assert json.loads(archivo.read_text(encoding="utf-8")) == [1]
+
+
+def test_archivo_atomico_no_toca_destino_si_falla(tmp_path: Path) -> None:
+    """Si la escritura falla, el destino queda igual y no quedan temporales."""
+    archivo = tmp_path / "autores.csv"
+    archivo.write_text("original", encoding="utf-8")
+
+    try:
+        with gd._archivo_atomico(str(archivo)) as tmp:  # noqa: SLF001
+            tmp.write("parcial")
+            raise RuntimeError("fallo simulado")
+    except RuntimeError:
+        pass
+
+    assert archivo.read_text(encoding="utf-8") == "original"
+    assert [p.name for p in tmp_path.iterdir()] == ["autores.csv"]
+
+
 # -----------------------------
 # Inicialización
 # -----------------------------
@@ -84,6 +118,18 @@ def test_inicializar_archivo_json_crea_lista_vacia(tmp_path: Path) -> None:
     assert json.loads(ruta.read_text(encoding="utf-8")) == []
 
 
+def test_inicializar_archivo_no_pisa_existente_ni_crea_otros(tmp_path: Path) -> None:
+    """No reescribe archivos existentes ni crea formatos no soportados."""
+    ruta = tmp_path / "posts.json"
+    ruta.write_text('[{"id_post": "1"}]', encoding="utf-8")
+    gd.inicializar_archivo(str(ruta))
+    assert json.loads(ruta.read_text(encoding="utf-8")) == [{"id_post": "1"}]
+
+    otro = tmp_path / "notas.txt"
+    gd.inicializar_archivo(str(otro))
+    assert not otro.exists()
+
+
 # -----------------------------
 # Carga de datos
 # -----------------------------
@@ -96,6 +142,51 @@ def test_cargar_datos_csv_vacio(tmp_path: Path) -> None:
     assert datos == []
 
 
+def test_cargar_datos_csv_filas_cortas_largas_y_en_blanco(tmp_path: Path) -> None:
+    """Completa celdas faltantes con "", ignora sobrantes y líneas vacías."""
+    ruta = tmp_path / "autores.csv"
+    ruta.write_text(
+        "id_autor,nombre_autor,email,password_hash\r\n"
+        "1, Ana ,a@x.com\r\n"
+        "\r\n"
+        "2,Bo,b@x.com,h,extra\r\n",
+        encoding="utf-8",
+    )
+    assert gd.cargar_datos(str(ruta)) == [
+        {"id_autor": "1", "nombre_autor": "Ana", "email": "a@x.com",
+         "password_hash": ""},
+        {"id_autor": "2", "nombre_autor": "Bo", "email": "b@x.com",
+         "password_hash": "h"},
+    ]
+
+
+def test_cargar_datos_csv_como_tuplas(tmp_path: Path) -> None:
+    """Con como_dicts=False el CSV de autores se lee como tuplas Autor."""
+    ruta = tmp_path / "autores.csv"
+    ruta.write_text(
+        "email,id_autor,nombre_autor\n a@x.com ,1,Ana\n\nb@x.com,2\n",
+        encoding="utf-8",
+    )
+    autores = gd.cargar_datos(str(ruta), como_dicts=False)
+    assert autores == [gd.Autor("1", "Ana", "a@x.com", ""),
+                       gd.Autor("2", "", "b@x.com", "")]
+    assert autores[0].email == "a@x.com"
+    assert autores[0]._asdict() == gd.cargar_datos(str(ruta))[0] | {
+        "password_hash": ""}
+
+    gd.guardar_datos(str(ruta), [{"id_autor": 7, "nombre_autor": "Eva"}])
+    assert gd.cargar_datos(str(ruta), como_dicts=False) == [
+        gd.Autor("7", "Eva", "", "")]
+    assert gd.cargar_datos(str(tmp_path / "nuevo.csv"), como_dicts=False) == []
+
+
+def test_cargar_datos_csv_con_otra_cabecera(tmp_path: Path) -> None:
+    """Con cabeceras distintas a las de autores usa las del archivo."""
+    ruta = tmp_path / "autores.csv"
+    ruta.write_text("email,id_autor\r\n a@x.com ,1\r\n", encoding="utf-8")
+    assert gd.cargar_datos(str(ruta)) == [{"email": "a@x.com", "id_autor": "1"}]
+
+
 def test_cargar_datos_json_invalido_retorna_lista_vacia(tmp_path: Path) -> None:
     """Si el JSON es inválido o no es una lista, retorna []."""
     ruta = tmp_path / "posts.json"
@@ -110,6 +201,68 @@ def test_cargar_datos_json_invalido_retorna_lista_vacia(tmp_path: Path) -> None:
     assert datos == []
 
 
+def test_cargar_datos_reutiliza_lectura_si_el_archivo_no_cambia(tmp_path: Path) -> None:
+    """Lecturas repetidas devuelven listas nuevas y detectan cambios en disco."""
+    ruta = tmp_path / "posts.json"
+    gd.guardar_datos(str(ruta), [{"id_post": "1"}])
+
+    primera = gd.cargar_datos(str(ruta))
+    primera.append({"id_post": "basura"})
+    segunda = gd.cargar_datos(str(ruta))
+    assert segunda == [{"id_post": "1"}]
+    assert segunda is not primera
+
+    # Tampoco se comparten las filas ni sus listas con la caché
+    gd.guardar_datos(str(ruta), [{"id_post": "1", "tags": ["a"],
+                                  "comentarios": [{"id_comentario": "1"}]}])
+    filas = gd.cargar_datos(str(ruta))
+    filas[0]["id_post"] = "99"
+    gd.cargar_datos(str(ruta))[0]["tags"].append("b")
+    gd.cargar_datos(str(ruta))[0]["comentarios"][0]["id_comentario"] = "2"
+    assert gd.cargar_datos(str(ruta)) == [{"id_post": "1", "tags": ["a"],
+                                           "comentarios": [{"id_comentario": "1"}]}]
+
+    # Escritura externa: la firma cambia y se vuelve a leer
+    ruta.write_text(json.dumps([{"id_post": "2"}, {"id_post": "3"}]), encoding="utf-8")
+    assert gd.cargar_datos(str(ruta)) == [{"id_post": "2"}, {"id_post": "3"}]
+
+
+def test_cargar_muchos_lee_en_paralelo_y_usa_cache(tmp_path: Path) -> None:
+    """cargar_muchos devuelve lo mismo que cargar_datos para cada ruta."""
+    csv_path = tmp_path / "autores.csv"
+    json_path = tmp_path / "posts.json"
+    nuevo = tmp_path / "nuevo.json"
+    gd.guardar_datos(str(csv_path), [{"id_autor": "1", "nombre_autor": "Ana"}])
+    gd.guardar_datos(str(json_path), [{"id_post": "1"}])
+    gd.cargar_datos(str(json_path))  # queda en caché
+
+    rutas = [str(csv_path), str(json_path), str(nuevo), str(csv_path)]
+    datos = gd.cargar_muchos(rutas)
+    assert list(datos) == [str(csv_path), str(json_path), str(nuevo)]
+    assert datos[str(csv_path)][0]["nombre_autor"] == "Ana"
+    assert datos[str(json_path)] == [{"id_post": "1"}]
+    assert datos[str(nuevo)] == []
+    assert nuevo.exists()
+
+
+def test_cargar_json_grande_por_mmap(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Por encima del umbral se parsea una vista mmap del archivo."""
+    class _OrjsonFalso:
+        @staticmethod
+        def loads(vista: memoryview) -> object:
+            assert isinstance(vista, memoryview)
+            return json.loads(bytes(vista))
+
+    ruta = tmp_path / "posts.json"
+    ruta.write_text(json.dumps([{"id_post": "1", "titulo": "Ñandú"}]), encoding="utf-8")
+    monkeypatch.setattr(gd, "orjson", _OrjsonFalso)
+    monkeypatch.setattr(gd, "_UMBRAL_MMAP", 1)
+
+    assert gd.cargar_datos(str(ruta)) == [{"id_post": "1", "titulo": "Ñandú"}]
+
+
 # -----------------------------
 # Guardado de datos
 # -----------------------------
@@ -166,3 +319,245 @@ def test_guardar_y_cargar_en_formato_no_soportado_no_falla(tmp_path: Path) -> No
     gd.guardar_datos(str(ruta), [{"a": 1}])
     # Cargar retorna []
     assert gd.cargar_datos(str(ruta)) == []
+
+
+def test_guardar_csv_autores_igual_que_csv_writer(tmp_path: Path) -> None:
+    """La escritura en bytes produce lo mismo que csv.writer."""
+    autores = [
+        {"id_autor": 1, "nombre_autor": "Ana, la \"jefa\"", "email": None},
+        {"id_autor": "2", "nombre_autor": "Línea\nnueva", "email": "b@x.com",
+         "password_hash": "h\r", "extra": "ignorado"},
+        {"id_autor": 0, "nombre_autor": " Ñandú ", "email": "", "password_hash": ""},
+    ]
+    ruta = tmp_path / "autores.csv"
+    gd.guardar_datos(str(ruta), autores)
+
+    esperado = io.StringIO(newline="")
+    escritor = csv.writer(esperado)
+    escritor.writerow(gd.CAMPOS_AUTORES)
+    escritor.writerows(gd._fila_csv(a, gd.CAMPOS_AUTORES)  # noqa: SLF001
+                       for a in autores)
+    assert ruta.read_bytes() == esperado.getvalue().encode("utf-8")
+    assert gd.cargar_datos(str(ruta))[1]["nombre_autor"] == "Línea\nnueva"
+
+
+def test_json_comprimido_con_gzip(tmp_path: Path) -> None:
+    """Los .json.gz se inicializan, guardan, anexan y leen comprimidos."""
+    ruta = tmp_path / "posts.json.gz"
+    assert gd.cargar_datos(str(ruta)) == []
+    assert json.loads(gzip.decompress(ruta.read_bytes())) == []
+
+    gd.guardar_datos(str(ruta), [{"id_post": "1", "titulo": "Año"}])
+    gd.anexar_registro(str(ruta), {"id_post": "2"})
+    esperado = [{"id_post": "1", "titulo": "Año"}, {"id_post": "2"}]
+    assert json.loads(gzip.decompress(ruta.read_bytes())) == esperado
+    assert gd.cargar_datos(str(ruta)) == esperado
+
+    ruta.write_bytes(ruta.read_bytes()[:10])  # gzip truncado
+    assert gd.cargar_datos(str(ruta)) == []
+
+
+def test_json_comprimido_con_zstd(tmp_path: Path) -> None:
+    """Los .json.zst sin tamaño en la cabecera se leen; los corruptos dan []."""
+    zstandard = pytest.importorskip("zstandard")
+    ruta = tmp_path / "posts.json.zst"
+    esperado = [{"id_post": "1", "titulo": "Año"}]
+    compresor = zstandard.ZstdCompressor().compressobj()  # Trama por streaming
+    ruta.write_bytes(compresor.compress(json.dumps(esperado).encode("utf-8"))
+                     + compresor.flush())
+    assert gd.cargar_datos(str(ruta)) == esperado
+
+    ruta.write_bytes(b"\x28\xb5\x2f\xfd" + b"no es zstd")  # Cabecera y basura
+    assert gd.cargar_datos(str(ruta)) == []
+    with pytest.raises(ValueError):
+        gd.anexar_registro(str(ruta), {"id_post": "2"})
+
+
+def test_sangria_json_no_depende_de_orjson(tmp_path: Path) -> None:
+    """El JSON en disco usa siempre la sangría de json.dumps(indent=4)."""
+    ruta = tmp_path / "posts.json"
+    datos = [{"id_post": "1", "tags": ["a", "b"], "comentarios": [],
+              "titulo": "  con  espacios\n"}]
+    gd.guardar_datos(str(ruta), datos)
+    gd.anexar_registro(str(ruta), {"id_post": "2", "tags": ["c"]})
+    esperado = json.dumps([*datos, {"id_post": "2", "tags": ["c"]}],
+                          ensure_ascii=False, indent=4)
+    assert ruta.read_text(encoding="utf-8") == esperado
+
+
+def test_guardar_json_compacto(tmp_path: Path) -> None:
+    """Con indentar=False el JSON se escribe en una línea y se lee igual."""
+    ruta = tmp_path / "posts.json"
+    entrada = [{"id_post": "1", "titulo": "Añadir", "tags": ["a", "b"]}]
+    gd.guardar_datos(str(ruta), entrada, indentar=False)
+
+    assert "\n" not in ruta.read_text(encoding="utf-8")
+    assert gd.cargar_datos(str(ruta)) == entrada
+
+    # Un alta incremental sobre el JSON compacto sigue produciendo una lista
+    gd.anexar_registro(str(ruta), {"id_post": "2"})
+    assert [p["id_post"] for p in gd.cargar_datos(str(ruta))] == ["1", "2"]
+
+
+# -----------------------------
+# Altas incrementales
+# -----------------------------
+
+def test_anexar_registro_json_equivale_a_guardar_todo(tmp_path: Path) -> None:
+    """Agregar al final produce el mismo JSON que reescribir la lista."""
+    ruta = tmp_path / "posts.json"
+    gd.anexar_registro(str(ruta), {"id_post": "1", "titulo": "Hola"})
+    gd.anexar_registro(str(ruta), {"id_post": "2", "titulo": "Añadido"})
+
+    esperado = [
+        {"id_post": "1", "titulo": "Hola"},
+        {"id_post": "2", "titulo": "Añadido"},
+    ]
+    assert json.loads(ruta.read_text(encoding="utf-8")) == esperado
+    assert gd.cargar_datos(str(ruta)) == esperado
+
+
+def test_anexar_registro_csv_y_json_invalido(tmp_path: Path) -> None:
+    """Agrega filas CSV y recurre a reescritura si el JSON no es una lista."""
+    autores = tmp_path / "autores.csv"
+    gd.anexar_registro(str(autores), {"id_autor": 1, "nombre_autor": "Ana",
+                                      "email": "a@x.com", "password_hash": None})
+    assert gd.cargar_datos(str(autores)) == [
+        {"id_autor": "1", "nombre_autor": "Ana", "email": "a@x.com",
+         "password_hash": ""}
+    ]
+
+    posts = tmp_path / "posts.json"
+    posts.write_text(json.dumps({"a": 1}), encoding="utf-8")
+    gd.anexar_registro(str(posts), {"id_post": "1"})
+    assert gd.cargar_datos(str(posts)) == [{"id_post": "1"}]
+
+
+def test_anexar_json_restaura_el_archivo_si_falla(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """El alta se escribe en sitio; si falla, el archivo vuelve a ser el previo."""
+    posts = tmp_path / "posts.json"
+    gd.guardar_datos(str(posts), [{"id_post": "1"}])
+    previo = posts.read_bytes()
+    inodo = posts.stat().st_ino
+
+    fallos = iter([OSError("disco lleno")])
+
+    def _fsync(fd: int) -> None:
+        error = next(fallos, None)
+        if error is not None:
+            raise error
+
+    monkeypatch.setattr(gd.os, "fsync", _fsync)
+    with pytest.raises(OSError):
+        gd.anexar_registro(str(posts), {"id_post": "2"})
+    assert posts.read_bytes() == previo
+
+    gd.anexar_registro(str(posts), {"id_post": "2"})
+    assert posts.stat().st_ino == inodo  # Sin temporal ni reemplazo
+    assert gd.cargar_datos(str(posts)) == [{"id_post": "1"}, {"id_post": "2"}]
+
+
+def test_anexar_registro_no_pisa_json_truncado(tmp_path: Path) -> None:
+    """Un JSON ilegible no se toma por [] al reescribir: se conserva tal cual."""
+    posts = tmp_path / "posts.json"
+    gd.guardar_datos(str(posts), [{"id_post": "1"}, {"id_post": "2"}])
+    truncado = posts.read_bytes()[:-10]
+    posts.write_bytes(truncado)
+
+    with pytest.raises(ValueError):
+        gd.anexar_registro(str(posts), {"id_post": "3"})
+    assert posts.read_bytes() == truncado
+    assert [p.name for p in tmp_path.iterdir()] == ["posts.json"]
+
+
+# -----------------------------
+# Lotes de escritura
+# -----------------------------
+
+def test_lote_difiere_escrituras_hasta_salir(tmp_path: Path) -> None:
+    """Dentro del lote no se toca el archivo; al salir se escribe una vez."""
+    ruta = tmp_path / "posts.json"
+    gd.guardar_datos(str(ruta), [{"id_post": "1"}])
+
+    with gd.lote(str(ruta)):
+        assert gd.en_lote(str(ruta))
+        gd.anexar_registro(str(ruta), {"id_post": "2"})
+        with gd.lote(str(ruta)):
+            gd.anexar_registro(str(ruta), {"id_post": "3"})
+        # El lote interno no vuelca; las lecturas ven lo pendiente
+        assert json.loads(ruta.read_text(encoding="utf-8")) == [{"id_post": "1"}]
+        assert gd.cargar_datos(str(ruta))[-1] == {"id_post": "3"}
+
+    assert not gd.en_lote(str(ruta))
+    assert gd.cargar_datos(str(ruta)) == [
+        {"id_post": "1"}, {"id_post": "2"}, {"id_post": "3"}
+    ]
+
+
+def test_guardar_diferido_agrupa_en_una_escritura(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Los guardados diferidos se escriben una vez, al vencer o al volcar."""
+    ruta = tmp_path / "posts.json"
+    escrituras: list[str] = []
+    original = gd._archivo_atomico  # noqa: SLF001
+
+    def _contar(*args: Any, **kwargs: Any) -> Any:
+        escrituras.append(str(args[0]))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(gd, "_archivo_atomico", _contar)
+    monkeypatch.setattr(gd, "_DEMORA_DIFERIDA", 60)
+
+    gd.guardar_datos(str(ruta), [{"id_post": "1"}], diferir=True)
+    gd.guardar_datos(str(ruta), [{"id_post": "2"}], diferir=True)
+    gd.anexar_registro(str(ruta), {"id_post": "3"})
+    assert not ruta.exists()
+    assert gd.cargar_datos(str(ruta)) == [{"id_post": "2"}, {"id_post": "3"}]
+
+    gd.volcar_pendientes()
+    assert len(escrituras) == 1
+    assert json.loads(ruta.read_text(encoding="utf-8")) == [
+        {"id_post": "2"}, {"id_post": "3"}
+    ]
+
+    # Una escritura inmediata reemplaza a la diferida en espera
+    gd.guardar_datos(str(ruta), [{"id_post": "9"}], diferir=True)
+    gd.guardar_datos(str(ruta), [])
+    gd.volcar_pendientes()
+    assert gd.cargar_datos(str(ruta)) == []
+
+
+def test_volcado_diferido_no_se_cruza_con_lecturas_ni_escrituras(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Durante un volcado diferido, otro hilo lee lo nuevo y no es pisado."""
+    ruta = str(tmp_path / "posts.json")
+    gd.guardar_datos(ruta, [{"id_post": "1"}])
+    monkeypatch.setattr(gd, "_DEMORA_DIFERIDA", 60)
+    gd.guardar_datos(ruta, [{"id_post": "1"}, {"id_post": "2"}], diferir=True)
+
+    leidos: list[Any] = []
+
+    def _otro_hilo() -> None:
+        datos = gd.cargar_datos(ruta)
+        leidos.append(datos)
+        gd.guardar_datos(ruta, [*datos, {"id_post": "3"}])
+
+    hilo = threading.Thread(target=_otro_hilo)
+    original = gd._escribir  # noqa: SLF001
+
+    def _escribir_lento(*args: Any) -> None:
+        if not hilo.is_alive() and not leidos:
+            hilo.start()
+            time.sleep(0.1)  # El otro hilo intenta leer y escribir ahora
+        original(*args)
+
+    monkeypatch.setattr(gd, "_escribir", _escribir_lento)
+    gd.volcar_pendientes()
+    hilo.join()
+
+    assert leidos == [[{"id_post": "1"}, {"id_post": "2"}]]
+    assert [p["id_post"] for p in gd.cargar_datos(ruta)] == ["1", "2", "3"]
@@ -0,0 +1,135 @@
+"""Pruebas unitarias del módulo `gestor_datos_sqlite`.
+
+Cubre la API equivalente a `gestor_datos` sobre SQLite: carga, guardado,
+ediciones por id, eliminación, tipo de colección explícito e
+importación/exportación desde CSV/JSON.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+# Los módulos de src/Modulo se importan entre sí por nombre
+MODULE_DIR = Path(__file__).resolve().parents[1] / "src" / "Modulo"
+if str(MODULE_DIR) not in sys.path:
+    sys.path.insert(0, str(MODULE_DIR))
+
+import gestor_datos_sqlite as gds  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _cerrar_conexiones() -> Iterator[None]:
+    """Cierra las conexiones abiertas por cada prueba."""
+    yield
+    gds.cerrar()
+
+
+def test_autores_upsert_conserva_orden_y_columnas(tmp_path: Path) -> None:
+    """Los autores se guardan por columnas y el upsert no cambia su posición."""
+    db = str(tmp_path / "autores.db")
+    gds.guardar_datos(db, [
+        {"id_autor": "1", "nombre_autor": "Ana", "email": "a@x.com"},
+        {"id_autor": "2", "nombre_autor": "Bob", "email": "b@x.com"},
+    ], autores=True)
+    gds.guardar_registro(db, {"id_autor": "1", "nombre_autor": "Ana María",
+                              "email": "a@x.com", "password_hash": "h"})
+    gds.anexar_registro(db, {"id_autor": "3", "nombre_autor": "Caro"})
+
+    datos = gds.cargar_datos(db)
+    assert [a["id_autor"] for a in datos] == ["1", "2", "3"]
+    assert datos[0] == {"id_autor": "1", "nombre_autor": "Ana María",
+                        "email": "a@x.com", "password_hash": "h"}
+    assert datos[2]["email"] == ""
+
+    assert gds.eliminar_registro(db, "2") is True
+    assert gds.eliminar_registro(db, "2") is False
+    assert [a["id_autor"] for a in gds.cargar_datos(db)] == ["1", "3"]
+
+
+def test_posts_como_documentos(tmp_path: Path) -> None:
+    """Los posts conservan estructuras anidadas y se actualizan por id_post."""
+    db = str(tmp_path / "posts.db")
+    gds.inicializar_archivo(db)
+    assert gds.cargar_datos(db) == []
+
+    post = {"id_post": "1", "titulo": "T", "tags": ["a"], "comentarios": []}
+    gds.anexar_registro(db, post)
+    gds.anexar_registro(db, {"id_post": "2", "titulo": "Otro"})
+    post["comentarios"].append({"id_comentario": "1", "contenido": "¡Hola!"})
+    gds.guardar_registro(db, post)
+
+    assert gds.cargar_datos(db) == [post, {"id_post": "2", "titulo": "Otro"}]
+
+
+def test_tipo_de_coleccion_explicito_y_no_por_nombre(tmp_path: Path) -> None:
+    """El tipo lo fija quien crea la base; después se toma de su tabla."""
+    db = str(tmp_path / "datos.db")
+    gds.inicializar_archivo(db, autores=True)
+    gds.anexar_registro(db, {"id_autor": "1", "nombre_autor": "Ana"})
+    assert gds.cargar_datos(db) == [{"id_autor": "1", "nombre_autor": "Ana",
+                                     "email": "", "password_hash": ""}]
+    with pytest.raises(ValueError):
+        gds.cargar_datos(db, autores=False)
+
+    # Un nombre con "autores" ya no decide el esquema
+    posts = str(tmp_path / "autores_posts.db")
+    gds.anexar_registro(posts, {"id_post": "1", "tags": ["a"]})
+    assert gds.cargar_datos(posts) == [{"id_post": "1", "tags": ["a"]}]
+
+
+def test_guardar_datos_conserva_ids_repetidos(tmp_path: Path) -> None:
+    """guardar_datos inserta tal cual; las ediciones tocan la primera fila."""
+    db = str(tmp_path / "autores.db")
+    gds.guardar_datos(db, [
+        {"id_autor": "1", "nombre_autor": "Ana"},
+        {"id_autor": "1", "nombre_autor": "Otra Ana"},
+    ], autores=True)
+    assert [a["nombre_autor"] for a in gds.cargar_datos(db)] == ["Ana", "Otra Ana"]
+    gds.guardar_registro(db, {"id_autor": "1", "nombre_autor": "Ana María"})
+    assert gds.eliminar_registro(db, "1") is True
+    assert [a["nombre_autor"] for a in gds.cargar_datos(db)] == ["Otra Ana"]
+
+    posts = str(tmp_path / "posts.db")
+    repetidos = [{"id_post": "1", "titulo": "A"}, {"id_post": "1", "titulo": "B"}]
+    gds.guardar_datos(posts, repetidos)
+    assert gds.cargar_datos(posts) == repetidos
+
+
+def test_cerrar_en_un_hilo_sin_conexiones(tmp_path: Path) -> None:
+    """cerrar(ruta) no falla en un hilo que nunca abrió la base."""
+    db = str(tmp_path / "posts.db")
+    gds.inicializar_archivo(db)
+    errores: list[BaseException] = []
+
+    def _cerrar() -> None:
+        try:
+            gds.cerrar(db)
+        except BaseException as exc:
+            errores.append(exc)
+
+    hilo = threading.Thread(target=_cerrar)
+    hilo.start()
+    hilo.join()
+    assert errores == []
+    assert gds.cargar_datos(db) == []
+
+
+def test_importar_y_exportar_desde_archivos(tmp_path: Path) -> None:
+    """La base se puede poblar desde CSV/JSON y volcar de nuevo."""
+    import gestor_datos  # noqa: PLC0415
+
+    csv_path = str(tmp_path / "autores.csv")
+    json_path = str(tmp_path / "posts.json")
+    gestor_datos.guardar_datos(csv_path, [{"id_autor": "1", "nombre_autor": "Ana"}])
+    gestor_datos.guardar_datos(json_path, [{"id_post": "1", "tags": ["x"]}])
+
+    assert gds.importar(csv_path, str(tmp_path / "autores.db")) == 1
+    assert gds.importar(json_path, str(tmp_path / "posts.db")) == 1
+
+    destino = str(tmp_path / "copia" / "posts.json")
+    assert gds.exportar(str(tmp_path / "posts.db"), destino) == 1
+    assert gestor_datos.cargar_datos(destino) == [{"id_post": "1", "tags": ["x"]}]
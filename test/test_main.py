@@ -15,6 +15,7 @@ Las pruebas usan un directorio temporal para no afectar data real.
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
 from pathlib import Path
 from typing import Any, Dict, List
@@ -80,6 +81,46 @@ def test_hash_and_verify_password_basic(main_mod: Any) -> None:
     assert main_mod._verify_password(stored, pwd)
     assert not main_mod._verify_password(stored, "otra")
 
+    # El cálculo en segundo plano produce un hash equivalente
+    en_fondo = main_mod._esperar_hash(main_mod._hash_password_async(pwd))
+    assert main_mod._verify_password(en_fondo, pwd)
+
+
+def test_hash_password_scrypt_y_formato_antiguo(main_mod: Any) -> None:
+    """
+    Los hashes nuevos usan scrypt con sus parámetros; los SHA-256 antiguos
+    ("salt$hash") se siguen verificando.
+    """
+    stored = main_mod._hash_password("secreto123", salt="00" * 16)
+    esquema, salt, n, r, p, dk = stored.split("$")
+    assert (esquema, salt) == ("scrypt", "00" * 16)
+    assert (int(n), int(r), int(p)) == (
+        main_mod.SCRYPT_N, main_mod.SCRYPT_R, main_mod.SCRYPT_P
+    )
+    assert len(dk) == main_mod.SCRYPT_DKLEN * 2
+
+    antiguo = main_mod._hash_password_sha256("clave", "abcd")
+    assert main_mod._verify_password(antiguo, "clave")
+    assert not main_mod._verify_password(antiguo, "otra")
+    assert not main_mod._verify_password("scrypt$zz$1$8$1$00", "clave")
+
+
+def test_login_migra_hashes_antiguos_al_esquema_actual(main_mod: Any) -> None:
+    """
+    Tras verificar un hash SHA-256 antiguo se guarda uno nuevo del esquema
+    actual, que ya no necesita rehash.
+    """
+    modelo = main_mod.modelo
+    autor = modelo.crear_autor(main_mod.AUTORES_CSV, "Ana", "ana@x.com")
+    autor["password_hash"] = main_mod._hash_password_sha256("clave", "abcd")
+    assert main_mod._necesita_rehash(autor["password_hash"])
+
+    main_mod._actualizar_hash_si_obsoleto(autor, "clave")
+    guardado = modelo.buscar_autor_por_id(main_mod.AUTORES_CSV, autor["id_autor"])
+    assert guardado["password_hash"] == autor["password_hash"]
+    assert not main_mod._necesita_rehash(autor["password_hash"])
+    assert main_mod._verify_password(autor["password_hash"], "clave")
+
 
 def test_verify_password_malformed_returns_false(main_mod: Any) -> None:
     """
@@ -172,7 +213,7 @@ def test_obtener_mis_posts_sin_sesion_devuelve_lista_vacia(
     """
     _obtener_mis_posts debe devolver [] si no hay sesión activa.
     """
-    main_mod.Sesion.limpiar()
+    main_mod.sesion.limpiar()
     assert main_mod._obtener_mis_posts() == []
 
 
@@ -219,7 +260,7 @@ def test_recolectar_mis_comentarios_y_mis_posts(main_mod: Any) -> None:
     ]
     gestor_datos.guardar_datos(main_mod.POSTS_JSON, posts)
 
-    main_mod.Sesion.establecer(
+    main_mod.sesion.establecer(
         {"id_autor": "99", "nombre_autor": "Test", "email": "t@test"}
     )
     try:
@@ -235,7 +276,7 @@ def test_recolectar_mis_comentarios_y_mis_posts(main_mod: Any) -> None:
         assert any(p["id_post"] == "10" for p in mis_posts)
         assert all(str(p["id_autor"]) == "99" for p in mis_posts)
     finally:
-        main_mod.Sesion.limpiar()
+        main_mod.sesion.limpiar()
 
 
 def test_nombre_autor_con_indice(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -252,6 +293,252 @@ def test_nombre_autor_con_indice(monkeypatch: pytest.MonkeyPatch) -> None:
     assert mod.nombre_autor("999") == "Autor #999"
 
 
+def test_indice_de_autores_se_reutiliza_hasta_que_cambia_el_csv(
+    main_mod: Any,
+) -> None:
+    """
+    cargar_autores_indexado devuelve el mismo índice mientras el CSV no cambie
+    y lo reconstruye tras un alta.
+    """
+    modelo = main_mod.modelo
+    a = modelo.crear_autor(main_mod.AUTORES_CSV, "Ana", "ana@x.com")
+    primero = main_mod.cargar_autores_indexado()
+    assert main_mod.cargar_autores_indexado() is primero
+
+    b = modelo.crear_autor(main_mod.AUTORES_CSV, "Beto", "beto@x.com")
+    indice = main_mod.cargar_autores_indexado()
+    assert indice is not primero
+    assert main_mod.nombre_autor(b["id_autor"]) == "Beto"
+
+    posts = [{"id_post": "1", "id_autor": a["id_autor"], "titulo": "T",
+              "fecha_publicacion": "f", "tags": [], "comentarios": []}]
+    tabla = main_mod.tabla_posts(posts)
+    assert list(tabla.columns[1].cells) == ["Ana"]
+
+
+def test_conteo_de_tags_se_recalcula_al_cambiar_posts(main_mod: Any) -> None:
+    """
+    _recolectar_tags_conteo reutiliza el conteo mientras POSTS_JSON no cambie
+    y lo recalcula tras una escritura.
+    """
+    gestor_datos.guardar_datos(main_mod.POSTS_JSON, _sample_posts_for_tags())
+    primero = main_mod._recolectar_tags_conteo()
+    assert main_mod._recolectar_tags_conteo() == primero
+
+    main_mod.modelo.crear_post(
+        main_mod.POSTS_JSON, "12", "Nuevo", "Texto", ["rust"]
+    )
+    assert ("rust", 1) in main_mod._recolectar_tags_conteo()
+
+
+def test_eliminar_comentario_ui_actualiza_la_lista_sin_recolectar(
+    main_mod: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tras eliminar, la tabla se redibuja quitando el comentario de la lista ya
+    recolectada (sin volver a recorrer todos los posts).
+    """
+    modelo = main_mod.modelo
+    post = modelo.crear_post(main_mod.POSTS_JSON, "99", "T", "C", [])
+    com = modelo.agregar_comentario_a_post(
+        main_mod.POSTS_JSON, post["id_post"], "Yo", "Hola", id_autor="99"
+    )
+    main_mod.sesion.establecer({"id_autor": "99", "nombre_autor": "Yo", "email": "y@x"})
+    llamadas = []
+    original = main_mod._recolectar_mis_comentarios
+    monkeypatch.setattr(
+        main_mod, "_recolectar_mis_comentarios",
+        lambda: llamadas.append(1) or original(),
+    )
+    monkeypatch.setattr(main_mod.Prompt, "ask", lambda *a, **k: com["id_comentario"])
+    monkeypatch.setattr(main_mod.Confirm, "ask", lambda *a, **k: True)
+    try:
+        with main_mod.console.capture() as cap:
+            main_mod.eliminar_comentario_ui()
+    finally:
+        main_mod.sesion.limpiar()
+    assert llamadas == [1]
+    assert "Ya no tienes comentarios propios" in cap.get()
+    assert modelo.listar_comentarios_de_post(
+        main_mod.POSTS_JSON, post["id_post"]
+    ) == []
+
+
+def test_actualizar_autor_ui_escapa_el_nombre(
+    main_mod: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Un nombre con sintaxis de markup se muestra tal cual y no se confunde
+    con una cancelación después de guardar.
+    """
+    autor = main_mod.modelo.crear_autor(main_mod.AUTORES_CSV, "Ana", "a@x.com")
+    main_mod.sesion.establecer(autor)
+    respuestas = iter(["[/x]", "a@x.com"])
+    monkeypatch.setattr(main_mod.Prompt, "ask", lambda *a, **k: next(respuestas))
+    try:
+        with main_mod.console.capture() as cap:
+            main_mod.actualizar_autor_ui()
+    finally:
+        main_mod.sesion.limpiar()
+    assert "Autor actualizado: [/x] <a@x.com>" in cap.get()
+    assert "cancelada" not in cap.get()
+
+
+def test_elegir_opcion_repite_hasta_valor_valido(
+    main_mod: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    respuestas = iter(["9", "", " 3 "])
+    monkeypatch.setattr(main_mod.console, "input", lambda *a, **k: next(respuestas))
+    with main_mod.console.capture() as cap:
+        opcion = main_mod._elegir_opcion(main_mod._OPCIONES_PRINCIPAL)
+    INVALIDAS = 2
+    assert opcion == "3"
+    assert cap.get().count("Elija una de las opciones") == INVALIDAS
+
+
+def test_elegir_opcion_en_terminal_usa_una_tecla(
+    main_mod: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    teclas = iter(["x", "2"])
+    monkeypatch.setattr(main_mod.sys.stdin, "isatty", lambda: True, raising=False)
+    monkeypatch.setattr(main_mod, "termios", object())
+    monkeypatch.setattr(main_mod, "_leer_tecla", lambda: next(teclas))
+    with main_mod.console.capture() as cap:
+        opcion = main_mod._elegir_opcion(main_mod._OPCIONES_PRINCIPAL)
+    assert opcion == "2"
+    assert "Opción: x" in cap.get()
+    assert "Elija una de las opciones" in cap.get()
+
+
+def test_elegir_opcion_no_hace_eco_de_teclas_de_control(
+    main_mod: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    teclas = iter(["\x1b", "\x7f", "1"])
+    monkeypatch.setattr(main_mod.sys.stdin, "isatty", lambda: True, raising=False)
+    monkeypatch.setattr(main_mod, "termios", object())
+    monkeypatch.setattr(main_mod, "_leer_tecla", lambda: next(teclas))
+    with main_mod.console.capture() as cap:
+        opcion = main_mod._elegir_opcion(main_mod._OPCIONES_PRINCIPAL)
+    salida = cap.get()
+    assert opcion == "1"
+    assert "\x1b" not in salida and "\x7f" not in salida
+    assert "Opción: 1" in salida
+
+
+class _TerminalFalsa:
+    """Sustituye a termios/tty y a sys.stdin registrando las llamadas."""
+
+    TCSADRAIN = 1
+    TCSAFLUSH = 2
+
+    def __init__(self, entrada: str) -> None:
+        self.entrada = entrada
+        self.llamadas: List[Any] = []
+
+    def fileno(self) -> int:
+        return 7
+
+    def read(self, n: int) -> str:
+        tecla, self.entrada = self.entrada[:n], self.entrada[n:]
+        return tecla
+
+    def tcgetattr(self, fd: int) -> str:
+        return "modo-previo"
+
+    def setcbreak(self, fd: int) -> None:
+        self.llamadas.append(("cbreak", fd))
+
+    def tcsetattr(self, fd: int, cuando: int, modo: str) -> None:
+        self.llamadas.append(("restaurar", fd, cuando, modo))
+
+
+def test_leer_tecla_restaura_terminal_descartando_lo_pendiente(
+    main_mod: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    terminal = _TerminalFalsa("3\n")
+    monkeypatch.setattr(main_mod, "msvcrt", None)
+    monkeypatch.setattr(main_mod, "termios", terminal)
+    monkeypatch.setattr(main_mod, "tty", terminal)
+    monkeypatch.setattr(main_mod.sys, "stdin", terminal)
+
+    assert main_mod._leer_tecla() == "3"
+    restaurar = ("restaurar", 7, terminal.TCSAFLUSH, "modo-previo")
+    assert terminal.llamadas == [("cbreak", 7), restaurar]
+
+    # Entrada cerrada: también se restaura la terminal antes de EOFError
+    terminal.entrada = ""
+    with pytest.raises(EOFError):
+        main_mod._leer_tecla()
+    assert terminal.llamadas[-1] == restaurar
+
+
+def test_main_despacha_opciones_y_sale_con_5(
+    main_mod: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    llamadas: List[str] = []
+    monkeypatch.setattr(main_mod, "onboarding_inicio", lambda: True)
+    monkeypatch.setitem(
+        main_mod._ACCIONES_PRINCIPAL, "3", lambda: llamadas.append("autores")
+    )
+    respuestas = iter(["3", "5"])
+    monkeypatch.setattr(main_mod.console, "input", lambda *a, **k: next(respuestas))
+    with main_mod.console.capture() as cap:
+        main_mod.main()
+    assert llamadas == ["autores"]
+    assert "Hasta luego" in cap.get()
+
+
+def test_main_sin_tty_no_redibuja_y_sale_al_agotar_la_entrada(
+    main_mod: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    llamadas: List[str] = []
+    monkeypatch.setattr(main_mod, "onboarding_inicio", lambda: True)
+    monkeypatch.setattr(main_mod.sys.stdin, "isatty", lambda: False, raising=False)
+    monkeypatch.setitem(
+        main_mod._ACCIONES_PRINCIPAL, "4", lambda: llamadas.append("sesion")
+    )
+    respuestas = iter(["4", "4"])
+
+    def _leer(*_a: Any, **_k: Any) -> str:
+        try:
+            return next(respuestas)
+        except StopIteration:
+            raise EOFError from None
+
+    monkeypatch.setattr(main_mod.console, "input", _leer)
+    with main_mod.console.capture() as cap:
+        main_mod.main()
+    salida = cap.get()
+    assert llamadas == ["sesion", "sesion"]
+    assert "MENÚ PRINCIPAL" not in salida
+    assert "Hasta luego" in salida
+
+
+def test_preparar_datos_solo_la_primera_vez(
+    main_mod: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    llamadas: List[str] = []
+    original = main_mod.init_archivos
+    monkeypatch.setattr(
+        main_mod, "init_archivos", lambda: llamadas.append("init") or original()
+    )
+    main_mod._preparar_datos()
+    main_mod._preparar_datos()
+    assert llamadas == ["init"]
+
+    os.remove(main_mod.POSTS_JSON)
+    main_mod._preparar_datos()
+    assert llamadas == ["init", "init"]
+    assert os.path.exists(main_mod.POSTS_JSON)
+
+
+def test_id_en_lista(main_mod: Any) -> None:
+    posts = _sample_posts_for_tags()
+    assert main_mod._id_en_lista(posts, posts[-1]["id_post"])
+    assert not main_mod._id_en_lista(posts, "999")
+    assert not main_mod._id_en_lista([], "1")
+
+
 # -------------------------
 # PRUEBAS ADICIONALES (13)
 # -------------------------
@@ -305,15 +592,17 @@ def test_render_post_twitter_no_explode_con_y_sin_comentarios(
 
 
 def test_sesion_ciclo_activa_establecer_limpiar(main_mod: Any) -> None:
-    main_mod.Sesion.limpiar()
-    assert not main_mod.Sesion.activa()
-    main_mod.Sesion.establecer(
+    main_mod.sesion.limpiar()
+    assert not main_mod.sesion.activa()
+    main_mod.sesion.establecer(
         {"id_autor": "7", "nombre_autor": "Zoe", "email": "z@x"}
     )
-    assert main_mod.Sesion.activa()
-    assert main_mod.Sesion.id_autor == "7"
-    main_mod.Sesion.limpiar()
-    assert not main_mod.Sesion.activa()
+    assert main_mod.sesion.activa()
+    assert main_mod.sesion.id_autor == "7"
+    assert "Zoe" in main_mod.sesion.descripcion
+    main_mod.sesion.limpiar()
+    assert not main_mod.sesion.activa()
+    assert main_mod.sesion.descripcion == ""
 
 
 def test_recolectar_tags_empates_orden_alfabetico(main_mod: Any) -> None:
@@ -386,7 +675,7 @@ def test_mostrar_tabla_y_detalle_mis_comentarios_no_explode(
         }
     ]
     gestor_datos.guardar_datos(main_mod.POSTS_JSON, posts)
-    main_mod.Sesion.establecer(
+    main_mod.sesion.establecer(
         {"id_autor": "88", "nombre_autor": "Yo", "email": "yo@x"}
     )
     try:
@@ -396,7 +685,7 @@ def test_mostrar_tabla_y_detalle_mis_comentarios_no_explode(
         out = cap.get()
         assert "Mis Comentarios" in out or "55" in out or "Hola" in out
     finally:
-        main_mod.Sesion.limpiar()
+        main_mod.sesion.limpiar()
 
 
 def test_ensure_sistema_y_bienvenida_crea_y_idempotente(
@@ -409,6 +698,13 @@ def test_ensure_sistema_y_bienvenida_crea_y_idempotente(
     p2 = main_mod.ensure_sistema_y_bienvenida()
     assert p1.get("id_post") == p2.get("id_post")
 
+    # Si los datos se reinician, la bienvenida recordada se vuelve a crear
+    gestor_datos.guardar_datos(main_mod.POSTS_JSON, [])
+    p3 = main_mod.ensure_sistema_y_bienvenida()
+    assert main_mod.modelo.buscar_post_por_id(
+        main_mod.POSTS_JSON, p3["id_post"]
+    ) is not None
+
     autor_sys = main_mod.modelo.buscar_autor_por_email(
         main_mod.AUTORES_CSV,
         main_mod.SISTEMA_EMAIL,